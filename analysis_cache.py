@@ -0,0 +1,135 @@
+"""分析结果缓存 - 单独的 SQLite 文件，内容寻址，按最近使用淘汰
+
+键由调用方拼出，形如 "<类别>:<描述哈希>:<配置哈希>"，值保存为 JSON。
+描述和相关配置都没变的职位直接命中；配置改动只影响键里包含该配置哈希的类别。
+每个类别（键的第一段）分别统计命中和未命中次数，跨会话累计。
+"""
+import hashlib
+import json
+import sqlite3
+from typing import Dict, Iterable, List, Tuple
+
+from config import ANALYSIS_CACHE_CONFIG
+
+# 单条语句的参数个数上限以内分批
+QUERY_BATCH = 500
+
+
+def content_hash(value) -> str:
+    """文本直接哈希，其他对象（配置字典等）按排序后的 JSON 哈希"""
+    if not isinstance(value, str):
+        value = json.dumps(value, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.blake2b(value.encode("utf-8"), digest_size=16).hexdigest()
+
+
+class AnalysisCache:
+    """有大小上限的持久化键值缓存"""
+
+    def __init__(self, path: str = None, max_bytes: int = None):
+        self.path = path or ANALYSIS_CACHE_CONFIG["path"]
+        self.max_bytes = max_bytes or ANALYSIS_CACHE_CONFIG["max_bytes"]
+        self.conn = sqlite3.connect(self.path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS entries (
+                key       TEXT PRIMARY KEY,
+                value     TEXT NOT NULL,
+                size      INTEGER NOT NULL,
+                last_used INTEGER NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_entries_last_used ON entries (last_used);
+
+            CREATE TABLE IF NOT EXISTS counters (
+                kind   TEXT PRIMARY KEY,
+                hits   INTEGER NOT NULL DEFAULT 0,
+                misses INTEGER NOT NULL DEFAULT 0
+            );
+        """)
+        self.conn.commit()
+        self.total_bytes, self.clock = self.conn.execute(
+            "SELECT COALESCE(SUM(size), 0), COALESCE(MAX(last_used), 0) FROM entries"
+        ).fetchone()
+        # 本次运行的 {类别: [命中, 未命中]}
+        self.session_counts: Dict[str, List[int]] = {}
+
+    def get_many(self, keys: List[str]) -> Dict:
+        """批量读取，返回命中的 {键: 值}，并刷新命中条目的最近使用时间"""
+        self.clock += 1
+        found = {}
+        for start in range(0, len(keys), QUERY_BATCH):
+            batch = keys[start:start + QUERY_BATCH]
+            placeholders = ", ".join("?" for _ in batch)
+            rows = self.conn.execute(
+                f"SELECT key, value FROM entries WHERE key IN ({placeholders})", batch
+            ).fetchall()
+            found.update((key, json.loads(value)) for key, value in rows)
+            if rows:
+                self.conn.execute(
+                    f"UPDATE entries SET last_used = ? WHERE key IN ({', '.join('?' for _ in rows)})",
+                    [self.clock] + [key for key, _ in rows]
+                )
+
+        counts: Dict[str, List[int]] = {}
+        for key in keys:
+            kind = key.split(":", 1)[0]
+            counts.setdefault(kind, [0, 0])[0 if key in found else 1] += 1
+        for kind, (hits, misses) in counts.items():
+            session = self.session_counts.setdefault(kind, [0, 0])
+            session[0] += hits
+            session[1] += misses
+        self.conn.executemany(
+            "INSERT INTO counters (kind, hits, misses) VALUES (?, ?, ?) ON CONFLICT(kind) DO UPDATE SET "
+            "hits = hits + excluded.hits, misses = misses + excluded.misses",
+            [(kind, hits, misses) for kind, (hits, misses) in counts.items()]
+        )
+        self.conn.commit()
+        return found
+
+    def put_many(self, items: Iterable[Tuple[str, object]]):
+        """批量写入，超出上限时淘汰最久未用的条目"""
+        self.clock += 1
+        for key, value in items:
+            value = json.dumps(value, ensure_ascii=False)
+            size = len(key) + len(value.encode("utf-8"))
+            cursor = self.conn.execute(
+                "INSERT OR IGNORE INTO entries (key, value, size, last_used) VALUES (?, ?, ?, ?)",
+                (key, value, size, self.clock)
+            )
+            self.total_bytes += size * cursor.rowcount
+        if self.total_bytes > self.max_bytes:
+            self._evict()
+        self.conn.commit()
+
+    def _evict(self):
+        """淘汰到上限的 90%，避免每次写入都触发淘汰"""
+        target = self.max_bytes * 0.9
+        while self.total_bytes > target:
+            rows = self.conn.execute(
+                "SELECT key, size FROM entries ORDER BY last_used LIMIT ?", (QUERY_BATCH,)
+            ).fetchall()
+            if not rows:
+                self.total_bytes = 0
+                break
+            freed, keys = 0, []
+            for key, size in rows:
+                if self.total_bytes - freed <= target:
+                    break
+                freed += size
+                keys.append(key)
+            self.conn.execute(f"DELETE FROM entries WHERE key IN ({', '.join('?' for _ in keys)})", keys)
+            self.total_bytes -= freed
+
+    def stats(self) -> Dict:
+        entries = self.conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+        counters = {kind: (hits, misses) for kind, hits, misses in
+                    self.conn.execute("SELECT kind, hits, misses FROM counters ORDER BY kind")}
+        return {'entries': entries, 'bytes': self.total_bytes, 'max_bytes': self.max_bytes, 'counters': counters}
+
+    def clear(self):
+        self.conn.execute("DELETE FROM entries")
+        self.conn.commit()
+        self.total_bytes = 0
+
+    def close(self):
+        self.conn.close()
@@ -0,0 +1,9 @@
+"""性能基准
+
+单项基准各自运行，例如:
+    python -m benchmarks.bench_keyword_matcher
+
+整套基准（合成职位语料，1k/10k/100k 规模，结果保存为 JSON 基线）:
+    python -m benchmarks.suite run -o benchmarks/baselines/main.json
+    python -m benchmarks.suite run --compare benchmarks/baselines/main.json
+"""
@@ -0,0 +1,99 @@
+"""职位描述压缩基准: 原文、gzip、zstd（无字典）和 zstd + 训练字典的压缩率与解压吞吐
+
+每个描述单独压缩（与职位库中按职位随机读取一致）；字典在前 train_samples 个描述上训练，
+在全部描述上测量。最后把职位写入开启/关闭压缩的职位库，比较文件大小和批量读取描述的耗时。
+
+运行: python -m benchmarks.bench_description_codec [职位数量]
+"""
+import gzip
+import os
+import random
+import sys
+import tempfile
+import time
+
+import zstandard
+
+from config import COMPRESSION_CONFIG
+from job_store import JobStore
+from benchmarks.corpus import make_jobs
+
+
+def codecs(samples):
+    """名称 -> (压缩函数, 解压函数)"""
+    level = COMPRESSION_CONFIG["level"]
+    plain = zstandard.ZstdCompressor(level=level, write_checksum=False)
+    plain_d = zstandard.ZstdDecompressor()
+    trained = zstandard.train_dictionary(COMPRESSION_CONFIG["dict_size"], samples)
+    with_dict = zstandard.ZstdCompressor(level=level, dict_data=trained, write_checksum=False)
+    with_dict_d = zstandard.ZstdDecompressor(dict_data=trained)
+    return {
+        "原文": (lambda data: data, lambda data: data),
+        "gzip": (lambda data: gzip.compress(data, 6), gzip.decompress),
+        "zstd": (plain.compress, plain_d.decompress),
+        "zstd + 字典": (with_dict.compress, with_dict_d.decompress),
+    }
+
+
+def store_size(path):
+    return sum(os.path.getsize(path + suffix) for suffix in ("", "-wal") if os.path.exists(path + suffix))
+
+
+def fill(store, jobs):
+    for job in jobs:
+        store.add_job({key: value for key, value in job.items() if key not in ('language', 'is_html')})
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    jobs = make_jobs(count)
+    texts = [job['description'].encode("utf-8") for job in jobs]
+    raw = sum(len(text) for text in texts)
+    print(f"📊 {count} 个描述 | {raw / 1024 / 1024:.1f} MB | 平均 {raw / count:.0f} B")
+
+    print(f"   {'方式':<12}{'大小 MB':>9}{'压缩率':>8}{'压缩 s':>9}{'批量解压 MB/s':>16}{'随机读取 µs':>14}")
+    picks = random.Random(1).sample(range(count), min(count, 2000))
+    for name, (compress, decompress) in codecs(texts[:COMPRESSION_CONFIG["train_samples"]]).items():
+        start = time.perf_counter()
+        frames = [compress(text) for text in texts]
+        compress_time = time.perf_counter() - start
+        size = sum(len(frame) for frame in frames)
+
+        start = time.perf_counter()
+        for frame in frames:
+            decompress(frame)
+        throughput = raw / (time.perf_counter() - start) / 1024 / 1024
+
+        start = time.perf_counter()
+        for i in picks:
+            decompress(frames[i])
+        random_us = (time.perf_counter() - start) / len(picks) * 1e6
+        print(f"   {name:<12}{size / 1024 / 1024:>9.2f}{size / raw:>8.1%}{compress_time:>9.2f}"
+              f"{throughput:>16.0f}{random_us:>14.1f}")
+
+    # 职位库: 入库时压缩（自动训练字典） vs 原文
+    print("   职位库:")
+    enabled = COMPRESSION_CONFIG["enabled"]
+    with tempfile.TemporaryDirectory() as directory:
+        for compress in (False, True):
+            COMPRESSION_CONFIG["enabled"] = compress
+            path = os.path.join(directory, f"jobs_{compress}.db")
+            store = JobStore(path)
+            start = time.perf_counter()
+            fill(store, jobs)
+            fill_time = time.perf_counter() - start
+            store.conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+            start = time.perf_counter()
+            total = sum(len(description) for _, description in store.iter_descriptions())
+            read_time = time.perf_counter() - start
+            dicts = len(store.codec.dicts) - 1 if store.codec is not None else 0
+            store.close()
+            label = f"压缩（{dicts} 个字典）" if compress else "原文"
+            print(f"   {label:<14} 文件 {store_size(path) / 1024 / 1024:7.2f} MB | 入库 {fill_time:6.2f}s | "
+                  f"批量读取描述 {read_time:6.3f}s ({total / read_time / 1024 / 1024:.0f} M 字符/s)")
+    COMPRESSION_CONFIG["enabled"] = enabled
+
+
+if __name__ == "__main__":
+    main()
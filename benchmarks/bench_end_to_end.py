@@ -0,0 +1,96 @@
+"""端到端爬取基准: 无头浏览器爬取本地测试职位板，测量每个职位的提取开销并核对提取结果
+
+不需要登录，也不访问真实站点。需要本机安装 Chrome。
+选择器改动后运行一次，提取结果与测试职位板不一致的职位会逐个列出。
+
+运行: python -m benchmarks.bench_end_to_end [职位数量] [--latency-ms 详情面板延迟] [-o 结果.json]
+"""
+import argparse
+import json
+import os
+import platform
+import tempfile
+import time
+
+from config import OFFLINE_CONFIG
+from job_store import normalize_job_id
+from benchmarks.fixture_board import FixtureBoard
+from benchmarks.suite import BASELINE_DIR, git_revision
+
+FIELDS = ('title', 'company', 'location')
+
+
+def check_jobs(board: FixtureBoard, store) -> list:
+    """职位库中的职位与测试职位板逐字段比较，返回 (职位ID, 字段, 期望, 实际)
+
+    按提取到的职位链接中的ID对应测试职位板的职位。
+    """
+    mismatches = []
+    for extracted in store.query_jobs().to_dict('records'):
+        job_id = normalize_job_id(extracted['job_url'])
+        job = board.jobs_by_id.get(job_id)
+        if job is None:
+            mismatches.append((job_id, 'job_url', '', extracted['job_url']))
+            continue
+        for field in FIELDS:
+            if extracted[field] != job[field]:
+                mismatches.append((job['job_id'], field, job[field], extracted[field]))
+    return mismatches
+
+
+def main():
+    parser = argparse.ArgumentParser(description="端到端爬取基准（本地测试职位板）")
+    parser.add_argument("count", type=int, nargs="?", default=50, help="职位数量")
+    parser.add_argument("--latency-ms", type=float, default=0, help="详情面板请求的延迟（毫秒）")
+    parser.add_argument("-o", "--output", help="结果文件，默认 baselines/end_to_end_<时间>.json")
+    args = parser.parse_args()
+
+    from main import ConservativeLinkedInScraper
+
+    with FixtureBoard(args.count, latency=args.latency_ms / 1000) as board, \
+            tempfile.TemporaryDirectory() as workdir:
+        OFFLINE_CONFIG.update(enabled=True, search_url=board.search_url, max_jobs_per_session=args.count)
+        scraper = ConservativeLinkedInScraper(os.path.join(workdir, "jobs.db"))
+        try:
+            scraper.setup_driver()
+            start = time.perf_counter()
+            scraper.scrape_jobs()
+            elapsed = time.perf_counter() - start
+            mismatches = check_jobs(board, scraper.store)
+        finally:
+            scraper.close()
+
+    saved = scraper.saved_count
+    skipped = scraper.card_filter.skipped if scraper.card_filter is not None else 0
+    print(f"\n📊 {saved}/{args.count} 个职位（预筛选跳过 {skipped}） | {elapsed:.2f}s | "
+          f"{elapsed / max(saved, 1) * 1000:.1f} ms/职位 | 详情延迟 {args.latency_ms:.0f} ms")
+    if mismatches:
+        print(f"❌ {len(mismatches)} 处提取结果与测试职位板不一致:")
+        for job_id, field, expected, actual in mismatches[:20]:
+            print(f"   {job_id} {field}: 期望 {expected!r}，实际 {actual!r}")
+    else:
+        print("✅ 所有职位的标题、公司和地点都与测试职位板一致")
+
+    results = {
+        'created': time.strftime('%Y-%m-%d %H:%M:%S'),
+        'git': git_revision(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'jobs': args.count,
+        'latency_ms': args.latency_ms,
+        'saved': saved,
+        'skipped': skipped,
+        'seconds': elapsed,
+        'per_job_ms': elapsed / max(saved, 1) * 1000,
+        'mismatches': len(mismatches),
+    }
+    output = args.output or os.path.join(BASELINE_DIR, f"end_to_end_{time.strftime('%Y%m%d_%H%M%S')}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(results, f, ensure_ascii=False, indent=2)
+        f.write("\n")
+    print(f"💾 结果已保存: {output}")
+
+
+if __name__ == "__main__":
+    main()
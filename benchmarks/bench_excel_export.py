@@ -0,0 +1,67 @@
+"""Excel 导出基准: 已累积 N 行时，整本重写与滚动追加的耗时和内存
+
+运行: python -m benchmarks.bench_excel_export [已有行数] [每次新增行数]
+"""
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import pandas as pd
+
+from benchmarks.bench_keyword_matcher import make_descriptions
+from excel_export import append_rows
+
+
+def make_jobs(count, offset=0):
+    descriptions = [text[:300] for text in make_descriptions(count, seed=offset)]
+    return pd.DataFrame({
+        'title': [f"Software Engineer {offset + i}" for i in range(count)],
+        'company': [f"Company {i % 500}" for i in range(count)],
+        'location': "Berlin",
+        'work_arrangement': ["hybrid", "on-site"] * (count // 2) + ["hybrid"] * (count % 2),
+        'is_english': True,
+        'english_score': 0.85,
+        'job_url': [f"https://www.linkedin.com/jobs/view/{offset + i}/" for i in range(count)],
+        'scraped_at': "2026-01-01 10:00:00",
+        'description': descriptions,
+    })
+
+
+def measure(func):
+    tracemalloc.start()
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / 1024 / 1024
+
+
+def main():
+    existing = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    new = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+
+    history = make_jobs(existing)
+    batch = make_jobs(new, offset=existing)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        rolling = os.path.join(tmp, "rolling.xlsx")
+        full = os.path.join(tmp, "full.xlsx")
+        append_rows(rolling, {'All Jobs': history})
+
+        def rewrite():
+            with pd.ExcelWriter(full, engine='openpyxl') as writer:
+                pd.concat([history, batch]).to_excel(writer, sheet_name='All Jobs', index=False)
+
+        rewrite_time, rewrite_peak = measure(rewrite)
+        append_time, append_peak = measure(lambda: append_rows(rolling, {'All Jobs': batch}))
+
+    print(f"📊 已有 {existing} 行, 新增 {new} 行")
+    print(f"   整本重写 (pandas + openpyxl): {rewrite_time:7.2f}s  峰值内存 {rewrite_peak:8.1f} MB")
+    print(f"   滚动追加 (流式读写)        : {append_time:7.2f}s  峰值内存 {append_peak:8.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
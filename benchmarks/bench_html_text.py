@@ -0,0 +1,62 @@
+"""HTML 转文本基准: 各后端每个描述的耗时 (µs)，以及与 BeautifulSoup 结果的差异
+
+运行: python -m benchmarks.bench_html_text [职位库.db / 导出的 xlsx/csv ...]
+不指定文件时使用合成的 HTML 描述。
+"""
+import random
+import sys
+import time
+
+from benchmarks.bench_keyword_matcher import make_descriptions
+from html_text import BACKENDS, available_backends, html_to_text
+
+TEMPLATES = [
+    "<p>%s</p>", "<li>%s</li>", "<div><strong>%s</strong></div>", "%s<br>",
+    "<span>%s &amp; more</span>", "<!-- note -->%s", "<script>var a = 1;</script>%s",
+    "<p>&nbsp;%s &euro; 60k</p>", "<ul><li>%s</ul>", "<style>p {}</style><h2>%s</h2>",
+]
+
+
+def make_html_descriptions(count, seed=7):
+    """把合成描述包装成 LinkedIn 风格的 HTML 片段"""
+    rng = random.Random(seed)
+    corpus = []
+    for text in make_descriptions(count, seed=seed):
+        words = text.split()
+        blocks = [rng.choice(TEMPLATES) % " ".join(words[i:i + 20]) for i in range(0, len(words), 20)]
+        corpus.append("\n".join(blocks))
+    return corpus
+
+
+def load_corpus(paths):
+    from reanalyze import load_saved_jobs
+    return [text for text in load_saved_jobs(paths)['description'] if text]
+
+
+def main():
+    corpus = load_corpus(sys.argv[1:]) if len(sys.argv) > 1 else make_html_descriptions(2000)
+    reference = [" ".join(BACKENDS["bs4"](text).split()) for text in corpus]
+    print(f"📊 {len(corpus)} 个描述")
+
+    for name in available_backends():
+        start = time.perf_counter()
+        output = [html_to_text(text, name) for text in corpus]
+        elapsed = time.perf_counter() - start
+        mismatches = sum(1 for got, expected in zip(output, reference) if got != expected)
+        print(f"   {name:<10} {elapsed / len(corpus) * 1e6:8.1f} µs/描述 | 与 bs4 不一致: {mismatches}")
+
+    # 爬取时保存的是 .text 纯文本，直接跳过解析
+    plain = make_descriptions(len(corpus))
+    start = time.perf_counter()
+    for text in plain:
+        BACKENDS["bs4"](text)
+    bs4_time = time.perf_counter() - start
+    start = time.perf_counter()
+    for text in plain:
+        html_to_text(text)
+    plain_time = time.perf_counter() - start
+    print(f"   纯文本描述: bs4 {bs4_time / len(plain) * 1e6:.1f} µs | html_to_text {plain_time / len(plain) * 1e6:.1f} µs")
+
+
+if __name__ == "__main__":
+    main()
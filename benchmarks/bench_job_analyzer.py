@@ -0,0 +1,75 @@
+"""JobAnalyzer 评分: 回归语料校验 + 逐个/批量/多进程吞吐量
+
+analyzer_corpus.json 中每个用例是一段描述和固定标准下的预期结果，
+评分规则有意改变时用 --update 重新生成预期结果并检查差异。
+
+运行: python -m benchmarks.bench_job_analyzer [描述数] [--update]
+"""
+import json
+import os
+import sys
+import time
+
+from job_analyzer import JobAnalyzer
+from benchmarks.bench_keyword_matcher import make_descriptions
+
+CORPUS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "analyzer_corpus.json")
+
+
+def check_corpus(update=False):
+    """逐个用例与批量评分都要等于预期结果，返回不一致的用例名"""
+    with open(CORPUS_PATH, encoding="utf-8") as f:
+        corpus = json.load(f)
+
+    failures = []
+    for case in corpus["cases"]:
+        analyzer = JobAnalyzer(dict(corpus["criteria"], **case["criteria"]))
+        result = analyzer.analyze_job_description(case["description"])
+        if update:
+            case["expected"] = result
+        elif result != case["expected"] or analyzer.analyze_batch([case["description"]] * 3) != [result] * 3:
+            failures.append(case["name"])
+            print(f"   ❌ {case['name']}: {result}")
+
+    if update:
+        with open(CORPUS_PATH, "w", encoding="utf-8") as f:
+            json.dump(corpus, f, ensure_ascii=False, indent=2)
+            f.write("\n")
+        print(f"📝 已更新 {len(corpus['cases'])} 个用例的预期结果")
+    else:
+        print(f"🧪 回归语料 {len(corpus['cases']) - len(failures)}/{len(corpus['cases'])} 通过")
+    return failures
+
+
+def main():
+    args = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
+    failures = check_corpus(update="--update" in sys.argv)
+    if failures:
+        sys.exit(1)
+
+    from config import ANALYSIS_CRITERIA
+
+    count = int(args[0]) if args else 5000
+    descriptions = make_descriptions(count)
+    analyzer = JobAnalyzer(ANALYSIS_CRITERIA)
+
+    start = time.perf_counter()
+    single = [analyzer.analyze_job_description(text) for text in descriptions]
+    single_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batch = list(analyzer.analyze_many(descriptions, workers=1))
+    batch_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    parallel = list(analyzer.analyze_many(descriptions))
+    parallel_time = time.perf_counter() - start
+
+    assert single == batch == parallel, "逐个、批量与多进程结果不一致"
+    print(f"📊 {count} 个职位描述")
+    for label, seconds in [("逐个", single_time), ("批量", batch_time), (f"多进程({os.cpu_count()})", parallel_time)]:
+        print(f"   {label:<10} {seconds:7.3f}s | {count / seconds:8.0f} 个/秒")
+
+
+if __name__ == "__main__":
+    main()
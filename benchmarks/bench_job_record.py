@@ -0,0 +1,75 @@
+"""职位记录内存基准: 职位字典列表与 JobRecord 列表的内存占用和转换 DataFrame 的耗时
+
+运行: python -m benchmarks.bench_job_record [职位数量]
+"""
+import gc
+import random
+import sys
+import time
+import tracemalloc
+
+import pandas as pd
+
+from job_record import JobRecord, records_to_frame
+from benchmarks.bench_keyword_matcher import make_descriptions
+from benchmarks.corpus import ARRANGEMENTS, COMPANIES, LOCATIONS, TITLES
+
+
+def scraped_jobs(count, seed=42):
+    """模拟爬取得到的职位字典：每个字符串都是新对象（与从页面 .text 取得的一样）"""
+    rng = random.Random(seed)
+    descriptions = make_descriptions(500, seed)
+    for i in range(count):
+        yield {
+            'title': "".join(rng.choice(TITLES)),
+            'company': "".join([rng.choice(COMPANIES), ""]),
+            'location': "".join([rng.choice(LOCATIONS), ""]),
+            'description': f"{rng.choice(descriptions)} ref {i}",
+            'job_url': f"https://www.linkedin.com/jobs/view/{3800000000 + i}/",
+            'scraped_at': f"2024-{rng.randint(1, 6):02d}-{rng.randint(1, 28):02d} "
+                          f"{rng.randint(0, 23):02d}:{rng.randint(0, 59):02d}:00",
+            'job_id': str(3800000000 + i),
+            'english_score': round(rng.random(), 2),
+            'is_english': rng.random() < 0.7,
+            'work_arrangement': "".join([rng.choice(ARRANGEMENTS), ""]),
+        }
+
+
+def measure(build):
+    """build() 的结果保留在内存中时占用的字节数"""
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, size
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    print(f"📊 {count} 个职位")
+
+    rows = []
+    for label, build in [
+        ("字典", lambda: list(scraped_jobs(count))),
+        ("JobRecord", lambda: [JobRecord.from_dict(job) for job in scraped_jobs(count)]),
+        ("JobRecord 无描述", lambda: [JobRecord.from_dict(job, with_description=False) for job in scraped_jobs(count)]),
+    ]:
+        jobs, size = measure(build)
+        start = time.perf_counter()
+        if label == "字典":
+            frame = pd.DataFrame(jobs)
+        else:
+            frame = records_to_frame(jobs)
+        frame_time = time.perf_counter() - start
+        rows.append((label, size, frame_time, frame.memory_usage(deep=True).sum()))
+        del jobs, frame
+
+    baseline = rows[0][1]
+    for label, size, frame_time, frame_size in rows:
+        print(f"   {label:<16} {size / 1024 / 1024:8.1f} MB ({size / baseline:5.1%}) | "
+              f"{size / count:6.0f} B/职位 | DataFrame {frame_time:6.3f}s, {frame_size / 1024 / 1024:7.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""关键词匹配微基准: 逐词 re.search 与 KeywordMatcher 一次扫描对比
+
+运行: python -m benchmarks.bench_keyword_matcher [职位数量]
+"""
+import random
+import re
+import sys
+import time
+
+from config import ENGLISH_DETECTION
+from keyword_matcher import get_matcher
+
+SKILLS = ["Python", "Java", "JavaScript", "Kubernetes", "Docker", "SQL", "AWS", "React", "Machine Learning"]
+
+FILLER = (
+    "we are looking for a motivated engineer to join our growing team in berlin . "
+    "wir suchen eine engagierte entwicklerin für unser team in münchen . "
+    "you will work on cloud infrastructure , data pipelines and customer facing products . "
+    "flexible working hours , 30 days of vacation and a modern office . "
+).split()
+
+
+def make_descriptions(count, seed=42):
+    """生成确定性的合成职位描述"""
+    rng = random.Random(seed)
+    vocabulary = FILLER + ENGLISH_DETECTION["required_keywords"] + SKILLS
+    return [" ".join(rng.choice(vocabulary) for _ in range(rng.randint(150, 400))) for _ in range(count)]
+
+
+def naive_scan(text, keywords):
+    """原实现: 每个关键词单独 lower + re.search"""
+    return [kw for kw in keywords if re.search(r'\b' + re.escape(kw.lower()) + r'\b', text.lower())]
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    descriptions = make_descriptions(count)
+    english_keywords = ENGLISH_DETECTION["required_keywords"]
+
+    start = time.perf_counter()
+    naive = [(naive_scan(text, english_keywords), naive_scan(text, SKILLS)) for text in descriptions]
+    naive_time = time.perf_counter() - start
+
+    matcher = get_matcher(english=english_keywords, skills=SKILLS)
+    start = time.perf_counter()
+    fast = []
+    for text in descriptions:
+        matched = matcher.scan(text)
+        fast.append((matched["english"], matched["skills"]))
+    fast_time = time.perf_counter() - start
+
+    assert naive == fast, "匹配结果不一致"
+
+    print(f"📊 {count} 个职位描述, {len(english_keywords)} 个英文关键词 + {len(SKILLS)} 个技能")
+    print(f"   逐词 re.search : {naive_time:.3f}s ({naive_time / count * 1e6:.1f} µs/职位)")
+    print(f"   KeywordMatcher : {fast_time:.3f}s ({fast_time / count * 1e6:.1f} µs/职位)")
+    print(f"   加速比: {naive_time / fast_time:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""英文检测: 关键词比例与 n-gram 语言识别（逐个/批量）的耗时对比
+
+运行: python -m benchmarks.bench_language_id [描述数]
+"""
+import sys
+import time
+
+import numpy as np
+
+from config import ENGLISH_DETECTION
+from keyword_matcher import get_matcher
+from language_id import get_identifier
+from benchmarks.bench_keyword_matcher import make_descriptions
+
+
+def keyword_scores(descriptions):
+    keywords = ENGLISH_DETECTION["required_keywords"]
+    matcher = get_matcher(english=keywords)
+    return [len(matcher.scan(text)["english"]) / len(keywords) for text in descriptions]
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    descriptions = make_descriptions(count)
+    average_length = sum(map(len, descriptions)) / count
+
+    start = time.perf_counter()
+    identifier = get_identifier()
+    print(f"📦 构建概率表 {time.perf_counter() - start:.3f}s | {count} 个描述, 平均 {average_length:.0f} 字符")
+
+    start = time.perf_counter()
+    keyword_scores(descriptions)
+    keyword_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    single = np.array([identifier.share(text) for text in descriptions])
+    single_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batch = identifier.share_many(descriptions)
+    batch_time = time.perf_counter() - start
+
+    assert np.array_equal(single, batch), "逐个与批量结果不一致"
+    for label, seconds in [("关键词比例", keyword_time), ("n-gram 逐个", single_time), ("n-gram 批量", batch_time)]:
+        print(f"   {label:<12} {seconds:7.3f}s | 每个描述 {seconds / count * 1e6:7.1f}µs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""全文检索基准: FTS5 索引构建耗时和查询延迟，对比读入 pandas 后 str.contains
+
+运行: python -m benchmarks.bench_search [职位数量]
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+
+from job_search import SearchIndex
+from job_store import JobStore
+from benchmarks.bench_keyword_matcher import make_descriptions
+from benchmarks.corpus import ARRANGEMENTS, COMPANIES, LOCATIONS, TITLES
+EXTRAS = ["visa sponsorship available", "kotlin and spring boot", "relocation package", ""]
+
+QUERIES = [
+    ("kotlin \"visa sponsorship\"", {"location": "Munich", "work_arrangement": "hybrid"}),
+    ("python", {}),                       # 合成描述里几乎每个职位都有，最坏情况
+    ("\"data pipelines\" kubernetes", {"is_english": True, "since": "2024-03-01"}),
+    ("reloc*", {"location": "Berlin"}),
+]
+
+
+def fill_store(store, count, seed=42):
+    rng = random.Random(seed)
+    for i, description in enumerate(make_descriptions(count, seed)):
+        store.conn.execute(
+            "INSERT INTO jobs (job_id, title, company, location, work_arrangement, is_english, "
+            "english_score, job_url, scraped_at, description) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (str(i), rng.choice(TITLES), rng.choice(COMPANIES), rng.choice(LOCATIONS), rng.choice(ARRANGEMENTS),
+             rng.random() < 0.7, 0.0, f"https://www.linkedin.com/jobs/view/{i}/",
+             f"2024-{rng.randint(1, 6):02d}-{rng.randint(1, 28):02d} 12:00:00",
+             description + " " + rng.choice(EXTRAS))
+        )
+    store.conn.commit()
+
+
+def contains_baseline(store, query, filters):
+    """原做法: 全部读入 DataFrame 后逐词 str.contains"""
+    df = store.query_jobs()
+    text = df['title'] + " " + df['company'] + " " + df['description']
+    mask = df['duplicate_of'].isna()
+    for term in query.replace('"', '').replace('*', '').split():
+        mask &= text.str.contains(term, case=False, regex=False)
+    if "location" in filters:
+        mask &= df['location'].str.contains(filters["location"], case=False, regex=False)
+    if "work_arrangement" in filters:
+        mask &= df['work_arrangement'] == filters["work_arrangement"]
+    return df[mask]
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    with tempfile.TemporaryDirectory() as directory:
+        store = JobStore(os.path.join(directory, "jobs.db"))
+        fill_store(store, count)
+        index = SearchIndex(store)
+
+        start = time.perf_counter()
+        index.index_new()
+        index_time = time.perf_counter() - start
+        print(f"📊 {count} 个职位 | 建索引 {index_time:.2f}s ({index_time / count * 1e6:.0f} µs/职位)")
+
+        for query, filters in QUERIES:
+            timings = []
+            for _ in range(5):
+                start = time.perf_counter()
+                results = index.search(query, **filters)
+                timings.append(time.perf_counter() - start)
+            print(f"   {query:<32} {sorted(timings)[2] * 1000:7.2f}ms | {len(results)} 个结果 | {filters}")
+
+        query, filters = QUERIES[0]
+        start = time.perf_counter()
+        baseline = contains_baseline(store, query, filters)
+        print(f"   pandas str.contains            {(time.perf_counter() - start) * 1000:7.0f}ms | "
+              f"{len(baseline)} 个匹配（未排序）")
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""启动耗时: 用 python -X importtime 测量各入口的导入时间和命令行启动时间
+
+运行: python -m benchmarks.bench_startup [重复次数]
+"""
+import os
+import re
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# (说明, 导入的模块)
+MODULES = [
+    ("命令行入口", "cli"),
+    ("关键词分析", "job_analyzer"),
+    ("职位库", "job_store"),
+    ("离线重新分析", "reanalyze"),
+    ("爬虫主程序", "main"),
+]
+COMMANDS = [
+    ("cli.py --help", ["cli.py", "--help"]),
+    ("cli.py stats", ["cli.py", "stats", "--db", os.devnull + ".db"]),
+]
+
+IMPORT_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|(\s+)(\S+)")
+
+
+def _importtime_lines(code):
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", code],
+                            cwd=ROOT, capture_output=True, text=True)
+    return result.stderr.splitlines()
+
+
+def interpreter_modules():
+    """解释器启动时（site 等）就会导入的模块，不计入各入口"""
+    return {match.group(4).split(".")[0] for match in map(IMPORT_LINE.match, _importtime_lines("pass")) if match}
+
+
+def import_times(module, baseline=()):
+    """一次 -X importtime 运行: 返回 (总导入微秒, {顶层依赖: 累计微秒})"""
+    total = 0
+    packages = {}
+    for line in _importtime_lines(f"import {module}"):
+        match = IMPORT_LINE.match(line)
+        if not match:
+            continue
+        cumulative, depth, name = int(match.group(2)), len(match.group(3)), match.group(4)
+        if name == module and depth == 1:
+            total = cumulative
+        # 被目标模块直接或间接引入的包，按顶层包名取最大累计值
+        top = name.split(".")[0]
+        packages[top] = max(packages.get(top, 0), cumulative)
+    for name in (module, *baseline):
+        packages.pop(name, None)
+    return total, packages
+
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+
+    baseline = interpreter_modules()
+    print("📦 导入耗时 (取最小值, 毫秒):")
+    for label, module in MODULES:
+        runs = [import_times(module, baseline) for _ in range(repeat)]
+        total, packages = min(runs, key=lambda run: run[0])
+        heaviest = sorted(packages.items(), key=lambda item: -item[1])[:3]
+        details = ", ".join(f"{name} {micros / 1000:.0f}" for name, micros in heaviest)
+        print(f"   {label:<10} {module:<14} {total / 1000:8.1f}   ({details})")
+
+    print("🚀 命令启动耗时 (取最小值, 毫秒):")
+    for label, command in COMMANDS:
+        durations = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            subprocess.run([sys.executable, *command], cwd=ROOT, capture_output=True)
+            durations.append(time.perf_counter() - start)
+        print(f"   {label:<24} {min(durations) * 1000:8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""英文评分/工作类型: 逐行 enrich_job 与整表 enrich_frame 对比
+
+运行: python -m benchmarks.bench_vectorized_filters [行数 ...]
+"""
+import sys
+import time
+
+import pandas as pd
+
+import job_filters
+from benchmarks.bench_keyword_matcher import make_descriptions
+
+LOCATIONS = ["Berlin, Germany", "Munich (Hybrid)", "Frankfurt (On-site)", "Leipzig", "Düsseldorf (Remote)"]
+
+
+def make_frame(count):
+    descriptions = make_descriptions(count)
+    return pd.DataFrame({
+        'description': descriptions,
+        'location': [LOCATIONS[i % len(LOCATIONS)] for i in range(count)],
+    })
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or [1000, 10000, 100000]
+    columns = ['english_score', 'is_english', 'work_arrangement']
+
+    for count in sizes:
+        df = make_frame(count)
+
+        start = time.perf_counter()
+        rowwise = pd.DataFrame([job_filters.enrich_job(job) for job in df.to_dict('records')])
+        rowwise_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        vectorized = job_filters.enrich_frame(df)
+        vectorized_time = time.perf_counter() - start
+
+        for column in columns:
+            assert rowwise[column].tolist() == vectorized[column].tolist(), f"{column} 结果不一致"
+
+        print(f"📊 {count:>7} 行 | 逐行 {rowwise_time:7.3f}s | 整表 {vectorized_time:7.3f}s "
+              f"| 加速比 {rowwise_time / vectorized_time:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+"""确定性的合成职位语料 - 英文、德文和英德双语描述，部分为 LinkedIn 风格 HTML
+
+同样的 (数量, 种子) 总是生成完全相同的职位，基准结果在不同版本之间可以直接比较。
+描述由各语言的句子模板拼成：公司介绍、职责、要求（技能）、福利，
+按比例加上薪资、签证担保说法和双语段落。
+"""
+import random
+from functools import lru_cache
+from typing import Dict, List
+
+TITLES = ["Backend Engineer", "Kotlin Developer", "Data Scientist", "DevOps Engineer", "Frontend Developer"]
+COMPANIES = ["Acme GmbH", "Globex", "Initech", "Umbrella AG", "Hooli"]
+LOCATIONS = ["Berlin, Germany", "Munich, Bavaria, Germany", "Hamburg, Germany", "Frankfurt, Hesse, Germany"]
+ARRANGEMENTS = ["hybrid", "on-site", "remote", "unknown"]
+SKILLS = [
+    "Python", "Java", "JavaScript", "TypeScript", "SQL", "Docker", "Kubernetes", "k8s", "AWS",
+    "Git", "Linux", "Kotlin", "React", "Terraform", "PostgreSQL", "Kafka", "Spark", "Go", "Scala",
+]
+DOMAINS = ["payments", "logistics", "mobility", "healthcare", "e-commerce", "energy", "insurance", "media"]
+
+SENTENCES = {
+    "en": {
+        "intro": [
+            "We are a fast-growing {domain} company based in {city}.",
+            "Join our {domain} platform team and help millions of customers every day.",
+            "At {company} we build software that makes {domain} simple.",
+        ],
+        "tasks": [
+            "Design, build and operate scalable backend services.",
+            "Work closely with product managers and designers on new features.",
+            "Own the development lifecycle from planning to production.",
+            "Improve the reliability and performance of our data pipelines.",
+            "Mentor junior engineers and take part in code reviews.",
+        ],
+        "requirements": [
+            "You have {years}+ years of experience with {skill} and {skill2}.",
+            "Strong skills in {skill} are required; experience with {skill2} is a plus.",
+            "Hands-on experience with {skill}, {skill2} and {skill3} in production.",
+        ],
+        "benefits": [
+            "Flexible working hours and a hybrid setup with two office days.",
+            "30 days of vacation and a yearly learning budget.",
+            "A modern office in the city centre with great public transport access.",
+        ],
+        "salary": ["Salary range: {low}.000 - {high}.000 EUR per year.", "We offer {low}k - {high}k plus bonus."],
+        "visa": ["We offer visa sponsorship and relocation support.", "Unfortunately we cannot offer visa sponsorship."],
+    },
+    "de": {
+        "intro": [
+            "Wir sind ein schnell wachsendes Unternehmen im Bereich {domain} mit Sitz in {city}.",
+            "Verstärke unser Team und gestalte die Zukunft von {domain} mit.",
+            "Bei {company} entwickeln wir Software, die {domain} einfacher macht.",
+        ],
+        "tasks": [
+            "Du entwirfst, entwickelst und betreibst skalierbare Backend-Dienste.",
+            "Du arbeitest eng mit Produktmanagern und Designern zusammen.",
+            "Du verantwortest den gesamten Entwicklungsprozess bis zum Betrieb.",
+            "Du verbesserst die Zuverlässigkeit unserer Datenverarbeitung.",
+        ],
+        "requirements": [
+            "Du hast mindestens {years} Jahre Erfahrung mit {skill} und {skill2}.",
+            "Sehr gute Kenntnisse in {skill} setzen wir voraus, {skill2} ist von Vorteil.",
+            "Fließende Deutschkenntnisse und praktische Erfahrung mit {skill}.",
+        ],
+        "benefits": [
+            "Flexible Arbeitszeiten und die Möglichkeit zum mobilen Arbeiten.",
+            "30 Tage Urlaub, betriebliche Altersvorsorge und ein Jobticket.",
+            "Ein modernes Büro mitten in der Stadt.",
+        ],
+        "salary": ["Das Bruttojahresgehalt liegt zwischen {low}.000 und {high}.000 Euro.", "Gehalt: ab {low}k €."],
+        "visa": ["Wir unterstützen dich beim Visum und der Blauen Karte.", "Leider können wir kein Visum-Sponsoring anbieten."],
+    },
+}
+
+# 语言比例: 英文 / 德文 / 英德混合
+LANGUAGE_WEIGHTS = {"en": 0.6, "de": 0.25, "mixed": 0.15}
+HTML_SHARE = 0.3
+
+
+def _paragraph(rng: random.Random, language: str, section: str, count: int, fields: Dict) -> List[str]:
+    choices = SENTENCES[language][section]
+    lines = []
+    # 同一段内不重复同一句
+    for template in rng.sample(choices, min(count, len(choices))):
+        skills = rng.sample(SKILLS, 3)
+        lines.append(template.format(
+            skill=skills[0], skill2=skills[1], skill3=skills[2], years=rng.randint(2, 8), **fields))
+    return lines
+
+
+def make_description(rng: random.Random, language: str, fields: Dict) -> List[List[str]]:
+    """按段落返回描述（每段若干句），混合描述为英文段落接一个德文段落"""
+    languages = ["en", "de"] if language == "mixed" else [language]
+    sections = []
+    for current in languages:
+        sections.append(_paragraph(rng, current, "intro", 1, fields))
+        sections.append(_paragraph(rng, current, "tasks", rng.randint(3, 5), fields))
+        sections.append(_paragraph(rng, current, "requirements", rng.randint(2, 4), fields))
+        sections.append(_paragraph(rng, current, "benefits", rng.randint(1, 3), fields))
+        extras = []
+        if rng.random() < 0.4:
+            low = rng.randint(50, 80)
+            extras += _paragraph(rng, current, "salary", 1, dict(fields, low=low, high=low + rng.randint(10, 25)))
+        if rng.random() < 0.3:
+            extras += _paragraph(rng, current, "visa", 1, fields)
+        if extras:
+            sections.append(extras)
+    return sections
+
+
+def to_text(sections: List[List[str]]) -> str:
+    """爬取时 .text 得到的纯文本"""
+    return "\n".join(" ".join(lines) for lines in sections)
+
+
+def to_html(sections: List[List[str]], rng: random.Random) -> str:
+    """LinkedIn 详情面板风格的 HTML：段落、列表、加粗标题和实体"""
+    parts = []
+    for lines in sections:
+        lines = [line.replace("&", "&amp;") for line in lines]
+        if len(lines) > 2 and rng.random() < 0.7:
+            items = "".join(f"<li>{line}</li>" for line in lines[1:])
+            parts.append(f"<p><strong>{lines[0]}</strong></p><ul>{items}</ul>")
+        else:
+            parts.append(f"<p>{' '.join(lines)}<br></p>")
+    if rng.random() < 0.2:
+        parts.append("<!-- tracking --><span>&nbsp;</span>")
+    return f'<div class="jobs-description__content">{"".join(parts)}</div>'
+
+
+@lru_cache(maxsize=8)
+def _make_jobs(count: int, seed: int) -> tuple:
+    rng = random.Random(seed)
+    languages = list(LANGUAGE_WEIGHTS)
+    weights = list(LANGUAGE_WEIGHTS.values())
+    jobs = []
+    for i in range(count):
+        location = rng.choice(LOCATIONS)
+        company = rng.choice(COMPANIES)
+        language = rng.choices(languages, weights)[0]
+        fields = {"city": location.split(",")[0], "company": company, "domain": rng.choice(DOMAINS)}
+        sections = make_description(rng, language, fields)
+        is_html = rng.random() < HTML_SHARE
+        job_id = str(3900000000 + i)
+        jobs.append({
+            'job_id': job_id,
+            'title': rng.choice(TITLES),
+            'company': company,
+            'location': location,
+            'work_arrangement': rng.choice(ARRANGEMENTS),
+            'description': to_html(sections, rng) if is_html else to_text(sections),
+            'job_url': f"https://www.linkedin.com/jobs/view/{job_id}/",
+            'scraped_at': f"2024-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d} "
+                          f"{rng.randint(0, 23):02d}:{rng.randint(0, 59):02d}:{rng.randint(0, 59):02d}",
+            'language': language,
+            'is_html': is_html,
+        })
+    return tuple(jobs)
+
+
+def make_jobs(count: int, seed: int = 42) -> List[Dict]:
+    """count 个合成职位（每次返回新的字典，调用方可以修改）"""
+    return [dict(job) for job in _make_jobs(count, seed)]
+
+
+def make_descriptions(count: int, seed: int = 42) -> List[str]:
+    return [job['description'] for job in _make_jobs(count, seed)]
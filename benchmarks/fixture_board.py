@@ -0,0 +1,167 @@
+"""本地测试职位板 - 与爬虫选择器相同 DOM 结构的搜索列表和详情面板
+
+搜索页列出合成语料（benchmarks.corpus）中的职位；点击列表项时用 fetch 取回详情面板，
+填入后把地址改成 ?currentJobId=<ID>，与真实站点的切换方式一致。
+可以给详情请求加固定延迟模拟网络耗时。
+
+运行: python -m benchmarks.fixture_board [--jobs 50] [--port 8765] [--latency-ms 0]
+然后在 config.py 中设置 OFFLINE_CONFIG["enabled"] = True 运行 python main.py。
+"""
+import argparse
+import html
+import re
+import threading
+import time
+from functools import partial
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List
+
+from benchmarks.corpus import make_jobs
+
+PANE_PATH = re.compile(r"^/jobs/pane/(\d+)$")
+
+SEARCH_PAGE = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>Jobs</title></head>
+<body>
+<div class="jobs-search-results-list"><ul>
+{cards}
+</ul></div>
+<div class="jobs-search__job-details"><div id="detail-pane"></div></div>
+<script>
+document.querySelectorAll("li.jobs-search-results__list-item").forEach(function (card) {{
+  card.addEventListener("click", function () {{
+    var jobId = card.getAttribute("data-occludable-job-id");
+    fetch("/jobs/pane/" + jobId).then(function (response) {{ return response.text(); }}).then(function (pane) {{
+      document.getElementById("detail-pane").innerHTML = pane;
+      history.replaceState(null, "", "/jobs/search/?currentJobId=" + jobId);
+    }});
+  }});
+}});
+</script>
+</body></html>
+"""
+
+CARD = """<li class="jobs-search-results__list-item" data-occludable-job-id="{job_id}">
+  <div class="job-card-container">
+    <a class="job-card-container__link" href="#"><strong class="job-card-list__title">{title}</strong></a>
+    <div class="job-card-container__primary-description">{company}</div>
+    <ul><li class="job-card-container__metadata-item">{location}</li></ul>
+  </div>
+</li>"""
+
+# 卡片地点后标注的工作类型
+CARD_ARRANGEMENTS = {"on-site": " (On-site)", "hybrid": " (Hybrid)", "remote": " (Remote)", "unknown": ""}
+
+PANE = """<div class="job-details-jobs-unified-top-card__container">
+  <h2 class="job-details-jobs-unified-top-card__job-title">{title}</h2>
+  <div class="job-details-jobs-unified-top-card__company-name"><a href="#">{company}</a></div>
+  <div class="job-details-jobs-unified-top-card__primary-description-container">{company} · {location} · 2 days ago</div>
+  <a class="jobs-search__job-details--container-embedded-link" href="/jobs/view/{job_id}/">{title}</a>
+</div>
+<div class="jobs-description">
+  <div id="job-details">{description}</div>
+  <button aria-label="Show more" onclick="this.style.display='none'">Show more</button>
+</div>"""
+
+
+def description_html(job: Dict) -> str:
+    """HTML 描述原样嵌入，纯文本描述每行一个段落"""
+    if job['is_html']:
+        return job['description']
+    return "".join(f"<p>{html.escape(line)}</p>" for line in job['description'].split("\n"))
+
+
+class _Handler(BaseHTTPRequestHandler):
+    def __init__(self, board: "FixtureBoard", *args, **kwargs):
+        self.board = board
+        super().__init__(*args, **kwargs)
+
+    def do_GET(self):
+        path = self.path.split("?", 1)[0]
+        if path.rstrip("/") == "/jobs/search":
+            self._send(self.board.search_page())
+            return
+        match = PANE_PATH.match(path)
+        if match and match.group(1) in self.board.jobs_by_id:
+            if self.board.latency:
+                time.sleep(self.board.latency)
+            self._send(self.board.pane(match.group(1)))
+            return
+        self.send_error(404)
+
+    def _send(self, body: str):
+        data = body.encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class FixtureBoard:
+    """在后台线程运行的测试职位板，可用作上下文管理器"""
+
+    def __init__(self, count: int = 50, seed: int = 42, latency: float = 0.0,
+                 host: str = "127.0.0.1", port: int = 0):
+        self.jobs: List[Dict] = make_jobs(count, seed)
+        self.jobs_by_id = {job['job_id']: job for job in self.jobs}
+        self.latency = latency
+        self.server = ThreadingHTTPServer((host, port), partial(_Handler, self))
+        self.thread = None
+
+    @property
+    def search_url(self) -> str:
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}/jobs/search/"
+
+    def search_page(self) -> str:
+        cards = "\n".join(CARD.format(
+            job_id=job['job_id'], title=html.escape(job['title']),
+            company=html.escape(job['company']),
+            location=html.escape(job['location'] + CARD_ARRANGEMENTS[job['work_arrangement']])
+        ) for job in self.jobs)
+        return SEARCH_PAGE.format(cards=cards)
+
+    def pane(self, job_id: str) -> str:
+        job = self.jobs_by_id[job_id]
+        return PANE.format(
+            job_id=job_id, title=html.escape(job['title']), company=html.escape(job['company']),
+            location=html.escape(job['location']), description=description_html(job)
+        )
+
+    def start(self) -> "FixtureBoard":
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def __enter__(self) -> "FixtureBoard":
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="本地测试职位板")
+    parser.add_argument("--jobs", type=int, default=50, help="职位数量")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency-ms", type=float, default=0, help="详情面板请求的延迟（毫秒）")
+    args = parser.parse_args()
+
+    board = FixtureBoard(args.jobs, latency=args.latency_ms / 1000, port=args.port)
+    print(f"🧪 测试职位板: {board.search_url} ({args.jobs} 个职位)，Ctrl+C 退出")
+    try:
+        board.server.serve_forever()
+    except KeyboardInterrupt:
+        board.server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,245 @@
+"""整套基准 - 在合成职位语料上测量各处理环节，结果保存为 JSON 基线并与之前的基线比较
+
+用法:
+    python -m benchmarks.suite list
+    python -m benchmarks.suite run                                  # 1k/10k/100k 全部环节
+    python -m benchmarks.suite run --sizes 1000 10000 --cases html_cleaning skill_matching
+    python -m benchmarks.suite run -o benchmarks/baselines/main.json
+    python -m benchmarks.suite run --compare benchmarks/baselines/main.json
+    python -m benchmarks.suite compare old.json new.json --threshold 0.15
+
+比较时耗时增加超过阈值（默认 10%）的环节标记为退化，命令以状态码 1 退出。
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Callable, Dict, List
+
+from benchmarks.corpus import make_jobs
+
+DEFAULT_SIZES = [1000, 10000, 100000]
+DEFAULT_THRESHOLD = 0.10
+BASELINE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines")
+# 两次都短于该耗时的结果只受计时噪声影响，不判定退化
+MIN_SECONDS = 0.005
+
+# 环节名 -> setup(职位列表, 临时目录)，返回只包含被测操作的无参函数
+CASES: Dict[str, Callable] = {}
+
+
+def case(name: str):
+    def register(setup: Callable) -> Callable:
+        CASES[name] = setup
+        return setup
+    return register
+
+
+@case("html_cleaning")
+def _html_cleaning(jobs, workdir):
+    from html_text import html_to_text
+
+    descriptions = [job['description'] for job in jobs]
+    return lambda: [html_to_text(text) for text in descriptions]
+
+
+@case("english_detection")
+def _english_detection(jobs, workdir):
+    from language_id import get_identifier
+
+    identifier = get_identifier()
+    descriptions = [job['description'] for job in jobs]
+    return lambda: identifier.share_many(descriptions, "en")
+
+
+@case("skill_matching")
+def _skill_matching(jobs, workdir):
+    from config import ANALYSIS_CRITERIA
+    from job_analyzer import JobAnalyzer
+
+    analyzer = JobAnalyzer(ANALYSIS_CRITERIA)
+    descriptions = [job['description'] for job in jobs]
+    return lambda: analyzer.analyze_batch(descriptions)
+
+
+@case("enrich_frame")
+def _enrich_frame(jobs, workdir):
+    import pandas as pd
+    import job_filters
+
+    df = pd.DataFrame(jobs)
+    return lambda: job_filters.enrich_frame(df)
+
+
+@case("dataframe_build")
+def _dataframe_build(jobs, workdir):
+    import pandas as pd
+
+    return lambda: pd.DataFrame(jobs)
+
+
+@case("record_frame")
+def _record_frame(jobs, workdir):
+    from job_record import JobRecord, records_to_frame
+
+    records = [JobRecord.from_dict(job) for job in jobs]
+    return lambda: records_to_frame(records)
+
+
+def _export_frame(jobs):
+    import pandas as pd
+    import job_filters
+
+    df = job_filters.enrich_frame(pd.DataFrame(jobs).drop(columns=['language', 'is_html']))
+    df['duplicate_of'] = None
+    return df
+
+
+@case("excel_export")
+def _excel_export(jobs, workdir):
+    from excel_export import job_sheets, write_workbook
+
+    df = _export_frame(jobs)
+    return lambda: write_workbook(os.path.join(workdir, "jobs.xlsx"), job_sheets(df))
+
+
+@case("csv_export")
+def _csv_export(jobs, workdir):
+    df = _export_frame(jobs)
+    return lambda: df.to_csv(os.path.join(workdir, "jobs.csv"), index=False)
+
+
+@case("parquet_export")
+def _parquet_export(jobs, workdir):
+    import parquet_export
+
+    df = _export_frame(jobs)
+    return lambda: parquet_export.save_to_parquet(df, os.path.join(workdir, f"parquet_{time.perf_counter_ns()}"))
+
+
+def run_case(name: str, count: int, repeat: int) -> Dict:
+    """同一语料重复 repeat 次，取最短耗时"""
+    jobs = make_jobs(count)
+    with tempfile.TemporaryDirectory() as workdir:
+        func = CASES[name](jobs, workdir)
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func()
+            timings.append(time.perf_counter() - start)
+    seconds = min(timings)
+    return {'seconds': seconds, 'per_job_us': seconds / count * 1e6, 'repeat': repeat}
+
+
+def git_revision() -> str:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              cwd=os.path.dirname(BASELINE_DIR)).stdout.strip() or None
+    except OSError:
+        return None
+
+
+def run(sizes: List[int], cases: List[str], repeat: int = None) -> Dict:
+    results = {
+        'created': time.strftime('%Y-%m-%d %H:%M:%S'),
+        'git': git_revision(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'results': {},
+    }
+    for name in cases:
+        for count in sizes:
+            times = repeat or (3 if count <= 10000 else 1)
+            try:
+                result = run_case(name, count, times)
+            except ImportError as e:
+                print(f"   ⏭️  {name:<18} {count:>7}: 缺少依赖 ({e.name})")
+                break
+            results['results'].setdefault(name, {})[str(count)] = result
+            print(f"   {name:<18} {count:>7} 个职位 {result['seconds']:9.3f}s | {result['per_job_us']:9.1f} µs/职位")
+    return results
+
+
+def compare(baseline: Dict, current: Dict, threshold: float = DEFAULT_THRESHOLD) -> List[str]:
+    """打印两次结果的对比，返回退化的 "环节@规模" 列表"""
+    regressions = []
+    print(f"📏 基线 {baseline.get('git') or '-'} ({baseline.get('created')}) → "
+          f"当前 {current.get('git') or '-'} ({current.get('created')}) | 阈值 ±{threshold:.0%}")
+    for name, sizes in current['results'].items():
+        for count, result in sizes.items():
+            old = baseline['results'].get(name, {}).get(count)
+            if old is None:
+                print(f"   {name:<18} {count:>7}  {'-':>9} → {result['seconds']:9.3f}s  (新增)")
+                continue
+            ratio = result['seconds'] / old['seconds'] if old['seconds'] else float('inf')
+            noise = max(result['seconds'], old['seconds']) < MIN_SECONDS
+            if ratio > 1 + threshold and not noise:
+                mark = "⚠️  退化"
+                regressions.append(f"{name}@{count}")
+            elif ratio < 1 - threshold and not noise:
+                mark = "🚀 加快"
+            else:
+                mark = ""
+            print(f"   {name:<18} {count:>7}  {old['seconds']:9.3f}s → {result['seconds']:9.3f}s  "
+                  f"{ratio - 1:+7.1%} {mark}")
+    return regressions
+
+
+def load(path: str) -> Dict:
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="职位处理基准套件")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    subparsers.add_parser("list", help="列出所有环节")
+
+    run_parser = subparsers.add_parser("run", help="运行基准并保存 JSON 结果")
+    run_parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="职位数量")
+    run_parser.add_argument("--cases", nargs="+", choices=list(CASES), default=list(CASES), help="环节")
+    run_parser.add_argument("--repeat", type=int, help="重复次数（默认 1 万以内 3 次，更大 1 次）")
+    run_parser.add_argument("-o", "--output", help="结果文件，默认 baselines/<时间>.json")
+    run_parser.add_argument("--compare", help="运行后与该基线比较")
+    run_parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="退化阈值（比例）")
+
+    compare_parser = subparsers.add_parser("compare", help="比较两次结果")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="退化阈值（比例）")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "list":
+        for name in CASES:
+            print(name)
+        return
+
+    if args.command == "compare":
+        regressions = compare(load(args.baseline), load(args.current), args.threshold)
+    else:
+        print(f"📊 规模 {args.sizes} | {len(args.cases)} 个环节")
+        results = run(args.sizes, args.cases, args.repeat)
+        output = args.output or os.path.join(BASELINE_DIR, f"{time.strftime('%Y%m%d_%H%M%S')}.json")
+        os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+        with open(output, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+            f.write("\n")
+        print(f"💾 结果已保存: {output}")
+        if not args.compare:
+            return
+        regressions = compare(load(args.compare), results, args.threshold)
+
+    if regressions:
+        print(f"❌ {len(regressions)} 项退化: {', '.join(regressions)}")
+        sys.exit(1)
+    print("✅ 没有超过阈值的退化")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""职位列表卡片预筛选 - 点击前只凭卡片上的标题、公司和地点决定是否跳过
+
+每次点击都要等待详情面板并占用会话职位数，已保存过的、不在目标城市的、
+远程的和标题不符合规则的职位在列表中就可以排除。
+卡片信息缺失（列表项还没渲染）时不跳过，交给详情提取后的筛选处理。
+"""
+import re
+from collections import Counter
+from typing import Dict, Optional, Tuple
+
+from config import CARD_FILTER_CONFIG, LOCATION_FILTER
+from job_filters import city_of
+from keyword_matcher import get_matcher
+
+# 跳过原因 -> 说明
+SKIP_REASONS = {
+    "seen": "已保存过",
+    "seen_listing": "重新发布的已保存职位",
+    "city": "不在目标城市",
+    "arrangement": "工作类型不符（远程等）",
+    "title": "标题规则",
+}
+
+# 卡片地点后括号中的工作类型，如 "Berlin, Germany (Hybrid)"
+ARRANGEMENT_PATTERN = re.compile(r'\((on-site|hybrid|remote)\)', re.IGNORECASE)
+
+# 一次脚本调用读取卡片的全部字段，避免每个字段一次 WebDriver 往返
+CARD_SCRIPT = """
+const card = arguments[0], selectors = arguments[1], fields = {};
+for (const [name, selector] of Object.entries(selectors)) {
+    const element = card.querySelector(selector);
+    fields[name] = element ? element.innerText.trim() : "";
+}
+return fields;
+"""
+
+
+def card_arrangement(location: str) -> str:
+    """卡片地点中标注的工作类型，没有标注时为 unknown"""
+    match = ARRANGEMENT_PATTERN.search(location or "")
+    return match.group(1).lower() if match else "unknown"
+
+
+def listing_key(title: str, company: str, location: str) -> Tuple[str, str, str]:
+    """判断重新发布用的键: 小写标题、小写公司、城市"""
+    return (title or "").strip().lower(), (company or "").strip().lower(), city_of(location)
+
+
+class CardFilter:
+    """按已保存职位、城市、工作类型和标题规则判断卡片是否值得点击"""
+
+    def __init__(self, store, config: Dict = None):
+        self.config = config or CARD_FILTER_CONFIG
+        # 已保存职位的索引，会话开始时从职位库载入一次
+        self.seen_ids = store.job_ids()
+        self.seen_listings = {listing_key(*row) for row in store.listings()} \
+            if self.config["skip_seen_listings"] else set()
+        self.matcher = get_matcher(exclude=self.config["title_exclude"], include=self.config["title_include"])
+        self.counts: Counter = Counter()
+
+    def skip_reason(self, job_id: str, card: Dict[str, str]) -> Optional[str]:
+        """返回跳过原因（SKIP_REASONS 的键），应该点击时返回 None"""
+        reason = self._reason(job_id, card)
+        if reason:
+            self.counts[reason] += 1
+        return reason
+
+    def _reason(self, job_id: str, card: Dict[str, str]) -> Optional[str]:
+        if job_id and job_id in self.seen_ids:
+            return "seen"
+
+        title, company, location = card.get('title', ""), card.get('company', ""), card.get('location', "")
+        if location:
+            if city_of(location) == "other":
+                return "city"
+            arrangement = card_arrangement(location)
+            if arrangement != "unknown" and arrangement not in LOCATION_FILTER["work_arrangement"]:
+                return "arrangement"
+
+        if title:
+            matched = self.matcher.scan(title)
+            if matched["exclude"] or (self.config["title_include"] and not matched["include"]):
+                return "title"
+            if company and location and listing_key(title, company, location) in self.seen_listings:
+                return "seen_listing"
+        return None
+
+    def remember(self, job: Dict):
+        """本次会话保存的职位加入索引"""
+        self.seen_ids.add(job['job_id'])
+        if self.config["skip_seen_listings"]:
+            self.seen_listings.add(listing_key(job['title'], job['company'], job['location']))
+
+    @property
+    def skipped(self) -> int:
+        return sum(self.counts.values())
+
+    def print_summary(self):
+        if not self.counts:
+            return
+        print(f"⏭️  列表预筛选跳过 {self.skipped} 个职位（未点击）:")
+        for reason, count in self.counts.most_common():
+            print(f"   {SKIP_REASONS[reason]:<24} {count:>4}")
@@ -0,0 +1,240 @@
+"""职位工具命令行入口 - 各子命令只在用到时才导入对应的依赖
+
+用法:
+    python cli.py scrape                      # 启动浏览器爬取（selenium 只在这里导入）
+    python cli.py analyze jobs.db -o out.csv  # 离线重新分析
+    python cli.py export xlsx                 # 从职位库导出
+    python cli.py dedup                       # 为已有职位建立近似重复索引
+    python cli.py compress                    # 训练压缩字典并重新压缩全部职位描述
+    python cli.py search kotlin "visa sponsorship" --location Munich --work-arrangement hybrid
+    python cli.py stats                       # 职位库和会话耗时概况
+"""
+import argparse
+import glob
+import os
+import sys
+import time
+
+from config import ANALYSIS_CACHE_CONFIG, PARQUET_CONFIG, PERF_CONFIG, STORAGE_CONFIG
+
+
+def cmd_scrape(args):
+    import main
+
+    main.main()
+
+
+def cmd_analyze(args):
+    import reanalyze
+
+    reanalyze.run(args)
+
+
+def cmd_export(args):
+    from job_store import JobStore
+
+    store = JobStore(args.db)
+    try:
+        if args.format == "parquet":
+            import parquet_export
+
+            # 与爬取后的自动导出共用水位线，只追加新职位
+            root = args.output or PARQUET_CONFIG["root"]
+            target = f"parquet:{root}"
+            df, last_rowid = store.unexported_jobs(target)
+            if df.empty:
+                print("📭 没有新职位需要导出")
+                return
+            count = parquet_export.save_to_parquet(df, root)
+            store.mark_exported(target, last_rowid)
+            print(f"🗂️  Parquet 已追加 {count} 个职位: {root}")
+            return
+
+        df = store.query_jobs(since=args.since)
+        if df.empty:
+            print("❌ 没有数据可保存")
+            return
+        output = args.output or f"german_jobs_export.{args.format}"
+        if args.format == "csv":
+            df.to_csv(output, index=False)
+        else:
+            from excel_export import job_sheets, write_workbook
+
+            write_workbook(output, job_sheets(df))
+        print(f"💾 {len(df)} 个职位已导出到: {output}")
+    finally:
+        store.close()
+
+
+def cmd_dedup(args):
+    from job_store import JobStore
+    from near_duplicates import DuplicateIndex
+
+    store = JobStore(args.db)
+    try:
+        found = DuplicateIndex(store).index_existing(store)
+        print(f"♻️  新发现 {len(found)} 个近似重复职位")
+        for job_id, duplicate_of in found.items():
+            print(f"   {job_id} -> {duplicate_of}")
+    finally:
+        store.close()
+
+
+def cmd_compress(args):
+    from job_store import JobStore
+
+    store = JobStore(args.db)
+    try:
+        if store.codec is None:
+            print("❌ 需要安装 zstandard")
+            return
+        start = time.perf_counter()
+        dict_id = store.train_dictionary()
+        if dict_id is None:
+            print(f"⚠️ 描述太少，暂不训练字典（至少 {store.codec.config['min_samples']} 个）")
+        count, before, after = store.recompress()
+        print(f"🗜️  重新压缩 {count} 个职位描述: {before / 1024:.0f} KB → {after / 1024:.0f} KB "
+              f"({time.perf_counter() - start:.1f}s)")
+        if args.vacuum:
+            store.conn.execute("VACUUM")
+            print(f"🧹 职位库已整理: {os.path.getsize(args.db) / 1024:.0f} KB")
+    finally:
+        store.close()
+
+
+def cmd_search(args):
+    from job_store import JobStore
+    from job_search import SearchIndex
+
+    if not os.path.exists(args.db):
+        print(f"❌ 职位库不存在: {args.db}")
+        return
+    store = JobStore(args.db)
+    try:
+        index = SearchIndex(store)
+        indexed = index.rebuild() if args.reindex else index.index_new()
+        if indexed:
+            print(f"🗂️  已索引 {indexed} 个新职位")
+
+        start = time.perf_counter()
+        results = index.search(
+            " ".join(args.query), location=args.location, work_arrangement=args.work_arrangement,
+            is_english=args.english, since=args.since, until=args.until,
+            include_duplicates=args.duplicates, any_term=args.any, limit=args.limit
+        )
+        elapsed = time.perf_counter() - start
+
+        print(f"🔍 {len(results)} 个结果 ({elapsed * 1000:.1f}ms)")
+        for rank, job in enumerate(results, 1):
+            print(f"{rank:>3}. {job['title']} | {job['company']} | {job['location']}")
+            print(f"     {job['work_arrangement']} | {job['scraped_at']} | 相关度 {job['score']:.2f} | {job['job_url']}")
+    finally:
+        store.close()
+
+
+def cmd_stats(args):
+    from job_store import JobStore
+
+    if os.path.exists(args.db):
+        store = JobStore(args.db)
+        stats = store.stats()
+        store.close()
+
+        print(f"📊 职位库: {args.db}")
+        print(f"   职位数: {stats['total']} | 英文职位: {stats['english']} | 近似重复: {stats['duplicates']}")
+        if stats['total']:
+            print(f"   抓取时间: {stats['first_scraped']} ~ {stats['last_scraped']}")
+        for column, label in [('work_arrangement', "工作类型"), ('location', "城市")]:
+            if stats[column]:
+                print(f"   英文职位{label}分布:")
+                for value, count in stats[column].items():
+                    print(f"     {value}: {count}")
+        for target, last_rowid in stats['exports'].items():
+            print(f"   已导出 {target}: rowid ≤ {last_rowid}")
+        descriptions = stats['descriptions']
+        if descriptions['compressed']:
+            print(f"   压缩描述: {descriptions['compressed']} 个 | {descriptions['compressed_bytes'] / 1024:.0f} KB | "
+                  f"{descriptions['dicts']} 个字典 | 原文保存 {descriptions['plain_bytes'] / 1024:.0f} KB")
+    else:
+        print(f"❌ 职位库不存在: {args.db}")
+
+    if os.path.exists(ANALYSIS_CACHE_CONFIG["path"]):
+        from analysis_cache import AnalysisCache
+
+        cache = AnalysisCache()
+        cache_stats = cache.stats()
+        cache.close()
+        print(f"\n🗃️  分析缓存: {cache_stats['entries']} 条 | "
+              f"{cache_stats['bytes'] / 1024 / 1024:.1f}/{cache_stats['max_bytes'] / 1024 / 1024:.0f} MB")
+        for kind, (hits, misses) in cache_stats['counters'].items():
+            total = hits + misses
+            print(f"   {kind}: 命中 {hits} | 未命中 {misses} | 命中率 {hits / total if total else 0:.0%}")
+
+    logs = sorted(glob.glob(os.path.join(PERF_CONFIG["log_dir"], "*.jsonl")))
+    if args.perf and logs:
+        import perf
+
+        print(f"\n📂 {len(logs)} 个会话日志")
+        perf.print_stage_table(perf.load_stages(logs))
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="LinkedIn德国职位筛选器")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    scrape = subparsers.add_parser("scrape", help="启动浏览器爬取职位")
+    scrape.set_defaults(func=cmd_scrape)
+
+    analyze = subparsers.add_parser("analyze", help="离线重新分析已保存的职位")
+    # 参数与 reanalyze.py 一致；reanalyze 依赖 pandas，只在执行该命令时导入
+    analyze.add_argument("inputs", nargs="*", help="职位库(.db)或 xlsx/csv 文件")
+    analyze.add_argument("-o", "--output", help="输出文件，默认 reanalyzed_jobs_<时间>.xlsx")
+    analyze.add_argument("-w", "--workers", type=int, help="分析进程数，默认CPU核数")
+    analyze.add_argument("--no-cache", action="store_true", help="不读写分析结果缓存")
+    analyze.set_defaults(func=cmd_analyze)
+
+    export = subparsers.add_parser("export", help="从职位库导出")
+    export.add_argument("format", choices=["xlsx", "csv", "parquet"], help="导出格式")
+    export.add_argument("-o", "--output", help="输出文件（parquet 为数据集目录）")
+    export.add_argument("--since", help="只导出该时间之后抓取的职位，如 2024-01-01")
+    export.add_argument("--db", default=STORAGE_CONFIG["db_path"], help="职位库路径")
+    export.set_defaults(func=cmd_export)
+
+    dedup = subparsers.add_parser("dedup", help="为职位库中尚未索引的职位查找近似重复")
+    dedup.add_argument("--db", default=STORAGE_CONFIG["db_path"], help="职位库路径")
+    dedup.set_defaults(func=cmd_dedup)
+
+    compress = subparsers.add_parser("compress", help="训练压缩字典并用它重新压缩全部职位描述")
+    compress.add_argument("--vacuum", action="store_true", help="压缩后整理职位库文件，释放空间")
+    compress.add_argument("--db", default=STORAGE_CONFIG["db_path"], help="职位库路径")
+    compress.set_defaults(func=cmd_compress)
+
+    search = subparsers.add_parser("search", help="全文检索职位描述（BM25 排序）")
+    search.add_argument("query", nargs="+", help='检索词，"..." 为短语，词尾 * 为前缀')
+    search.add_argument("--location", help="地点包含该文本，如 Munich")
+    search.add_argument("--work-arrangement", choices=["hybrid", "on-site", "remote", "unknown"], help="工作类型")
+    search.add_argument("--english", action="store_true", default=None, help="只看英文职位")
+    search.add_argument("--since", help="该时间之后抓取的职位，如 2024-01-01")
+    search.add_argument("--until", help="该时间之前抓取的职位")
+    search.add_argument("--any", action="store_true", help="任意一个词出现即可（默认所有词都要出现）")
+    search.add_argument("--duplicates", action="store_true", help="结果包含近似重复的职位")
+    search.add_argument("-n", "--limit", type=int, help="结果数量")
+    search.add_argument("--reindex", action="store_true", help="重建索引")
+    search.add_argument("--db", default=STORAGE_CONFIG["db_path"], help="职位库路径")
+    search.set_defaults(func=cmd_search)
+
+    stats = subparsers.add_parser("stats", help="职位库和会话耗时概况")
+    stats.add_argument("--db", default=STORAGE_CONFIG["db_path"], help="职位库路径")
+    stats.add_argument("--perf", action="store_true", help="同时汇总会话耗时日志")
+    stats.set_defaults(func=cmd_stats)
+
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -13,12 +13,16 @@ SEARCH_PARAMS = {
 # 工作地点筛选
 LOCATION_FILTER = {
     "allowed_cities": ["Düsseldorf", "Berlin", "Munich", "Frankfurt", "Leipzig"],
+    # 地点中城市的其他写法（匹配时忽略大小写和变音符号，"Dusseldorf" 无需单独列出）
+    "city_aliases": {"Munich": ["München", "Muenchen"], "Düsseldorf": ["Duesseldorf"]},
     "work_arrangement": ["hybrid", "on-site"]  # 只要混合和现场办公
 }
 
 # 英文检测配置
 ENGLISH_DETECTION = {
-    "min_english_score": 0.7,
+    "method": "ngram",                # ngram: 字符 n-gram 语言识别; keywords: 英文关键词比例
+    "min_english_share": 0.5,         # ngram: 英文内容所占比例下限（德英双语约各占一半）
+    "min_english_score": 0.7,         # keywords: 命中关键词比例下限
     "required_keywords": [
         "experience", "skills", "development", "team", "project",
         "requirements", "responsibilities", "software", "engineering",
@@ -39,6 +43,140 @@ SAFETY_CONFIG = {
 # 浏览器配置
 BROWSER_CONFIG = {
     "headless": False,                # 显示浏览器窗口
-    "timeout": 25,
-    "implicit_wait": 8
+    "timeout": 25,                    # 等待搜索结果列表的上限
+    "implicit_wait": 0,               # 不用隐式等待，缺失的可选元素立即返回
+    "element_timeout": 8,             # 显式等待详情面板等必需元素的上限
+}
+
+# 职位分析标准 (JobAnalyzer)
+ANALYSIS_CRITERIA = {
+    "english_only": True,
+    # 技能: 权重（也可以写成列表，权重均为 1）；匹配率按命中的必需技能权重计算
+    "required_skills": {
+        "Python": 2.0, "Java": 1.0, "JavaScript": 1.0, "TypeScript": 1.0, "SQL": 1.5,
+        "Docker": 1.0, "Kubernetes": 1.0, "AWS": 1.0, "Git": 0.5, "Linux": 0.5,
+    },
+    # 加分技能: 只计入总分，不影响是否合格
+    "optional_skills": {
+        "Kotlin": 0.5, "React": 0.5, "Terraform": 0.5, "PostgreSQL": 0.5, "Kafka": 0.5,
+    },
+    # 同义词: 命中任一写法即算命中该技能
+    "skill_synonyms": {
+        "Kubernetes": ["k8s"],
+        "JavaScript": ["JS", "ECMAScript"],
+        "AWS": ["Amazon Web Services"],
+        "PostgreSQL": ["Postgres"],
+    },
+    "min_skill_match_ratio": 0.3,     # 至少匹配30%的技能权重
+    "require_sponsorship": False,     # 是否要求提供签证担保
+}
+
+# 本地职位库配置
+STORAGE_CONFIG = {
+    "db_path": "jobs.db",             # SQLite 职位库（按职位ID去重）
+}
+
+# 职位描述压缩存储：zstd + 在已保存描述上训练的字典（需要 zstandard；未安装时按原文保存）
+COMPRESSION_CONFIG = {
+    "enabled": True,
+    "level": 9,
+    "dict_size": 64 * 1024,           # 字典大小（字节）
+    "min_samples": 200,               # 攒够这么多描述后训练第一个字典
+    "retrain_every": 2000,            # 之后每新增这么多职位重新训练
+    "train_samples": 5000,            # 训练时使用最近保存的描述数量
+}
+
+# Excel 导出配置
+EXPORT_CONFIG = {
+    "mode": "session",                # session: 每次会话一个新文件; rolling: 追加到同一个工作簿
+    "rolling_workbook": "german_jobs.xlsx",
+}
+
+# Parquet 导出配置（按抓取日期和城市分区，职位描述单独存放）
+PARQUET_CONFIG = {
+    "enabled": True,
+    "root": "jobs_parquet",
+}
+
+# 职位列表卡片选择器（点击前从卡片读取标题、公司和地点）
+JOB_CARD_SELECTORS = {
+    "title": ".job-card-list__title, .job-card-container__link strong",
+    "company": ".job-card-container__primary-description, .artdeco-entity-lockup__subtitle",
+    "location": ".job-card-container__metadata-item, .artdeco-entity-lockup__caption",
+}
+
+# 列表卡片预筛选：不符合条件的职位不点击，不占用会话职位数
+CARD_FILTER_CONFIG = {
+    "enabled": True,
+    # 标题、公司、城市都与已保存职位相同时视为重新发布，跳过。默认关闭：同一公司同一城市的
+    # 通用标题（如两个 "Software Engineer"）常是不同职位；重新发布点击后由近似重复检测识别
+    "skip_seen_listings": False,
+    # 标题包含任一关键词时跳过（不区分大小写，按词匹配）
+    "title_exclude": ["Werkstudent", "Working Student", "Praktikum", "Praktikant", "Intern", "Internship",
+                      "Ausbildung", "Trainee"],
+    "title_include": [],              # 非空时标题至少包含其中一个关键词
+}
+
+# 职位详情页选择器（WebDriver 提取和离线 HTML 解析共用）
+JOB_DETAIL_SELECTORS = {
+    "title": ".job-details-jobs-unified-top-card__job-title, h2.job-details-jobs-unified-top-card__job-title",
+    "company": ".job-details-jobs-unified-top-card__company-name a, .job-details-jobs-unified-top-card__company-name",
+    "location": ".job-details-jobs-unified-top-card__primary-description-container, .job-details-jobs-unified-top-card__bullet",
+    "show_more": "button[aria-label='Show more']",
+    "description": "#job-details, .jobs-description, .jobs-description-content",
+    "job_link": "a.jobs-search__job-details--container-embedded-link",
+}
+
+# 页面快照配置：每个职位只取一次 page_source，压缩保存后离线解析
+SNAPSHOT_CONFIG = {
+    "enabled": False,
+    "dir": "snapshots",
+}
+
+# 性能记录配置：每个会话的阶段耗时以 JSON lines 写入 log_dir
+PERF_CONFIG = {
+    "log_dir": "perf_logs",
+    "profile_analysis": None,         # 分析阶段剖析: None / "cprofile" / "pyinstrument"
+}
+
+# 浏览器驱动缓存：解析一次后记录路径和版本，Chrome 主版本变化时才重新解析
+DRIVER_CONFIG = {
+    "manifest": ".driver_manifest.json",
+    "chrome_binary": None,            # 自定义 Chrome 路径（默认自动查找）
+}
+
+# 近似重复检测：描述词组的 MinHash 签名 + LSH 分桶（bands × rows = num_perm）
+DUPLICATE_CONFIG = {
+    "enabled": True,
+    "shingle_size": 3,                # 每个词组包含的连续词数
+    "num_perm": 128,
+    "bands": 16,                      # 16 段 × 8 行，约 0.7 以上的相似度才会成为候选
+    "threshold": 0.8,                 # 签名估计的相似度达到该值即视为重复
+}
+
+# 全文检索：职位库中的 FTS5 倒排索引，按 BM25 排序（权重越高的字段命中越靠前）
+SEARCH_CONFIG = {
+    "weights": {"title": 4.0, "company": 2.0, "description": 1.0},
+    "limit": 20,
+}
+
+# 分析结果缓存：按 (描述内容哈希, 配置哈希, 分析器版本) 缓存，超过上限时淘汰最久未用的结果
+ANALYSIS_CACHE_CONFIG = {
+    "enabled": True,
+    "path": "analysis_cache.db",
+    "max_bytes": 64 * 1024 * 1024,    # 缓存内容上限（键和值的字节数）
+}
+
+# 离线模式：爬取本地测试职位板（python -m benchmarks.fixture_board），无头浏览器、不做安全延迟
+# 只用于基准测试和离线验证选择器，不要用于真实站点
+OFFLINE_CONFIG = {
+    "enabled": False,
+    "search_url": "http://127.0.0.1:8765/jobs/search/",
+    "max_jobs_per_session": 1000,
+}
+
+# 处理流水线：查重、分析和入库放在后台线程，爬取循环交出职位后立即继续（安全延迟期间完成处理）
+PIPELINE_CONFIG = {
+    "background": True,
+    "queue_size": 4,                  # 等待处理的职位上限，队列满时爬取等待
 }
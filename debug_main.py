@@ -7,9 +7,11 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
 import os
 
+import driver_setup
+import job_filters
+
 # 简化配置
 SEARCH_CONFIG = {
     "location": "Berlin, Germany",  # 先用柏林测试
@@ -31,12 +33,14 @@ class SimpleLinkedInScraper:
         chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
         chrome_options.add_argument("--user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36")
         
-        service = Service()
+        # 与主程序共用缓存的驱动
+        service, startup_info = driver_setup.create_service()
         
         try:
             self.driver = webdriver.Chrome(service=service, options=chrome_options)
             self.driver.implicitly_wait(10)
             print("✅ 浏览器启动成功！")
+            driver_setup.print_startup_report(startup_info)
             return True
         except Exception as e:
             print(f"❌ 浏览器启动失败: {e}")
@@ -61,14 +65,9 @@ class SimpleLinkedInScraper:
         time.sleep(3)
     
     def is_english_job(self, text):
-        """简单英文检测"""
-        if not text:
-            return False, 0.0
-        english_words = ['experience', 'skills', 'team', 'project', 'development']
-        text_lower = text.lower()
-        matches = sum(1 for word in english_words if word in text_lower)
-        score = matches / len(english_words)
-        return score >= 0.4, round(score, 2)
+        """英文检测（与主程序相同的语言识别）"""
+        score = job_filters.detect_english(text)
+        return score >= job_filters.english_threshold(), round(score, 2)
     
     def test_connection(self):
         """测试连接和登录状态"""
@@ -0,0 +1,112 @@
+"""职位描述压缩 - zstd + 在已保存描述上训练的字典
+
+职位描述大部分是重复的套话（福利、平等机会声明、德英文固定说法），
+单个描述太短，普通压缩找不到这些重复；用已保存的描述训练一个字典，
+每个描述单独压缩成一帧，仍然可以按职位随机读取。
+字典随职位库增长定期重新训练，旧字典保留，用旧字典压缩的描述照常解压。
+字典保存在职位库的 description_dicts 表中。
+"""
+import time
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import zstandard
+
+from config import COMPRESSION_CONFIG
+
+# 没有字典（训练前）时的 dict_id
+NO_DICT = 0
+
+
+class DescriptionCodec:
+    """按字典编号压缩和解压描述；压缩器和解压器每个字典只创建一次"""
+
+    def __init__(self, conn, config: Dict = None):
+        self.conn = conn
+        self.config = config or COMPRESSION_CONFIG
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS description_dicts (
+                dict_id       INTEGER PRIMARY KEY,
+                data          BLOB NOT NULL,
+                samples       INTEGER NOT NULL,
+                trained_rowid INTEGER NOT NULL,
+                created_at    TEXT NOT NULL
+            )
+        """)
+        self.conn.commit()
+        self.dicts: Dict[int, Optional[zstandard.ZstdCompressionDict]] = {NO_DICT: None}
+        self.trained_rowid = 0
+        self._compressors: Dict[int, zstandard.ZstdCompressor] = {}
+        self._decompressors: Dict[int, zstandard.ZstdDecompressor] = {}
+        self._load_dicts()
+
+    def _load_dicts(self):
+        """载入尚未载入的字典（其他连接，如后台处理线程，可能训练了新字典）"""
+        for dict_id, data, trained_rowid in self.conn.execute(
+                "SELECT dict_id, data, trained_rowid FROM description_dicts WHERE dict_id > ? ORDER BY dict_id",
+                (self.current_dict_id,)):
+            self.dicts[dict_id] = zstandard.ZstdCompressionDict(data)
+            self.trained_rowid = trained_rowid
+
+    @property
+    def current_dict_id(self) -> int:
+        """新描述使用的字典（最近训练的）"""
+        return max(self.dicts)
+
+    def _compressor(self, dict_id: int) -> zstandard.ZstdCompressor:
+        if dict_id not in self._compressors:
+            self._compressors[dict_id] = zstandard.ZstdCompressor(
+                level=self.config["level"], dict_data=self.dicts[dict_id], write_checksum=False)
+        return self._compressors[dict_id]
+
+    def _decompressor(self, dict_id: int) -> zstandard.ZstdDecompressor:
+        if dict_id not in self._decompressors:
+            if dict_id not in self.dicts:
+                self._load_dicts()
+            if dict_id not in self.dicts:
+                raise ValueError(f"职位库中没有编号为 {dict_id} 的压缩字典")
+            self._decompressors[dict_id] = zstandard.ZstdDecompressor(dict_data=self.dicts[dict_id])
+        return self._decompressors[dict_id]
+
+    def compress(self, text: str) -> Tuple[bytes, int]:
+        """用当前字典压缩，返回 (压缩数据, dict_id)"""
+        dict_id = self.current_dict_id
+        return self._compressor(dict_id).compress(text.encode("utf-8")), dict_id
+
+    def decompress(self, data: bytes, dict_id: int) -> str:
+        return self._decompressor(dict_id).decompress(data).decode("utf-8")
+
+    def decompress_many(self, frames: Sequence[Tuple[bytes, int]]) -> List[str]:
+        """批量解压 [(压缩数据, dict_id)]，同一字典共用解压器"""
+        decompressors = {}
+        texts = []
+        for data, dict_id in frames:
+            decompressor = decompressors.get(dict_id)
+            if decompressor is None:
+                decompressor = decompressors[dict_id] = self._decompressor(dict_id)
+            texts.append(decompressor.decompress(data).decode("utf-8"))
+        return texts
+
+    def needs_training(self, last_rowid: int) -> bool:
+        """还没有字典时攒够 min_samples 个描述训练，之后每新增 retrain_every 个重新训练"""
+        threshold = self.config["retrain_every"] if self.current_dict_id != NO_DICT else self.config["min_samples"]
+        return last_rowid - self.trained_rowid >= threshold
+
+    def train(self, samples: Iterable[str], trained_rowid: int) -> Optional[int]:
+        """用样本描述训练新字典并保存，返回新的 dict_id（样本太少时返回 None）
+
+        无论成功与否都记下这次尝试的位置，样本不足或训练出错时攒够新描述再试，不会每次入库都重试。
+        """
+        self.trained_rowid = trained_rowid
+        samples = [text.encode("utf-8") for text in samples if text]
+        if len(samples) < self.config["min_samples"]:
+            return None
+        data = zstandard.train_dictionary(self.config["dict_size"], samples)
+        self._load_dicts()
+        dict_id = self.current_dict_id + 1
+        self.conn.execute(
+            "INSERT INTO description_dicts (dict_id, data, samples, trained_rowid, created_at) VALUES (?, ?, ?, ?, ?)",
+            (dict_id, data.as_bytes(), len(samples), trained_rowid, time.strftime('%Y-%m-%d %H:%M:%S'))
+        )
+        self.conn.commit()
+        self.dicts[dict_id] = zstandard.ZstdCompressionDict(data.as_bytes())
+        return dict_id
@@ -0,0 +1,157 @@
+"""浏览器驱动准备 - 解析一次 chromedriver，把路径和版本缓存到本地清单
+
+之后启动直接使用缓存的路径，只有 Chrome 主版本和驱动不一致（或驱动文件丢失）时
+才重新解析。无法联网时保留旧驱动，没有任何驱动时交给 Selenium Manager。
+    python driver_setup.py [--refresh]
+"""
+import argparse
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+import time
+from typing import Dict, Optional, Tuple
+
+from selenium.webdriver.chrome.service import Service
+
+from config import DRIVER_CONFIG
+
+VERSION_PATTERN = re.compile(r"(\d+)\.(\d+)\.(\d+)\.(\d+)")
+
+CHROME_COMMANDS = [
+    "google-chrome", "google-chrome-stable", "chromium", "chromium-browser", "chrome",
+    "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
+]
+WINDOWS_VERSION_QUERY = [
+    "reg", "query", r"HKEY_CURRENT_USER\Software\Google\Chrome\BLBeacon", "/v", "version",
+]
+
+
+def _run_version(command) -> Optional[str]:
+    """执行 --version 类命令，返回其中的四段版本号"""
+    try:
+        output = subprocess.run(command, capture_output=True, text=True, timeout=10).stdout
+    except (OSError, subprocess.SubprocessError):
+        return None
+    match = VERSION_PATTERN.search(output)
+    return match.group(0) if match else None
+
+
+def chrome_version() -> Optional[str]:
+    """本机 Chrome 版本（找不到时为 None）"""
+    if DRIVER_CONFIG.get("chrome_binary"):
+        return _run_version([DRIVER_CONFIG["chrome_binary"], "--version"])
+    if sys.platform == "win32":
+        return _run_version(WINDOWS_VERSION_QUERY)
+    for command in CHROME_COMMANDS:
+        if os.path.isabs(command) and not os.path.exists(command):
+            continue
+        if not os.path.isabs(command) and shutil.which(command) is None:
+            continue
+        version = _run_version([command, "--version"])
+        if version:
+            return version
+    return None
+
+
+def driver_version(driver_path: str) -> Optional[str]:
+    return _run_version([driver_path, "--version"])
+
+
+def major(version: Optional[str]) -> Optional[str]:
+    return version.split(".")[0] if version else None
+
+
+def load_manifest(path: str = None) -> Dict:
+    path = path or DRIVER_CONFIG["manifest"]
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_manifest(manifest: Dict, path: str = None):
+    path = path or DRIVER_CONFIG["manifest"]
+    temp_name = path + ".tmp"
+    with open(temp_name, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(temp_name, path)
+
+
+def _cache_valid(manifest: Dict, chrome: Optional[str]) -> bool:
+    """缓存的驱动存在，且与当前 Chrome 主版本一致（查不到 Chrome 版本时信任缓存）"""
+    path = manifest.get("driver_path")
+    if not path or not os.path.exists(path):
+        return False
+    return chrome is None or major(chrome) == major(manifest.get("driver_version"))
+
+
+def _install_driver() -> str:
+    from webdriver_manager.chrome import ChromeDriverManager
+
+    return ChromeDriverManager().install()
+
+
+def resolve_driver(refresh: bool = False) -> Dict:
+    """返回驱动信息: driver_path（None 表示交给 Selenium Manager）、版本、来源和耗时"""
+    start = time.perf_counter()
+    manifest = load_manifest()
+    chrome = chrome_version()
+
+    if not refresh and _cache_valid(manifest, chrome):
+        info = dict(manifest, source="cache")
+    else:
+        try:
+            driver_path = _install_driver()
+            info = {
+                'driver_path': driver_path,
+                'driver_version': driver_version(driver_path),
+                'chrome_version': chrome,
+                'resolved_at': time.strftime('%Y-%m-%d %H:%M:%S'),
+            }
+            save_manifest(info)
+            info['source'] = "resolved"
+        except Exception as e:
+            # 离线：沿用旧驱动（即使版本不一致也比无法启动好），否则交给 Selenium Manager
+            print(f"⚠️ 驱动解析失败: {e}")
+            if manifest.get("driver_path") and os.path.exists(manifest["driver_path"]):
+                info = dict(manifest, source="stale-cache")
+            else:
+                info = {'driver_path': None, 'source': "selenium-manager"}
+
+    info['chrome_version'] = chrome
+    info['resolve_seconds'] = time.perf_counter() - start
+    return info
+
+
+def create_service(refresh: bool = False) -> Tuple[Service, Dict]:
+    """按缓存清单创建 chromedriver Service"""
+    info = resolve_driver(refresh)
+    service = Service(info['driver_path']) if info['driver_path'] else Service()
+    return service, info
+
+
+def print_startup_report(info: Dict):
+    """启动报告：驱动来源、解析、浏览器启动和首个页面耗时"""
+    print("🧰 启动报告:")
+    print(f"   驱动: {info.get('driver_path') or 'Selenium Manager'} ({info['source']})")
+    print(f"   版本: chromedriver {info.get('driver_version') or '?'} | Chrome {info.get('chrome_version') or '?'}")
+    for key, label in [('resolve_seconds', "驱动解析"), ('launch_seconds', "浏览器启动"),
+                       ('first_page_seconds', "首个页面")]:
+        if key in info:
+            print(f"   {label}: {info[key]:.2f}s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="检查或刷新缓存的 chromedriver")
+    parser.add_argument("--refresh", action="store_true", help="忽略缓存重新解析驱动")
+    args = parser.parse_args()
+
+    print_startup_report(resolve_driver(args.refresh))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,226 @@
+import os
+import posixpath
+import re
+import shutil
+import zipfile
+from typing import Dict, List, Optional
+from xml.etree import ElementTree
+from xml.sax.saxutils import escape
+
+import numpy as np
+import pandas as pd
+from openpyxl import Workbook, load_workbook
+from openpyxl.cell.cell import ILLEGAL_CHARACTERS_RE
+from openpyxl.utils import get_column_letter
+
+MAIN_NS = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+REL_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+PKG_REL_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+
+CHUNK_SIZE = 1 << 20
+ROW_NUMBER = re.compile(rb'<row r="(\d+)"')
+SHEET_DATA_END = re.compile(rb'</sheetData>|<sheetData/>')
+
+
+def _to_cell(value):
+    """转换成 openpyxl 可以写入的值"""
+    if isinstance(value, (list, tuple)):
+        return ", ".join(str(item) for item in value)
+    if value is None or (not isinstance(value, str) and pd.isna(value)):
+        return None
+    return value
+
+
+def _cell_xml(ref: str, value) -> str:
+    """单元格 XML（字符串使用内联字符串，与 openpyxl 只写模式一致）"""
+    value = _to_cell(value)
+    if value is None:
+        return ""
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, bool):
+        return f'<c r="{ref}" t="b"><v>{int(value)}</v></c>'
+    if isinstance(value, (int, float)):
+        return f'<c r="{ref}" t="n"><v>{value!r}</v></c>'
+    text = escape(ILLEGAL_CHARACTERS_RE.sub("", str(value)))
+    return f'<c r="{ref}" t="inlineStr"><is><t xml:space="preserve">{text}</t></is></c>'
+
+
+def _rows_xml(df: pd.DataFrame, header: List[str], first_row: int) -> bytes:
+    letters = [get_column_letter(i + 1) for i in range(len(header))]
+    parts = []
+    for offset, values in enumerate(df.reindex(columns=header).itertuples(index=False, name=None)):
+        row = first_row + offset
+        cells = "".join(_cell_xml(f"{letter}{row}", value) for letter, value in zip(letters, values))
+        parts.append(f'<row r="{row}">{cells}</row>')
+    return "".join(parts).encode("utf-8")
+
+
+def _sheet_paths(archive: zipfile.ZipFile) -> Dict[str, str]:
+    """sheet 名称 -> 压缩包内的 XML 路径"""
+    workbook = ElementTree.fromstring(archive.read("xl/workbook.xml"))
+    rels = ElementTree.fromstring(archive.read("xl/_rels/workbook.xml.rels"))
+    targets = {}
+    for rel in rels.iter(f"{{{PKG_REL_NS}}}Relationship"):
+        target = rel.get("Target")
+        targets[rel.get("Id")] = target.lstrip("/") if target.startswith("/") \
+            else posixpath.normpath(posixpath.join("xl", target))
+
+    paths = {}
+    for sheet in workbook.iter(f"{{{MAIN_NS}}}sheet"):
+        paths[sheet.get("name")] = targets[sheet.get(f"{{{REL_NS}}}id")]
+    return paths
+
+
+def _read_header(archive: zipfile.ZipFile, path: str) -> Optional[List[str]]:
+    """读取表头（第一行）；表头不是内联字符串时返回 None"""
+    with archive.open(path) as stream:
+        head = b""
+        while b"</row>" not in head:
+            chunk = stream.read(64 * 1024)
+            if not chunk:
+                return []
+            head += chunk
+    start = head.index(b"<row")
+    row = ElementTree.fromstring(head[start:head.index(b"</row>") + len(b"</row>")]
+                                 .replace(b"<row", f'<row xmlns="{MAIN_NS}"'.encode(), 1))
+    header = []
+    for cell in row.iter(f"{{{MAIN_NS}}}c"):
+        if cell.get("t") != "inlineStr":
+            return None
+        header.append("".join(node.text or "" for node in cell.iter(f"{{{MAIN_NS}}}t")))
+    return header
+
+
+def _copy_sheet(source, target, new_rows: pd.DataFrame, header: List[str]):
+    """流式复制 sheet XML，在 </sheetData> 前插入新行"""
+    last_row = 0
+    buffer = b""
+    while True:
+        chunk = source.read(CHUNK_SIZE)
+        buffer += chunk
+        for match in ROW_NUMBER.finditer(buffer):
+            last_row = max(last_row, int(match.group(1)))
+
+        end = SHEET_DATA_END.search(buffer)
+        if end:
+            rows = _rows_xml(new_rows, header, last_row + 1)
+            if end.group(0) == b"<sheetData/>":
+                rows = b"<sheetData>" + rows + b"</sheetData>"
+            else:
+                rows += b"</sheetData>"
+            target.write(buffer[:end.start()] + rows)
+            buffer = buffer[end.end():]
+            shutil.copyfileobj(source, target, CHUNK_SIZE)
+            target.write(buffer)
+            return
+        if not chunk:
+            raise ValueError("sheet XML 中没有 sheetData")
+
+        # 保留末尾一段，防止标签被分块截断
+        target.write(buffer[:-64])
+        buffer = buffer[-64:]
+
+
+def _append_in_place(filename: str, sheets: Dict[str, pd.DataFrame]) -> bool:
+    """直接在 XML 层追加新行，已有行不经过解析；不适用时返回 False"""
+    with zipfile.ZipFile(filename) as archive:
+        paths = _sheet_paths(archive)
+        headers = {}
+        for name, df in sheets.items():
+            if name not in paths:
+                return False
+            header = _read_header(archive, paths[name])
+            if header is None or any(column not in header for column in df.columns):
+                return False
+            headers[paths[name]] = (header, df)
+
+        temp_name = filename + ".tmp"
+        with zipfile.ZipFile(temp_name, "w", zipfile.ZIP_DEFLATED, compresslevel=1) as output:
+            for item in archive.infolist():
+                with archive.open(item) as source, output.open(item.filename, "w") as target:
+                    if item.filename in headers:
+                        header, df = headers[item.filename]
+                        _copy_sheet(source, target, df, header)
+                    else:
+                        shutil.copyfileobj(source, target, CHUNK_SIZE)
+
+    os.replace(temp_name, filename)
+    return True
+
+
+def _rewrite_workbook(filename: str, sheets: Dict[str, pd.DataFrame]):
+    """只读模式逐行读出旧内容、只写模式逐行写出，内存占用与已有行数无关"""
+    sheet_order: List[str] = []
+    existing = None
+    if os.path.exists(filename):
+        existing = load_workbook(filename, read_only=True)
+        sheet_order = list(existing.sheetnames)
+    sheet_order += [name for name in sheets if name not in sheet_order]
+
+    output = Workbook(write_only=True)
+    for name in sheet_order:
+        new_rows = sheets.get(name)
+        sheet = output.create_sheet(title=name)
+
+        rows = iter(())
+        header: List[str] = []
+        if existing is not None and name in existing.sheetnames:
+            rows = existing[name].iter_rows(values_only=True)
+            header = [cell for cell in next(rows, ()) if cell is not None]
+
+        if new_rows is not None:
+            header += [column for column in new_rows.columns if column not in header]
+        sheet.append(header)
+
+        for row in rows:
+            sheet.append(row)
+
+        if new_rows is not None and not new_rows.empty:
+            new_rows = new_rows.reindex(columns=header)
+            for values in new_rows.itertuples(index=False, name=None):
+                sheet.append([_to_cell(value) for value in values])
+
+    if existing is not None:
+        existing.close()
+
+    # 先写临时文件再替换，中途出错不会损坏原工作簿
+    temp_name = filename + ".tmp"
+    output.save(temp_name)
+    os.replace(temp_name, filename)
+
+
+def job_sheets(df: pd.DataFrame) -> Dict[str, pd.DataFrame]:
+    """职位导出的各个 sheet：所有职位、英文职位、按工作类型分类的英文职位
+
+    近似重复的职位只出现在 All Jobs 中（duplicate_of 列指向原始职位）。
+    """
+    sheets = {'All Jobs': df}
+    english_jobs = df[df['is_english'] == True]
+    if 'duplicate_of' in df.columns:
+        english_jobs = english_jobs[english_jobs['duplicate_of'].isna()]
+    sheets['English Jobs'] = english_jobs
+    for work_type in ['hybrid', 'on-site']:
+        type_jobs = english_jobs[english_jobs['work_arrangement'] == work_type]
+        if not type_jobs.empty:
+            sheets[f'{work_type.title()} Jobs'] = type_jobs
+    return sheets
+
+
+def write_workbook(filename: str, sheets: Dict[str, pd.DataFrame]):
+    """整本写出工作簿"""
+    with pd.ExcelWriter(filename, engine='openpyxl') as writer:
+        for sheet_name, sheet_df in sheets.items():
+            sheet_df.to_excel(writer, sheet_name=sheet_name, index=False)
+
+
+def append_rows(filename: str, sheets: Dict[str, pd.DataFrame]):
+    """向滚动工作簿的各个 sheet 追加新行
+
+    已有 sheet 且列不变时直接在 XML 层追加（已有行只做解压/压缩，不解析）；
+    第一次写入、出现新 sheet 或新列时，用 openpyxl 流式重写整个工作簿。
+    两种方式内存占用都与已有行数无关。
+    """
+    if os.path.exists(filename) and _append_in_place(filename, sheets):
+        return
+    _rewrite_workbook(filename, sheets)
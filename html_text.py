@@ -0,0 +1,118 @@
+"""职位描述 HTML 转纯文本 - 去掉标签并合并空白
+
+结果与 BeautifulSoup(html, 'html.parser').get_text() 合并空白后一致：
+脚本、样式、模板和注释内容不计入。纯文本描述（爬取时 .text 得到的）不经过解析器。
+"""
+import re
+from html.parser import HTMLParser
+from typing import Callable, Dict, List
+
+SKIP_TAGS = ("script", "style", "template")
+
+# 与 KeywordMatcher 的 \b 边界一致的词
+WORD_PATTERN = re.compile(r"\w+")
+
+
+class _TextCollector(HTMLParser):
+    """标准库流式解析器，只收集正文文本"""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.parts: List[str] = []
+        self._skip_depth = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in SKIP_TAGS:
+            self._skip_depth += 1
+
+    def handle_endtag(self, tag):
+        if tag in SKIP_TAGS and self._skip_depth:
+            self._skip_depth -= 1
+
+    def handle_data(self, data):
+        if not self._skip_depth:
+            self.parts.append(data)
+
+
+def _stream_text(html: str) -> str:
+    collector = _TextCollector()
+    collector.feed(html)
+    collector.close()
+    return "".join(collector.parts)
+
+
+def _lxml_text(html: str) -> str:
+    from lxml import etree
+    from lxml import html as lxml_html
+
+    try:
+        root = lxml_html.document_fromstring(html)
+    except etree.ParserError:
+        # 只有注释或空白的片段
+        return ""
+    etree.strip_elements(root, *SKIP_TAGS, with_tail=False)
+    return root.text_content()
+
+
+def _selectolax_text(html: str) -> str:
+    from selectolax.lexbor import LexborHTMLParser
+
+    tree = LexborHTMLParser(html)
+    tree.strip_tags(list(SKIP_TAGS))
+    return tree.root.text(deep=True) if tree.root is not None else ""
+
+
+def _bs4_text(html: str) -> str:
+    from bs4 import BeautifulSoup
+
+    return BeautifulSoup(html, 'html.parser').get_text()
+
+
+BACKENDS: Dict[str, Callable[[str], str]] = {
+    "selectolax": _selectolax_text,
+    "lxml": _lxml_text,
+    "stream": _stream_text,
+    "bs4": _bs4_text,
+}
+
+
+def available_backends() -> List[str]:
+    """当前环境可以使用的后端（按速度从快到慢）"""
+    available = []
+    for name, backend in BACKENDS.items():
+        try:
+            backend("<p>x</p>")
+        except ImportError:
+            continue
+        available.append(name)
+    return available
+
+
+# 默认后端的优先顺序，都不可用时退回标准库流式解析器
+PREFERRED_BACKENDS = ("lxml", "selectolax", "stream")
+_default_backend = None
+
+
+def default_backend() -> str:
+    global _default_backend
+    if _default_backend is None:
+        available = available_backends()
+        _default_backend = next(name for name in PREFERRED_BACKENDS if name in available)
+    return _default_backend
+
+
+def html_to_text(html: str, backend: str = None) -> str:
+    """HTML 转纯文本，空白合并为单个空格"""
+    if not html:
+        return ""
+    # 没有标签和实体的纯文本无需解析
+    if "<" not in html and "&" not in html:
+        text = html
+    else:
+        text = BACKENDS[backend or default_backend()](html)
+    return " ".join(text.split())
+
+
+def words(html: str) -> List[str]:
+    """纯文本中的小写词（查重词组和全文检索共用同一种分词）"""
+    return WORD_PATTERN.findall(html_to_text(html).lower())
@@ -1,89 +1,280 @@
 import re
-import pandas as pd
-from typing import Dict, List, Tuple
-import nltk
-from bs4 import BeautifulSoup
+import itertools
+import multiprocessing
+import os
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from analysis_cache import AnalysisCache, content_hash
+from config import ENGLISH_DETECTION
+from keyword_matcher import get_matcher
+from language_id import get_identifier
+from html_text import html_to_text
+
+
+# 进程池中每个工作进程各自持有一个分析器
+_worker_analyzer = None
+
+
+def _init_worker(analyzer_class, criteria: Dict):
+    global _worker_analyzer
+    _worker_analyzer = analyzer_class(criteria)
+
+
+def _analyze_in_worker(chunk: Tuple[List[str], List[Optional[bool]]]) -> Tuple[List[Dict], List[bool]]:
+    return _worker_analyzer._analyze_uncached(*chunk)
+
+
+def _chunks(items: Iterable, size: int) -> Iterator[List]:
+    items = iter(items)
+    while True:
+        chunk = list(itertools.islice(items, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _skill_weights(skills) -> Dict[str, float]:
+    """{技能: 权重}，列表形式的配置权重均为 1"""
+    if isinstance(skills, dict):
+        return {skill: float(weight) for skill, weight in skills.items()}
+    return {skill: 1.0 for skill in skills}
 
-# 下载NLTK数据（第一次运行需要）
-try:
-    nltk.data.find('tokenizers/punkt')
-except LookupError:
-    nltk.download('punkt')
 
 class JobAnalyzer:
-    def __init__(self, criteria: Dict):
+    # 评分规则变化时加一，旧的缓存结果随之失效
+    VERSION = 4
+    # 常见英文单词
+    ENGLISH_KEYWORDS = [
+        "experience", "skills", "development",
+        "team", "project", "requirements",
+        "responsibilities", "software", "engineering"
+    ]
+    # 薪资: 金额（€ / EUR，或带币种、范围、"+ bonus"/"p.a." 的 60k）或英文、德文的薪资说法；"4k screens" 不算
+    SALARY_PATTERN = re.compile(
+        r'€|\d[\d.,]*\s?k?\s?(?:eur|euro|usd|chf)\b|\b(?:eur|usd|chf)\s?\d'
+        r'|\b\d+(?:[.,]\d+)?\s?k\s?(?:-|–|to|bis)\s?\d+(?:[.,]\d+)?\s?k\b'
+        r'|\b\d+k\s?(?:\+\s?bonus|p\.\s?a\.|per (?:year|annum)|brutto|gross)'
+        r'|\b(?:salary|compensation|pay range|gehalt|jahresgehalt|vergütung|bruttojahresgehalt)\b'
+    )
+    # 签证担保按分句判断：否定和要求只作用于所在分句
+    # （"EU citizens do not need a visa; for everyone else we offer visa sponsorship" 仍算提供担保）
+    CLAUSE_SPLIT = re.compile(r'[.;!?\n]+\s|[;!?\n]+|,\s*(?:but|however|aber|jedoch)\b')
+    # 提供担保: 担保名词或提供、支持的动词紧挨签证/搬迁，单独的 visa、relocation（"Visa and Mastercard"）不算
+    SPONSORSHIP_OFFER = re.compile(
+        r"\b(?:visa|work permit|blue card)\s+(?:sponsor\w*|support|assistance|application support)"
+        r"|\bsponsor\w*\s+(?:\w+\s+){0,3}?(?:visas?|work permits?|blue card)\b"
+        r"|\b(?:help|support|assist)\w*\s+(?:\w+\s+){0,4}?(?:visas?|work permits?|blue card|relocation|relocating)\b"
+        r"|\breloca(?:tion|te)\s+(?:support|package|assistance|bonus|budget|allowance|help|costs)"
+        r"|\bvisum[\s-]*(?:sponsoring|unterstützung)"
+        r"|\bunterstütz\w*\s+(?:\w+\s+){0,4}?(?:beim|bei der|bei dem|mit dem)\s+(?:\w+\s+)?"
+        r"(?:visum|blauen karte|umzug|arbeitserlaubnis|aufenthaltstitel)"
+        r"|\bumzugs(?:hilfe|kosten|unterstützung|pauschale)\b"
+    )
+    # 不提供担保: 关键词前后的否定（"no visa sponsorship"、"relocation is not possible"），
+    # 以及要求已有签证或工作许可（"must hold a valid visa"、"gültiges Visum"）
+    SPONSORSHIP_DENIAL = re.compile(
+        r"\b(?:no|not|cannot|can't|unable to|do not|don't|won't|without)\s+(?:\w+\s+){0,3}?"
+        r"(?:sponsor|visa|relocat)\w*"
+        r"|\b(?:visa\w*|visum\w*|sponsor\w*|relocation)(?:[\s-]+\w+){0,4}?\s*[:,–-]?\s*"
+        r"(?:(?:is|are|can|will)\s+)?(?:not|no longer|nicht|leider nicht)\s+"
+        r"(?:\w+\s+)?(?:available|possible|offered|provided|supported|möglich|angeboten)"
+        r"|\b(?:visa\w*|sponsor\w*|relocation)(?:\s+\w+){0,3}?\s+(?:unavailable|cannot be (?:offered|provided))"
+        r"|\bkeine?[nmr]?\s+(?:\w+\s+){0,3}?(?:visum|visa|sponsoring|arbeitserlaubnis|umzug)\w*"
+        r"|\b(?:valid|existing|current|gültig\w*|bestehend\w*)\s+(?:\w+\s+){0,2}?"
+        r"(?:visas?|visum|work permit|right to work|arbeitserlaubnis|aufenthaltstitel)"
+        r"|\b(?:must|need to|required to|should)\s+(?:already\s+)?(?:hold|have|possess)\s+(?:\w+\s+){0,3}?"
+        r"(?:visas?|work permit|right to work)"
+    )
+
+    @classmethod
+    def sponsorship(cls, clean_text: str) -> Tuple[bool, bool]:
+        """(提供担保, 不提供担保)：有分句提供担保即算提供；分句中有否定或要求时该分句不算提供"""
+        offered = denied = False
+        for clause in cls.CLAUSE_SPLIT.split(clean_text):
+            if cls.SPONSORSHIP_DENIAL.search(clause):
+                denied = True
+            elif cls.SPONSORSHIP_OFFER.search(clause):
+                offered = True
+        return offered, denied and not offered
+
+    def __init__(self, criteria: Dict, cache: Optional[AnalysisCache] = None):
         self.criteria = criteria
+        # 英文判断只取决于 ENGLISH_DETECTION，改动技能标准时仍可复用
+        self.cache = cache
+        self.english_key = content_hash([ENGLISH_DETECTION, self.VERSION])
+        self.analysis_key = content_hash([criteria, ENGLISH_DETECTION, self.VERSION])
+
+        # 分析标准只编译一次：技能权重、同义词展开后的别名 -> 技能
+        self.required_skills = _skill_weights(criteria.get("required_skills", []))
+        self.optional_skills = _skill_weights(criteria.get("optional_skills", []))
+        synonyms = criteria.get("skill_synonyms", {})
+        self.skill_aliases: Dict[str, str] = {}
+        for skill in list(self.required_skills) + list(self.optional_skills):
+            for alias in [skill] + list(synonyms.get(skill, [])):
+                self.skill_aliases.setdefault(alias.lower(), skill)
+        self.required_weight = sum(self.required_skills.values())
+        self.total_weight = self.required_weight + sum(self.optional_skills.values())
+        self.min_ratio = criteria.get("min_skill_match_ratio", 0.5)
+
+        # 英文关键词和所有技能别名一起编译，每个描述只扫描一次
+        self.matcher = get_matcher(english=self.ENGLISH_KEYWORDS, skills=list(self.skill_aliases))
         
     def is_english_job_description(self, text: str) -> bool:
         """检测职位描述是否为英文"""
         if not text:
             return False
-            
-        # 检查常见英文单词
-        english_patterns = [
-            r'\bexperience\b', r'\bskills\b', r'\bdevelopment\b', 
-            r'\bteam\b', r'\bproject\b', r'\brequirements\b',
-            r'\bresponsibilities\b', r'\bsoftware\b', r'\bengineering\b'
-        ]
-        
-        english_count = sum(1 for pattern in english_patterns 
-                          if re.search(pattern, text.lower()))
+        return self._is_english(text, self.matcher.scan(text))
+    
+    def _is_english(self, text: str, matched: Dict[str, List[str]]) -> bool:
+        """按 ENGLISH_DETECTION["method"] 判断：语言识别的英文占比，或英文关键词数量"""
+        if ENGLISH_DETECTION.get("method", "ngram") == "ngram":
+            return get_identifier().share(text, "en") >= ENGLISH_DETECTION["min_english_share"]
         
         # 如果找到足够多的英文关键词，认为是英文职位
-        return english_count >= 5
+        return len(matched["english"]) >= 5
     
     def analyze_job_description(self, description: str) -> Dict:
         """分析职位描述"""
-        if not description:
-            return {"is_qualified": False, "reason": "No description"}
+        return self.analyze_batch([description])[0]
+    
+    def analyze_batch(self, descriptions: List[str]) -> List[Dict]:
+        """分析一批职位描述；ngram 英文检测整批一次完成，结果与逐个调用一致"""
+        return self._with_cache(descriptions, self._analyze_uncached)
+    
+    def _with_cache(self, descriptions: List[str], compute: Callable) -> List[Dict]:
+        """先查缓存，只计算未命中的描述；完整结果未命中时仍可复用缓存的英文判断"""
+        if self.cache is None:
+            return compute(descriptions, [None] * len(descriptions))[0]
         
+        hashes = [content_hash(description or "") for description in descriptions]
+        keys = [f"analysis:{digest}:{self.analysis_key}" for digest in hashes]
+        results = self.cache.get_many(keys)
+        # 同一批中内容相同的描述只分析一次，结果按缓存键分给每个位置
+        first = {}
+        for i, key in enumerate(keys):
+            if key not in results:
+                first.setdefault(key, i)
+        missing = list(first.values())
+        if missing:
+            english_keys = [f"english:{hashes[i]}:{self.english_key}" for i in missing]
+            known = self.cache.get_many(english_keys)
+            computed, english = compute([descriptions[i] for i in missing], [known.get(key) for key in english_keys])
+            new_results = [(keys[i], result) for i, result in zip(missing, computed)]
+            self.cache.put_many(new_results + [
+                (key, is_english) for key, is_english in zip(english_keys, english) if key not in known
+            ])
+            results.update(new_results)
+        # 返回副本，调用方修改结果不影响同一批中内容相同的描述
+        return [dict(results[key]) for key in keys]
+    
+    def _analyze_uncached(self, descriptions: List[str],
+                          english: List[Optional[bool]]) -> Tuple[List[Dict], List[bool]]:
+        """分析一批描述，english 中已知的英文判断（来自缓存）不再检测，返回 (结果, 英文判断)"""
         # 清理HTML标签
-        soup = BeautifulSoup(description, 'html.parser')
-        clean_text = soup.get_text().lower()
+        clean_texts = [html_to_text(description).lower() if description else "" for description in descriptions]
+        found = [self.matcher.matched_keywords(text) for text in clean_texts]
         
+        english = list(english)
+        unknown = [i for i, is_english in enumerate(english) if is_english is None]
+        if ENGLISH_DETECTION.get("method", "ngram") == "ngram":
+            shares = get_identifier().share_many([clean_texts[i] for i in unknown], "en") if unknown else []
+            for i, share in zip(unknown, list(shares)):
+                english[i] = bool(share >= ENGLISH_DETECTION["min_english_share"])
+        else:
+            for i in unknown:
+                english[i] = sum(keyword in found[i] for keyword in self.ENGLISH_KEYWORDS) >= 5
+        
+        results = [
+            self._score(text, keywords, is_english) if description else {"is_qualified": False, "reason": "No description"}
+            for description, text, keywords, is_english in zip(descriptions, clean_texts, found, english)
+        ]
+        return results, english
+    
+    def _score(self, clean_text: str, found: set, is_english: bool) -> Dict:
+        """按已编译的标准给一个描述评分"""
         # 检查是否为英文
         if self.criteria.get("english_only", True):
-            if not self.is_english_job_description(clean_text):
+            if not is_english:
                 return {"is_qualified": False, "reason": "Not English job description"}
         
-        # 检查技能匹配
-        required_skills = self.criteria.get("required_skills", [])
-        matched_skills = []
-        missing_skills = []
+        # 检查技能匹配（按权重）
+        hits = {self.skill_aliases[alias] for alias in found if alias in self.skill_aliases}
+        matched_skills = [skill for skill in self.required_skills if skill in hits]
+        missing_skills = [skill for skill in self.required_skills if skill not in hits]
+        optional_skills = [skill for skill in self.optional_skills if skill in hits]
         
-        for skill in required_skills:
-            if re.search(r'\b' + re.escape(skill.lower()) + r'\b', clean_text):
-                matched_skills.append(skill)
-            else:
-                missing_skills.append(skill)
+        matched_weight = sum(self.required_skills[skill] for skill in matched_skills)
+        skill_match_ratio = round(matched_weight / self.required_weight, 2) if self.required_weight else 1.0
+        optional_weight = sum(self.optional_skills[skill] for skill in optional_skills)
+        skill_score = round((matched_weight + optional_weight) / self.total_weight, 2) if self.total_weight else 1.0
         
+        # 薪资和签证信息
+        salary_mentioned = bool(self.SALARY_PATTERN.search(clean_text))
+        sponsorship_mentioned, sponsorship_denied = self.sponsorship(clean_text)
         
+        reasons = []
+        if skill_match_ratio < self.min_ratio:
+            reasons.append(f"Skill match {skill_match_ratio:.0%} below {self.min_ratio:.0%}")
+        if self.criteria.get("require_sponsorship") and not sponsorship_mentioned:
+            reasons.append("Visa sponsorship not offered" if sponsorship_denied else "No visa sponsorship mentioned")
         
-      
-    
+        is_qualified = not reasons
         
         return {
             "is_qualified": is_qualified,
+            "skill_score": skill_score,
             "skill_match_ratio": skill_match_ratio,
             "matched_skills": matched_skills,
             "missing_skills": missing_skills,
+            "optional_skills": optional_skills,
             "salary_mentioned": salary_mentioned,
             "sponsorship_mentioned": sponsorship_mentioned,
-            "is_english": self.is_english_job_description(clean_text),
+            "is_english": is_english,
             "rejection_reason": "; ".join(reasons) if reasons else "Qualified"
         }
     
-    def save_to_excel(self, jobs_data: List[Dict], filename: str = "linkedin_jobs.xlsx"):
-        """保存职位数据到Excel"""
+    def analyze_many(self, descriptions: Iterable[str], workers: int = None,
+                     chunksize: int = 128) -> Iterator[Dict]:
+        """批量分析职位描述，结果按输入顺序流式返回，与逐个调用结果一致"""
+        descriptions = iter(descriptions)
+        workers = workers or os.cpu_count() or 1
+        
+        # 不足两个分块的小批量直接串行，不启动进程池
+        head = list(itertools.islice(descriptions, chunksize * 2))
+        if workers <= 1 or len(head) < chunksize * 2:
+            for chunk in _chunks(itertools.chain(head, descriptions), chunksize):
+                yield from self.analyze_batch(chunk)
+            return
+        
+        with multiprocessing.Pool(workers, initializer=_init_worker,
+                                  initargs=(type(self), self.criteria)) as pool:
+            # 缓存只在主进程读写，工作进程只计算未命中的描述
+            def compute(texts: List[str], english: List[Optional[bool]]) -> Tuple[List[Dict], List[bool]]:
+                results, flags = [], []
+                for chunk_results, chunk_flags in pool.imap(
+                        _analyze_in_worker, zip(_chunks(texts, chunksize), _chunks(english, chunksize))):
+                    results.extend(chunk_results)
+                    flags.extend(chunk_flags)
+                return results, flags
+            
+            for chunk in _chunks(itertools.chain(head, descriptions), chunksize * workers * 2):
+                yield from self._with_cache(chunk, compute)
+    
+    def save_to_excel(self, jobs_data: List[Dict], filename: str = "linkedin_jobs.xlsx",
+                      append: bool = False):
+        """保存职位数据到Excel，append=True 时把 jobs_data 追加到已有工作簿"""
         if not jobs_data:
             print("No data to save")
             return
         
+        import pandas as pd
+        from excel_export import append_rows
+        
         df = pd.DataFrame(jobs_data)
         
         # 重新排列列的顺序
         columns_order = [
-            'title', 'company', 'location', 'is_qualified', 'skill_match_ratio',
+            'title', 'company', 'location', 'is_qualified', 'skill_score', 'skill_match_ratio',
             'salary_mentioned', 'sponsorship_mentioned', 'is_english',
             'matched_skills', 'missing_skills', 'rejection_reason', 'job_url'
         ]
@@ -94,14 +285,17 @@ class JobAnalyzer:
         
         df = df[existing_columns + other_columns]
         
+        # 创建合格职位的sheet
+        qualified_jobs = df[df['is_qualified'] == True]
+        
         # 保存到Excel
-        with pd.ExcelWriter(filename, engine='openpyxl') as writer:
-            df.to_excel(writer, sheet_name='All Jobs', index=False)
-            
-            # 创建合格职位的sheet
-            qualified_jobs = df[df['is_qualified'] == True]
-            qualified_jobs.to_excel(writer, sheet_name='Qualified Jobs', index=False)
+        if append:
+            append_rows(filename, {'All Jobs': df, 'Qualified Jobs': qualified_jobs})
+        else:
+            with pd.ExcelWriter(filename, engine='openpyxl') as writer:
+                df.to_excel(writer, sheet_name='All Jobs', index=False)
+                qualified_jobs.to_excel(writer, sheet_name='Qualified Jobs', index=False)
         
-        print(f"数据已保存到 {filename}")
+        print(f"数据已{'追加' if append else '保存'}到 {filename}")
         print(f"总职位数: {len(df)}")
         print(f"合格职位数: {len(qualified_jobs)}")
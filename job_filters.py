@@ -0,0 +1,138 @@
+from typing import Dict
+
+import numpy as np
+import pandas as pd
+
+from config import ENGLISH_DETECTION, LOCATION_FILTER
+from keyword_matcher import get_matcher
+from language_id import get_identifier
+
+
+def uses_ngram_detection() -> bool:
+    return ENGLISH_DETECTION.get("method", "ngram") == "ngram"
+
+
+def english_threshold() -> float:
+    """当前检测方式下判定为英文的最低分数"""
+    if uses_ngram_detection():
+        return ENGLISH_DETECTION["min_english_share"]
+    return ENGLISH_DETECTION["min_english_score"]
+
+
+def detect_english(text: str) -> float:
+    """检测英文职位描述：ngram 方式返回英文内容所占比例，keywords 方式返回命中英文关键词的比例"""
+    if not text:
+        return 0.0
+
+    if uses_ngram_detection():
+        return get_identifier().share(text, "en")
+
+    keywords = ENGLISH_DETECTION["required_keywords"]
+    matcher = get_matcher(english=keywords)
+    matches = len(matcher.scan(text)["english"])
+
+    return matches / len(keywords)
+
+
+def extract_work_arrangement(description: str, location_text: str) -> str:
+    """提取工作安排类型"""
+    text = (description + " " + location_text).lower()
+
+    if "hybrid" in text:
+        return "hybrid"
+    elif "on-site" in text or "on site" in text or "office" in text:
+        return "on-site"
+    elif "remote" in text or "work from home" in text:
+        return "remote"
+    else:
+        return "unknown"
+
+
+def split_location(location_text: str) -> str:
+    """从 "公司 · 地点 · 时间" 形式的文本中取出地点"""
+    if '·' in location_text:
+        parts = location_text.split('·')
+        if len(parts) > 1:
+            return parts[1].strip()
+    return location_text.strip()
+
+
+# 小写后去掉变音符号，"München" 和 "Munchen"、"Düsseldorf" 和 "Dusseldorf" 相同
+_FOLD = str.maketrans({"ä": "a", "ö": "o", "ü": "u", "ß": "ss"})
+
+
+def _fold(text: str) -> str:
+    return text.lower().translate(_FOLD)
+
+
+def city_of(location: str) -> str:
+    """从地点文本中识别目标城市（包括 city_aliases 中的德文、英文写法），返回 allowed_cities 中的名称"""
+    location = _fold(location or "")
+    aliases = LOCATION_FILTER.get("city_aliases", {})
+    for city in LOCATION_FILTER["allowed_cities"]:
+        if any(_fold(name) in location for name in [city] + aliases.get(city, [])):
+            return city
+    return "other"
+
+
+def enrich_job(job_data: Dict) -> Dict:
+    """补充英文评分和工作类型字段（与爬取时的字段一致）"""
+    description = job_data.get('description', '')
+    english_score = detect_english(description)
+
+    job_data['english_score'] = round(english_score, 2)
+    job_data['is_english'] = english_score >= english_threshold()
+    job_data['work_arrangement'] = extract_work_arrangement(
+        description,
+        job_data.get('location', '')
+    )
+    return job_data
+
+
+def keyword_matrix(texts: pd.Series, keywords) -> np.ndarray:
+    """整列匹配关键词，返回 (职位数 × 关键词数) 的布尔矩阵，列顺序与 keywords 一致"""
+    matcher = get_matcher(keywords=keywords)
+    unique = list(dict.fromkeys(keyword.lower() for keyword in keywords))
+    index = {keyword: i for i, keyword in enumerate(unique)}
+    found = np.zeros((len(texts), len(unique)), dtype=bool)
+
+    if matcher.pattern is not None:
+        # 每行只扫描一次，再按关键词整列填充
+        hits = texts.reset_index(drop=True).str.lower().str.findall(matcher.pattern)
+        hits = hits.explode().dropna()
+        for keyword, rows in hits.groupby(hits).groups.items():
+            for matched in matcher.expand(keyword):
+                found[rows.to_numpy(), index[matched]] = True
+
+    # 还原成配置顺序（重复的关键词各占一列）
+    return found[:, [index[keyword.lower()] for keyword in keywords]]
+
+
+def enrich_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """enrich_job 的整表版本，结果与逐行调用完全一致"""
+    descriptions = df['description'].fillna("").astype(str) if 'description' in df else pd.Series("", index=df.index)
+    locations = df['location'].fillna("").astype(str) if 'location' in df else pd.Series("", index=df.index)
+
+    if uses_ngram_detection():
+        english_score = get_identifier().share_many(descriptions.tolist(), "en")
+    else:
+        keywords = ENGLISH_DETECTION["required_keywords"]
+        english_score = keyword_matrix(descriptions, keywords).sum(axis=1) / len(keywords)
+
+    text = (descriptions + " " + locations).str.lower()
+    conditions = [
+        text.str.contains("hybrid", regex=False),
+        text.str.contains("on-site", regex=False)
+        | text.str.contains("on site", regex=False)
+        | text.str.contains("office", regex=False),
+        text.str.contains("remote", regex=False)
+        | text.str.contains("work from home", regex=False),
+    ]
+
+    df = df.copy()
+    # np.round 与内置 round 在个别值上不同，按唯一值用内置 round 保证一致
+    scores, inverse = np.unique(english_score, return_inverse=True)
+    df['english_score'] = np.array([round(score, 2) for score in scores])[inverse]
+    df['is_english'] = english_score >= english_threshold()
+    df['work_arrangement'] = np.select(conditions, ["hybrid", "on-site", "remote"], default="unknown")
+    return df
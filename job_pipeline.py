@@ -0,0 +1,119 @@
+"""职位处理流水线 - 爬取 → 查重 → 分析 → 入库，逐个职位流过各阶段
+
+每个阶段是一个生成器函数：接收职位迭代器，逐个处理后交给下一个阶段。
+上游每产出一个职位，下游就把它处理到入库为止，然后才去取下一个，
+因此内存中只有当前这一个职位，中途退出时已产出的职位都已写入职位库。
+某个职位在某一阶段出错时只丢弃该职位，流水线继续运行。
+
+    for job in job_pipeline.run(source, map_stage("persist", persist(store))):
+        ...
+
+BackgroundWorker 在后台线程运行同样的阶段：爬取循环交出职位后立即继续，
+分析和入库在安全延迟、页面等待期间完成（这些等待不占用 GIL）。
+"""
+import queue
+import threading
+from contextlib import nullcontext
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
+
+import job_filters
+
+Stage = Callable[[Iterable[Dict]], Iterator[Dict]]
+
+
+def run(source: Iterable[Dict], *stages: Stage) -> Iterator[Dict]:
+    """把各阶段依次串接在 source 后面"""
+    jobs = iter(source)
+    for stage in stages:
+        jobs = stage(jobs)
+    return jobs
+
+
+def map_stage(name: str, func: Callable[[Dict], Optional[Dict]], timer=None, profile: bool = False) -> Stage:
+    """逐个职位调用 func 的阶段；func 返回 None 时丢弃该职位，耗时计入 timer 的同名阶段"""
+    def stage(jobs: Iterable[Dict]) -> Iterator[Dict]:
+        for job in jobs:
+            try:
+                # 计时只包住处理本身，yield 之后的下游耗时不计入本阶段
+                with timer.stage(name, profile=profile) if timer is not None else nullcontext():
+                    job = func(job)
+            except Exception as e:
+                print(f"⚠️ {name} 阶段出错，跳过该职位: {e}")
+                continue
+            if job is not None:
+                yield job
+    return stage
+
+
+def mark_duplicates(index) -> Callable[[Dict], Dict]:
+    """查重：转载或多城市发布的近似重复职位记录 duplicate_of"""
+    def func(job: Dict) -> Dict:
+        duplicate_of = index.check(job['job_id'], job.get('description', ''))
+        if duplicate_of:
+            job['duplicate_of'] = duplicate_of
+        return job
+    return func
+
+
+def enrich(job: Dict) -> Dict:
+    """补充英文评分和工作类型（重复职位同样补充，导出和筛选时字段不为空）"""
+    return job_filters.enrich_job(job)
+
+
+def persist(store, search_index=None) -> Callable[[Dict], Dict]:
+    """写入职位库（立即提交）并更新全文索引"""
+    def func(job: Dict) -> Dict:
+        store.add_job(job)
+        if search_index is not None:
+            search_index.index_new()
+        return job
+    return func
+
+
+_DONE = object()
+
+
+class BackgroundWorker:
+    """后台线程中的流水线，通过有界队列接收职位
+
+    SQLite 连接不能跨线程使用，工作线程用 open_store() 打开自己的职位库连接，
+    再用 build_stages(store) 创建各阶段；处理完的职位交给 on_done。
+    队列满时 submit 阻塞，爬取不会领先处理太多；close 处理完队列中剩余的职位后返回。
+    """
+
+    def __init__(self, open_store: Callable, build_stages: Callable[..., List[Stage]],
+                 on_done: Callable[[Dict], None], queue_size: int = 4):
+        self.queue: "queue.Queue" = queue.Queue(maxsize=queue_size)
+        self.thread = threading.Thread(target=self._run, args=(open_store, build_stages, on_done),
+                                       name="job-pipeline", daemon=True)
+        self.closed = False
+        self.thread.start()
+
+    def submit(self, job: Dict):
+        self.queue.put(job)
+
+    def _jobs(self) -> Iterator[Dict]:
+        return iter(self.queue.get, _DONE)
+
+    def _run(self, open_store, build_stages, on_done):
+        store = None
+        try:
+            store = open_store()
+            for job in run(self._jobs(), *build_stages(store)):
+                on_done(job)
+        except Exception as e:
+            print(f"❌ 后台处理线程出错，剩余职位不再处理: {e}")
+            # 继续取走队列中的职位，避免 submit 一直阻塞
+            for _ in self._jobs():
+                pass
+        finally:
+            if store is not None:
+                store.close()
+
+    def close(self):
+        """等待队列中的职位全部处理完（可以重复调用）"""
+        if self.closed:
+            return
+        self.closed = True
+        self.queue.put(_DONE)
+        self.thread.join()
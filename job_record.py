@@ -0,0 +1,121 @@
+"""紧凑的职位记录 - 在内存中保存大量历史职位时代替职位字典
+
+- slots 数据类，实例没有 __dict__，字段名不在每条记录里重复
+- 公司、地点、城市、工作类型取值有限，做字符串驻留，相同取值只保存一份
+- scraped_at 保存为整数秒（朴素时间按 UTC 编码，与 "%Y-%m-%d %H:%M:%S" 字符串往返不变）
+- 描述 zlib 压缩保存，访问 description 时才解压；不需要描述时可以不加载
+"""
+import sys
+import zlib
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from functools import lru_cache
+from operator import attrgetter
+from typing import TYPE_CHECKING, Dict, Iterable, Optional
+
+from job_filters import city_of
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+TIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+# DataFrame 中转为 category 类型的低基数字段
+CATEGORY_COLUMNS = ['company', 'location', 'city', 'work_arrangement']
+
+
+def to_epoch(text: Optional[str]) -> Optional[int]:
+    if not text:
+        return None
+    return int(datetime.fromisoformat(str(text)).replace(tzinfo=timezone.utc).timestamp())
+
+
+def from_epoch(seconds: Optional[int]) -> Optional[str]:
+    if seconds is None:
+        return None
+    return datetime.fromtimestamp(seconds, timezone.utc).strftime(TIME_FORMAT)
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    return sys.intern(value) if value else value
+
+
+@lru_cache(maxsize=4096)
+def _city(location: str) -> str:
+    return sys.intern(city_of(location))
+
+
+@dataclass(slots=True)
+class JobRecord:
+    job_id: str
+    title: str
+    company: str
+    location: str
+    city: str
+    work_arrangement: Optional[str]
+    is_english: Optional[bool]
+    english_score: Optional[float]
+    job_url: str
+    scraped_at: Optional[int]
+    duplicate_of: Optional[str] = None
+    compressed_description: Optional[bytes] = None
+
+    @property
+    def description(self) -> str:
+        if not self.compressed_description:
+            return ""
+        return zlib.decompress(self.compressed_description).decode("utf-8")
+
+    @classmethod
+    def from_dict(cls, job: Dict, with_description: bool = True) -> "JobRecord":
+        """从职位字典（爬取结果或职位库的一行）创建"""
+        location = job.get('location') or ""
+        is_english = job.get('is_english')
+        description = job.get('description') if with_description else None
+        return cls(
+            job_id=job.get('job_id') or "",
+            title=job.get('title') or "",
+            company=_intern(job.get('company') or ""),
+            location=_intern(location),
+            city=_city(location),
+            work_arrangement=_intern(job.get('work_arrangement')),
+            is_english=None if is_english is None else bool(is_english),
+            english_score=job.get('english_score'),
+            job_url=job.get('job_url') or "",
+            scraped_at=to_epoch(job.get('scraped_at')),
+            duplicate_of=job.get('duplicate_of'),
+            compressed_description=zlib.compress(description.encode("utf-8")) if description else None,
+        )
+
+    def to_dict(self, with_description: bool = True) -> Dict:
+        """还原成与爬取结果相同字段的职位字典"""
+        job = {
+            'job_id': self.job_id, 'title': self.title, 'company': self.company,
+            'location': self.location, 'work_arrangement': self.work_arrangement,
+            'is_english': self.is_english, 'english_score': self.english_score,
+            'job_url': self.job_url, 'scraped_at': from_epoch(self.scraped_at),
+            'duplicate_of': self.duplicate_of,
+        }
+        if with_description:
+            job['description'] = self.description
+        return job
+
+
+FRAME_COLUMNS = [
+    'job_id', 'title', 'company', 'location', 'city', 'work_arrangement',
+    'is_english', 'english_score', 'job_url', 'scraped_at', 'duplicate_of'
+]
+
+
+def records_to_frame(records: Iterable[JobRecord], with_description: bool = False) -> "pd.DataFrame":
+    """一次取出所有字段构建 DataFrame；低基数字段为 category，scraped_at 为 datetime64"""
+    import pandas as pd
+
+    records = list(records)
+    df = pd.DataFrame.from_records(list(map(attrgetter(*FRAME_COLUMNS), records)), columns=FRAME_COLUMNS)
+    df['scraped_at'] = pd.to_datetime(df['scraped_at'], unit='s')
+    for column in CATEGORY_COLUMNS:
+        df[column] = df[column].astype('category')
+    if with_description:
+        df['description'] = [record.description for record in records]
+    return df
@@ -0,0 +1,130 @@
+"""职位全文检索 - SQLite FTS5 倒排索引 + BM25 排序
+
+索引与职位库在同一个文件里，职位入库后按 rowid 增量索引。
+分词在 Python 中完成（html_text.words，与查重和关键词匹配一致），
+FTS5 只按空格切分，因此索引和查询的词完全相同。
+索引不保存原文（contentless），结果通过 rowid 关联 jobs 表取字段并做过滤。
+
+查询语法: 空格分隔的词都要出现；"visa sponsorship" 为短语；kotl* 为前缀。
+"""
+import re
+from typing import Dict, List, Optional
+
+from config import SEARCH_CONFIG
+from html_text import words
+from job_store import DESCRIPTION_SQL
+
+INDEX_COLUMNS = ('title', 'company', 'description')
+INDEX_BATCH = 1000
+
+QUERY_PATTERN = re.compile(r'"([^"]*)"|(\S+)')
+
+
+def build_match(query: str, any_term: bool = False) -> str:
+    """把用户查询转换为 FTS5 MATCH 表达式，没有可检索的词时返回空字符串"""
+    parts = []
+    for phrase, term in QUERY_PATTERN.findall(query):
+        tokens = words(phrase or term)
+        if not tokens:
+            continue
+        # 带连字符等会被切成多个词的输入按短语处理
+        part = '"' + " ".join(tokens) + '"'
+        if term.endswith("*") and len(tokens) == 1:
+            part += "*"
+        parts.append(part)
+    return (" OR " if any_term else " ").join(parts)
+
+
+class SearchIndex:
+    """保存在职位库中的全文索引"""
+
+    def __init__(self, store):
+        self.conn = store.conn
+        self.conn.execute(
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS job_search USING fts5("
+            f"{', '.join(INDEX_COLUMNS)}, content='', tokenize=\"unicode61 remove_diacritics 0 tokenchars '_'\")"
+        )
+        self.conn.commit()
+
+    def last_indexed(self) -> int:
+        row = self.conn.execute("SELECT rowid FROM job_search ORDER BY rowid DESC LIMIT 1").fetchone()
+        return row[0] if row else 0
+
+    def index_new(self) -> int:
+        """索引尚未索引的职位（rowid 大于索引中最大 rowid 的），返回新索引的职位数"""
+        last_rowid = self.last_indexed()
+        indexed = 0
+        while True:
+            rows = self.conn.execute(
+                f"SELECT rowid, {', '.join(DESCRIPTION_SQL if column == 'description' else column for column in INDEX_COLUMNS)} "
+                f"FROM jobs WHERE rowid > ? ORDER BY rowid LIMIT ?",
+                (last_rowid, INDEX_BATCH)
+            ).fetchall()
+            if not rows:
+                break
+            self.conn.executemany(
+                f"INSERT INTO job_search (rowid, {', '.join(INDEX_COLUMNS)}) "
+                f"VALUES (?, {', '.join('?' for _ in INDEX_COLUMNS)})",
+                [(row[0],) + tuple(" ".join(words(value)) for value in row[1:]) for row in rows]
+            )
+            last_rowid = rows[-1][0]
+            indexed += len(rows)
+        self.conn.commit()
+        if indexed >= INDEX_BATCH:
+            self.optimize()
+        return indexed
+
+    def optimize(self):
+        """合并索引段（大批量索引后查询更快）"""
+        self.conn.execute("INSERT INTO job_search (job_search) VALUES ('optimize')")
+        self.conn.commit()
+
+    def rebuild(self) -> int:
+        """清空后重新索引全部职位（分词方式变化后使用）"""
+        self.conn.execute("INSERT INTO job_search (job_search) VALUES ('delete-all')")
+        self.conn.commit()
+        return self.index_new()
+
+    def search(self, query: str, location: Optional[str] = None, work_arrangement: Optional[str] = None,
+               is_english: Optional[bool] = None, since: Optional[str] = None, until: Optional[str] = None,
+               include_duplicates: bool = False, any_term: bool = False,
+               limit: Optional[int] = None) -> List[Dict]:
+        """按 BM25 排序检索职位
+
+        location 为地点子串（不区分大小写），since/until 为 scraped_at 的范围 [since, until)。
+        """
+        match = build_match(query, any_term)
+        if not match:
+            return []
+
+        weights = SEARCH_CONFIG["weights"]
+        conditions = ["job_search MATCH ?"]
+        params = [match]
+        if location:
+            conditions.append("j.location LIKE ?")
+            params.append(f"%{location}%")
+        if work_arrangement:
+            conditions.append("j.work_arrangement = ?")
+            params.append(work_arrangement)
+        if is_english is not None:
+            conditions.append("j.is_english = ?")
+            params.append(int(is_english))
+        if since:
+            conditions.append("j.scraped_at >= ?")
+            params.append(since)
+        if until:
+            conditions.append("j.scraped_at < ?")
+            params.append(until)
+        if not include_duplicates:
+            conditions.append("j.duplicate_of IS NULL")
+
+        rows = self.conn.execute(
+            f"SELECT j.job_id, j.title, j.company, j.location, j.work_arrangement, j.scraped_at, j.job_url, "
+            f"bm25(job_search, {', '.join(str(weights[column]) for column in INDEX_COLUMNS)}) AS score "
+            f"FROM job_search JOIN jobs j ON j.rowid = job_search.rowid "
+            f"WHERE {' AND '.join(conditions)} ORDER BY score LIMIT ?",
+            params + [limit or SEARCH_CONFIG["limit"]]
+        )
+        columns = [column[0] for column in rows.description]
+        # FTS5 的 bm25() 越小越相关，取反后分数越高越相关
+        return [dict(zip(columns, row[:-1] + (-row[-1],))) for row in rows]
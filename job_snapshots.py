@@ -0,0 +1,143 @@
+"""职位详情页快照 - 保存压缩的 page_source，用纯 HTML 解析器提取字段
+
+离线重新解析（选择器变化后）:
+    python job_snapshots.py [快照目录] [-o 输出.csv]
+"""
+import argparse
+import glob
+import gzip
+import json
+import os
+from typing import Dict, List, Optional, Tuple
+
+import pandas as pd
+from lxml import html as lxml_html
+
+from config import JOB_DETAIL_SELECTORS, SNAPSHOT_CONFIG
+from job_filters import split_location
+from job_store import normalize_job_id
+
+# 与浏览器渲染的 .text 一致：块级元素前后换行，脚本样式不计入
+BLOCK_TAGS = {
+    "address", "article", "aside", "blockquote", "br", "dd", "div", "dl", "dt",
+    "footer", "h1", "h2", "h3", "h4", "h5", "h6", "header", "hr", "li", "main",
+    "nav", "ol", "p", "pre", "section", "table", "tr", "ul",
+}
+SKIP_TAGS = {"script", "style", "template", "noscript"}
+
+META_PREFIX = "<!-- snapshot "
+META_SUFFIX = " -->"
+
+
+def element_text(element) -> str:
+    """元素的可见文本：行内空白合并，块级元素分行"""
+    parts: List[str] = []
+
+    def walk(node):
+        tag = node.tag if isinstance(node.tag, str) else None
+        if tag is None or tag in SKIP_TAGS:
+            # 注释、脚本等只保留后面的文本
+            if node.tail:
+                parts.append(node.tail)
+            return
+        if tag in BLOCK_TAGS:
+            parts.append("\n")
+        if node.text:
+            parts.append(node.text)
+        for child in node:
+            walk(child)
+        if tag in BLOCK_TAGS:
+            parts.append("\n")
+        if node.tail and node is not element:
+            parts.append(node.tail)
+
+    walk(element)
+    lines = (" ".join(line.split()) for line in "".join(parts).split("\n"))
+    return "\n".join(line for line in lines if line)
+
+
+def _first(tree, selector: str):
+    matches = tree.cssselect(selector)
+    return matches[0] if matches else None
+
+
+def parse_job_html(page_source: str, current_url: str = "") -> Dict:
+    """从详情页 HTML 中提取职位字段（选择器和缺省值与 WebDriver 提取一致）"""
+    tree = lxml_html.fromstring(page_source)
+    job_data = {}
+
+    title = _first(tree, JOB_DETAIL_SELECTORS["title"])
+    job_data['title'] = element_text(title) if title is not None else "Unknown Title"
+
+    company = _first(tree, JOB_DETAIL_SELECTORS["company"])
+    job_data['company'] = element_text(company) if company is not None else "Unknown Company"
+
+    location = _first(tree, JOB_DETAIL_SELECTORS["location"])
+    job_data['location'] = split_location(element_text(location)) if location is not None else "Unknown Location"
+
+    description = _first(tree, JOB_DETAIL_SELECTORS["description"])
+    job_data['description'] = element_text(description) if description is not None else ""
+
+    link = _first(tree, JOB_DETAIL_SELECTORS["job_link"])
+    job_data['job_url'] = link.get('href') if link is not None and link.get('href') else current_url
+
+    return job_data
+
+
+def save_snapshot(page_source: str, job_data: Dict, job_id: Optional[str] = None,
+                  directory: str = None) -> str:
+    """压缩保存页面源码，文件头记录链接和抓取时间"""
+    directory = directory or SNAPSHOT_CONFIG["dir"]
+    os.makedirs(directory, exist_ok=True)
+
+    job_id = job_id or normalize_job_id(job_data.get('job_url', '')) or job_data['scraped_at']
+    safe_name = "".join(char if char.isalnum() else "_" for char in job_id)
+    path = os.path.join(directory, f"{safe_name}.html.gz")
+
+    meta = {'job_id': job_id, 'job_url': job_data.get('job_url'), 'scraped_at': job_data.get('scraped_at')}
+    with gzip.open(path, "wt", encoding="utf-8") as f:
+        f.write(META_PREFIX + json.dumps(meta, ensure_ascii=False) + META_SUFFIX + "\n")
+        f.write(page_source)
+    return path
+
+
+def load_snapshot(path: str) -> Tuple[str, Dict]:
+    """读取快照，返回 (页面源码, 元数据)"""
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        content = f.read()
+    meta = {}
+    if content.startswith(META_PREFIX):
+        header, content = content.split("\n", 1)
+        meta = json.loads(header[len(META_PREFIX):-len(META_SUFFIX)])
+    return content, meta
+
+
+def reparse_snapshots(directory: str = None) -> List[Dict]:
+    """用当前选择器重新解析目录下所有快照"""
+    directory = directory or SNAPSHOT_CONFIG["dir"]
+    jobs = []
+    for path in sorted(glob.glob(os.path.join(directory, "*.html.gz"))):
+        page_source, meta = load_snapshot(path)
+        job_data = parse_job_html(page_source, meta.get('job_url') or "")
+        job_data['job_id'] = meta.get('job_id')
+        job_data['scraped_at'] = meta.get('scraped_at')
+        jobs.append(job_data)
+    return jobs
+
+
+def main():
+    parser = argparse.ArgumentParser(description="离线重新解析职位详情页快照")
+    parser.add_argument("directory", nargs="?", default=SNAPSHOT_CONFIG["dir"], help="快照目录")
+    parser.add_argument("-o", "--output", default="snapshot_jobs.csv", help="输出 csv 文件")
+    args = parser.parse_args()
+
+    jobs = reparse_snapshots(args.directory)
+    if not jobs:
+        print("❌ 没有找到快照")
+        return
+    pd.DataFrame(jobs).to_csv(args.output, index=False)
+    print(f"💾 重新解析 {len(jobs)} 个快照，已保存到 {args.output}")
+
+
+if __name__ == "__main__":
+    main()
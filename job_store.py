@@ -0,0 +1,324 @@
+import re
+import sqlite3
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+from urllib.parse import urlsplit
+
+from config import COMPRESSION_CONFIG, STORAGE_CONFIG
+
+if TYPE_CHECKING:
+    import pandas as pd
+    from job_record import JobRecord
+
+# 职位库字段（顺序即导出时的列顺序）
+JOB_COLUMNS = [
+    'title', 'company', 'location', 'work_arrangement',
+    'is_english', 'english_score', 'job_url', 'scraped_at', 'duplicate_of', 'description'
+]
+
+# 读取描述的 SQL 表达式：原文或压缩数据（供直接查询 jobs 表的模块使用）
+DESCRIPTION_SQL = "description_text(description, description_z, dict_id)"
+# 批量读取描述时每批的职位数
+DESCRIPTION_BATCH = 1000
+
+JOB_ID_PATTERNS = [
+    re.compile(r'[?&]currentJobId=(\d+)'),
+    re.compile(r'/jobs/view/(?:[^/?#]*-)?(\d+)'),
+]
+
+
+def normalize_job_id(job_url: str) -> str:
+    """从职位链接中提取职位ID，没有ID时使用去掉参数的链接"""
+    if not job_url:
+        return ""
+    for pattern in JOB_ID_PATTERNS:
+        match = pattern.search(job_url)
+        if match:
+            return match.group(1)
+    parts = urlsplit(job_url)
+    return f"{parts.netloc}{parts.path}".rstrip('/').lower()
+
+
+class JobStore:
+    """SQLite 职位库 - WAL 模式，每个职位提取后立即写入，按职位ID去重"""
+
+    def __init__(self, db_path: str = None):
+        self.db_path = db_path or STORAGE_CONFIG["db_path"]
+        self.conn = sqlite3.connect(self.db_path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self._create_schema()
+        self.codec = self._open_codec()
+        # 压缩保存新描述；读取压缩过的描述不受该开关影响
+        self.compress = COMPRESSION_CONFIG["enabled"] and self.codec is not None
+        self.conn.create_function("description_text", 3, self._description_text, deterministic=True)
+
+    def _open_codec(self):
+        try:
+            from description_codec import DescriptionCodec
+        except ImportError:
+            if COMPRESSION_CONFIG["enabled"]:
+                print("⚠️ 未安装 zstandard，职位描述按原文保存")
+            return None
+        return DescriptionCodec(self.conn)
+
+    def _description_text(self, description, data, dict_id):
+        if data is None:
+            return description
+        if self.codec is None:
+            raise RuntimeError("职位库中有压缩的描述，需要安装 zstandard")
+        return self.codec.decompress(data, dict_id)
+
+    def _create_schema(self):
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS jobs (
+                job_id           TEXT PRIMARY KEY,
+                title            TEXT,
+                company          TEXT,
+                location         TEXT,
+                work_arrangement TEXT,
+                is_english       INTEGER,
+                english_score    REAL,
+                job_url          TEXT,
+                scraped_at       TEXT,
+                description      TEXT,
+                duplicate_of     TEXT
+            );
+            CREATE INDEX IF NOT EXISTS idx_jobs_company ON jobs (company);
+            CREATE INDEX IF NOT EXISTS idx_jobs_location ON jobs (location);
+            CREATE INDEX IF NOT EXISTS idx_jobs_work_arrangement ON jobs (work_arrangement);
+            CREATE INDEX IF NOT EXISTS idx_jobs_is_english ON jobs (is_english);
+            CREATE INDEX IF NOT EXISTS idx_jobs_scraped_at ON jobs (scraped_at);
+
+            -- 每个导出目标已导出到的最大 rowid（增量导出用）
+            CREATE TABLE IF NOT EXISTS export_state (
+                target     TEXT PRIMARY KEY,
+                last_rowid INTEGER NOT NULL
+            );
+        """)
+        # 旧版职位库没有 duplicate_of 列
+        columns = {row[1] for row in self.conn.execute("PRAGMA table_info(jobs)")}
+        if 'duplicate_of' not in columns:
+            self.conn.execute("ALTER TABLE jobs ADD COLUMN duplicate_of TEXT")
+        # 压缩的描述（此时 description 为空）和压缩用的字典编号
+        if 'description_z' not in columns:
+            self.conn.execute("ALTER TABLE jobs ADD COLUMN description_z BLOB")
+            self.conn.execute("ALTER TABLE jobs ADD COLUMN dict_id INTEGER")
+        self.conn.commit()
+
+    def has_job(self, job_id: str) -> bool:
+        """职位是否已经保存过"""
+        if not job_id:
+            return False
+        row = self.conn.execute("SELECT 1 FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+        return row is not None
+
+    def add_job(self, job_data: Dict) -> bool:
+        """保存一个职位，已存在时跳过，返回是否为新职位"""
+        job_id = job_data.get('job_id') or normalize_job_id(job_data.get('job_url', ''))
+        job_data['job_id'] = job_id
+        values = [job_data.get(column) for column in JOB_COLUMNS]
+        is_english = values[JOB_COLUMNS.index('is_english')]
+        if is_english is not None:
+            values[JOB_COLUMNS.index('is_english')] = int(bool(is_english))
+        compressed, dict_id = None, None
+        description = values[JOB_COLUMNS.index('description')]
+        if self.compress and description:
+            compressed, dict_id = self.codec.compress(description)
+            values[JOB_COLUMNS.index('description')] = None
+        cursor = self.conn.execute(
+            f"INSERT OR IGNORE INTO jobs (job_id, {', '.join(JOB_COLUMNS)}, description_z, dict_id) "
+            f"VALUES (?, {', '.join('?' for _ in JOB_COLUMNS)}, ?, ?)",
+            [job_id] + values + [compressed, dict_id]
+        )
+        self.conn.commit()
+        if cursor.rowcount > 0 and self.compress and self.codec.needs_training(cursor.lastrowid):
+            # 职位已经保存，训练失败只影响之后的压缩率，不能中断入库
+            try:
+                self.train_dictionary()
+            except Exception as e:
+                print(f"⚠️ 训练压缩字典失败，继续使用当前字典: {e}")
+        return cursor.rowcount > 0
+
+    def train_dictionary(self) -> Optional[int]:
+        """用最近保存的描述训练新的压缩字典，之后保存的描述使用新字典，返回字典编号"""
+        last_rowid = self.conn.execute("SELECT COALESCE(MAX(rowid), 0) FROM jobs").fetchone()[0]
+        rows = self.conn.execute(
+            f"SELECT {DESCRIPTION_SQL} FROM jobs ORDER BY rowid DESC LIMIT ?",
+            (COMPRESSION_CONFIG["train_samples"],)
+        )
+        dict_id = self.codec.train((row[0] for row in rows), last_rowid)
+        if dict_id is not None:
+            print(f"🗜️  职位描述压缩字典 #{dict_id} 已训练")
+        return dict_id
+
+    def recompress(self) -> Tuple[int, int, int]:
+        """用当前字典重新压缩全部描述（包括原文保存的），返回 (职位数, 之前字节数, 之后字节数)"""
+        count, before, after = 0, 0, 0
+        last_rowid = 0
+        while True:
+            rows = self.conn.execute(
+                "SELECT rowid, description, description_z, dict_id FROM jobs WHERE rowid > ? "
+                "ORDER BY rowid LIMIT ?",
+                (last_rowid, DESCRIPTION_BATCH)
+            ).fetchall()
+            if not rows:
+                break
+            updates = []
+            for rowid, description, data, dict_id in rows:
+                text = description if data is None else self.codec.decompress(data, dict_id)
+                before += len(data) if data is not None else len((description or "").encode("utf-8"))
+                if not text:
+                    continue
+                compressed, new_dict_id = self.codec.compress(text)
+                after += len(compressed)
+                updates.append((compressed, new_dict_id, rowid))
+            self.conn.executemany(
+                "UPDATE jobs SET description = NULL, description_z = ?, dict_id = ? WHERE rowid = ?", updates)
+            self.conn.commit()
+            count += len(updates)
+            last_rowid = rows[-1][0]
+        return count, before, after
+
+    def iter_descriptions(self, job_ids: Optional[Iterable[str]] = None) -> Iterator[Tuple[str, str]]:
+        """按入库顺序批量读取 (职位ID, 描述)，每批一次查询、批量解压；job_ids 为空时读取全部"""
+        if job_ids is None:
+            batches = [None]
+        else:
+            job_ids = list(job_ids)
+            batches = [job_ids[i:i + DESCRIPTION_BATCH] for i in range(0, len(job_ids), DESCRIPTION_BATCH)]
+        for batch in batches:
+            last_rowid = 0
+            while True:
+                sql = "SELECT rowid, job_id, description, description_z, dict_id FROM jobs WHERE rowid > ?"
+                params = [last_rowid]
+                if batch is not None:
+                    sql += f" AND job_id IN ({', '.join('?' for _ in batch)})"
+                    params += batch
+                rows = self.conn.execute(sql + " ORDER BY rowid LIMIT ?", params + [DESCRIPTION_BATCH]).fetchall()
+                if not rows:
+                    break
+                yield from zip((row[1] for row in rows), self._decode_rows([row[2:] for row in rows]))
+                last_rowid = rows[-1][0]
+
+    def _decode_rows(self, rows: Sequence[Tuple]) -> List[str]:
+        """[(原文, 压缩数据, dict_id)] -> 描述列表，压缩过的一次批量解压"""
+        texts = [description for description, _, _ in rows]
+        compressed = [i for i, row in enumerate(rows) if row[1] is not None]
+        if compressed:
+            if self.codec is None:
+                raise RuntimeError("职位库中有压缩的描述，需要安装 zstandard")
+            decoded = self.codec.decompress_many([(rows[i][1], int(rows[i][2])) for i in compressed])
+            for i, text in zip(compressed, decoded):
+                texts[i] = text
+        return texts
+
+    def job_ids(self) -> set:
+        """所有已保存的职位ID"""
+        return {row[0] for row in self.conn.execute("SELECT job_id FROM jobs")}
+
+    def listings(self) -> Iterator[Tuple[str, str, str]]:
+        """所有已保存职位的 (标题, 公司, 地点)，不读取描述"""
+        return self.conn.execute("SELECT title, company, location FROM jobs")
+
+    def query_jobs(self, since: Optional[str] = None, **filters) -> "pd.DataFrame":
+        """查询职位，since 为 scraped_at 下限，filters 为字段等值条件"""
+        conditions = []
+        params = []
+        if since:
+            conditions.append("scraped_at >= ?")
+            params.append(since)
+        for column, value in filters.items():
+            if column not in JOB_COLUMNS:
+                raise ValueError(f"未知字段: {column}")
+            conditions.append(f"{column} = ?")
+            params.append(value)
+
+        return self._select(conditions, params)[0]
+
+    def _select(self, conditions, params) -> Tuple["pd.DataFrame", Optional[int]]:
+        """按条件查询职位，同时返回结果中最大的 rowid"""
+        import pandas as pd
+
+        sql = f"SELECT rowid AS _rowid, {', '.join(JOB_COLUMNS)}, description_z, dict_id FROM jobs"
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        sql += " ORDER BY scraped_at, rowid"
+
+        df = pd.read_sql_query(sql, self.conn, params=params)
+        last_rowid = int(df['_rowid'].max()) if not df.empty else None
+        if df['description_z'].notna().any():
+            df['description'] = self._decode_rows(list(zip(df['description'], df['description_z'], df['dict_id'])))
+        df = df.drop(columns=['_rowid', 'description_z', 'dict_id'])
+        # 旧版本保存的重复职位没有英文判断（NULL），按非英文处理
+        df['is_english'] = df['is_english'].fillna(0).astype(bool)
+        return df, last_rowid
+
+    def iter_records(self, since: Optional[str] = None, with_description: bool = True) -> Iterator["JobRecord"]:
+        """逐行读取为紧凑的 JobRecord（游标流式读取，不一次载入全部描述）"""
+        from job_record import JobRecord
+
+        columns = [column for column in JOB_COLUMNS if with_description or column != 'description']
+        selected = [f"{DESCRIPTION_SQL} AS description" if column == 'description' else column for column in columns]
+        sql = f"SELECT job_id, {', '.join(selected)} FROM jobs"
+        params = []
+        if since:
+            sql += " WHERE scraped_at >= ?"
+            params.append(since)
+        cursor = self.conn.execute(sql + " ORDER BY scraped_at, rowid", params)
+        names = ['job_id'] + columns
+        for row in cursor:
+            yield JobRecord.from_dict(dict(zip(names, row)), with_description)
+
+    def unexported_jobs(self, target: str) -> Tuple["pd.DataFrame", Optional[int]]:
+        """返回尚未导出到 target 的职位，以及用于 mark_exported 的 rowid"""
+        row = self.conn.execute(
+            "SELECT last_rowid FROM export_state WHERE target = ?", (target,)
+        ).fetchone()
+        return self._select(["rowid > ?"], [row[0] if row else 0])
+
+    def mark_exported(self, target: str, last_rowid: int):
+        """记录 target 已导出到 last_rowid"""
+        self.conn.execute(
+            "INSERT INTO export_state (target, last_rowid) VALUES (?, ?) "
+            "ON CONFLICT(target) DO UPDATE SET last_rowid = excluded.last_rowid",
+            (target, last_rowid)
+        )
+        self.conn.commit()
+
+    def mark_duplicates(self, duplicates: Dict[str, str]):
+        """记录 {职位ID: 原始职位ID}"""
+        self.conn.executemany(
+            "UPDATE jobs SET duplicate_of = ? WHERE job_id = ?",
+            [(duplicate_of, job_id) for job_id, duplicate_of in duplicates.items()]
+        )
+        self.conn.commit()
+
+    def count(self) -> int:
+        return self.conn.execute("SELECT COUNT(*) FROM jobs").fetchone()[0]
+
+    def stats(self) -> Dict:
+        """职位库概况（只做聚合查询，不读取描述）"""
+        total, english, first, last = self.conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(is_english), 0), MIN(scraped_at), MAX(scraped_at) FROM jobs"
+        ).fetchone()
+        duplicates = self.conn.execute("SELECT COUNT(*) FROM jobs WHERE duplicate_of IS NOT NULL").fetchone()[0]
+        stats = {'total': total, 'english': english, 'duplicates': duplicates,
+                 'first_scraped': first, 'last_scraped': last}
+        for column in ('work_arrangement', 'location'):
+            stats[column] = dict(self.conn.execute(
+                f"SELECT {column}, COUNT(*) FROM jobs WHERE is_english = 1 AND duplicate_of IS NULL "
+                f"GROUP BY {column} ORDER BY COUNT(*) DESC"
+            ).fetchall())
+        stats['exports'] = dict(self.conn.execute("SELECT target, last_rowid FROM export_state").fetchall())
+        compressed, compressed_bytes, plain_bytes = self.conn.execute(
+            "SELECT COUNT(description_z), COALESCE(SUM(LENGTH(description_z)), 0), "
+            "COALESCE(SUM(LENGTH(CAST(description AS BLOB))), 0) FROM jobs"
+        ).fetchone()
+        stats['descriptions'] = {
+            'compressed': compressed, 'compressed_bytes': compressed_bytes, 'plain_bytes': plain_bytes,
+            'dicts': len(self.codec.dicts) - 1 if self.codec is not None else 0,
+        }
+        return stats
+
+    def close(self):
+        self.conn.close()
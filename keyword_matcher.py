@@ -0,0 +1,130 @@
+import re
+from functools import lru_cache
+from typing import Dict, Iterable, List, Tuple
+
+_WORD_CHAR = re.compile(r'\w')
+
+
+def _is_boundary(text: str, index: int) -> bool:
+    """与正则 \\b 相同的词边界判断（index 必须在字符串内部）"""
+    return bool(_WORD_CHAR.match(text[index - 1])) != bool(_WORD_CHAR.match(text[index]))
+
+
+def _trie_regex(keywords: List[str]) -> str:
+    """把关键词列表编译成前缀树形式的正则，每个位置只需按首字符分支"""
+    trie: Dict = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def build(node: Dict) -> str:
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        # 贪婪的可选分支先尝试长词，右边界不满足时回溯到短词
+        return "(?:" + body + ")?" if "" in node else body
+
+    return build(trie)
+
+
+class KeywordMatcher:
+    """多关键词整词匹配器 - 所有关键词编译成一个正则，一次扫描得到全部命中"""
+
+    def __init__(self, groups: Dict[str, Iterable[str]]):
+        # 分组 -> 原始关键词（保留顺序，用于返回结果）
+        self.groups = {name: list(keywords) for name, keywords in groups.items()}
+
+        keywords = {kw.lower() for kws in self.groups.values() for kw in kws}
+        keywords = sorted(keywords, key=lambda kw: (-len(kw), kw))
+
+        # 命中长词时，长词内部同样满足整词条件的短词 (短词, 偏移)
+        # 例如 "machine learning" 内部的 "machine" 和 "learning"
+        # 边界只取决于长词内部字符，可以预先算好
+        self._inner: Dict[str, List[Tuple[str, int]]] = {}
+        # 是否存在跨越两个命中的重叠（如 "machine learning" 与 "learning rate"）
+        self._may_cross = False
+        for long_kw in keywords:
+            inner = []
+            for short_kw in keywords:
+                if short_kw == long_kw:
+                    continue
+                for match in re.finditer(re.escape(short_kw), long_kw):
+                    start, end = match.start(), match.end()
+                    if (start == 0 or _is_boundary(long_kw, start)) and \
+                            (end == len(long_kw) or _is_boundary(long_kw, end)):
+                        inner.append((short_kw, start))
+            self._inner[long_kw] = inner
+
+            for offset in range(1, len(long_kw)):
+                if not _is_boundary(long_kw, offset):
+                    continue
+                suffix = long_kw[offset:]
+                if any(len(kw) > len(suffix) and kw.startswith(suffix) for kw in keywords):
+                    self._may_cross = True
+
+        # 同一位置总是先取到最长的关键词
+        alternation = _trie_regex(keywords)
+        if not keywords:
+            self._pattern = None
+        elif self._may_cross:
+            # 零宽前瞻，命中之间可以任意重叠
+            self._pattern = re.compile(r'\b(?=(' + alternation + r')\b)')
+        else:
+            self._pattern = re.compile(r'\b(' + alternation + r')\b')
+
+    @property
+    def pattern(self):
+        """编译好的正则，group(1) 为命中的小写关键词（可用于 Series.str.findall）"""
+        return self._pattern
+
+    def expand(self, keyword: str) -> List[str]:
+        """一次命中代表的全部关键词（自身加上内部嵌套的短词）"""
+        return [keyword] + [short_kw for short_kw, _ in self._inner[keyword]]
+
+    def find_all(self, text: str) -> List[Tuple[str, int, int]]:
+        """返回所有命中 (小写关键词, 起始位置, 结束位置)，位置基于小写文本"""
+        if not text or self._pattern is None:
+            return []
+
+        hits = []
+        for match in self._pattern.finditer(text.lower()):
+            keyword = match.group(1)
+            start = match.start(1)
+            hits.append((keyword, start, start + len(keyword)))
+            for short_kw, offset in self._inner[keyword]:
+                hits.append((short_kw, start + offset, start + offset + len(short_kw)))
+        # 前瞻模式下内部短词可能被重复命中
+        return sorted(set(hits), key=lambda hit: (hit[1], hit[2], hit[0]))
+
+    def matched_keywords(self, text: str) -> set:
+        """返回命中的小写关键词集合（不需要位置时更快）"""
+        if not text or self._pattern is None:
+            return set()
+
+        found = set(self._pattern.findall(text.lower()))
+        for keyword in list(found):
+            found.update(short_kw for short_kw, _ in self._inner[keyword])
+        return found
+
+    def scan(self, text: str) -> Dict[str, List[str]]:
+        """一次扫描，返回每个分组命中的关键词（按配置顺序）"""
+        found = self.matched_keywords(text)
+
+        matched = {}
+        for name, keywords in self.groups.items():
+            matched[name] = [kw for kw in keywords if kw.lower() in found]
+        return matched
+
+
+@lru_cache(maxsize=32)
+def _cached_matcher(frozen_groups: Tuple[Tuple[str, Tuple[str, ...]], ...]) -> KeywordMatcher:
+    return KeywordMatcher(dict(frozen_groups))
+
+
+def get_matcher(**groups: Iterable[str]) -> KeywordMatcher:
+    """按关键词配置取得编译好的匹配器（相同配置只编译一次）"""
+    frozen = tuple((name, tuple(keywords)) for name, keywords in groups.items())
+    return _cached_matcher(frozen)
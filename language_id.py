@@ -0,0 +1,170 @@
+"""语言识别 - 字符 n-gram 频率模型，区分英文和德文职位描述
+
+每种语言用 language_profiles/<语言>.txt 中的样本文本统计 1~3 字符 n-gram，
+哈希到固定数量的桶后保存为对数概率表（每个进程只构建一次）。
+描述按句子/行切成片段分别判断，按片段字母数得出各语言占比，
+德英双语的职位描述因此能得到英文所占的比例，而不是简单的是/否。
+批量接口把所有片段拼成一个数组，一次完成哈希和查表。
+"""
+import os
+from functools import lru_cache
+from typing import Dict, Iterable, Sequence
+
+import numpy as np
+
+PROFILE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "language_profiles")
+LANGUAGES = ("en", "de")
+
+BUCKET_BITS = 16
+SMOOTHING = 0.1
+BATCH_SIZE = 256
+
+SPACE = 32
+
+# 字符类别查找表：片段分隔（换行、项目符号）、句末标点、空白、字母，其余为 0
+OTHER, LETTER, BLANK, BREAK, SENTENCE_END = range(5)
+_TABLE_SIZE = 0x3000
+
+
+def _char_classes() -> np.ndarray:
+    classes = np.zeros(_TABLE_SIZE + 1, dtype=np.uint8)
+    for code in range(_TABLE_SIZE):
+        char = chr(code)
+        if char.isalpha():
+            classes[code] = LETTER
+        elif char.isspace():
+            classes[code] = BLANK
+    classes[[0, ord("\n"), ord("\r"), ord("•")]] = BREAK
+    classes[[ord("."), ord("!"), ord("?"), ord(";")]] = SENTENCE_END
+    # 超出查找表的字符（CJK 等）按字母处理
+    classes[_TABLE_SIZE] = LETTER
+    return classes
+
+
+_CLASSES = _char_classes()
+
+# 各阶 n-gram 的乘法哈希系数（32 位整数运算，溢出即取模）
+_MULTIPLIERS = np.array([0x9E3779B1, 0x85EBCA77, 0xC2B2AE3D], dtype=np.uint32)
+_ORDER_SALTS = np.array([0x27D4EB2F, 0x165667B1, 0xD3A2646C], dtype=np.uint32)
+
+
+def _encode(texts: Sequence[str]):
+    """把一批文本编码成码点数组
+
+    非字母字符合并为一个空格，文本之间用 0 隔开（n-gram 不跨文本）。
+    片段（句子、行）不打断字符流，只用于归属：每个码点记录所属片段。
+    返回 (码点, 每个码点所属片段, 每个片段所属文本, 每个片段的字母数)。
+    """
+    raw = np.frombuffer("".join(f" {text or ''} \0" for text in texts).lower().encode("utf-32-le"), dtype=np.uint32)
+
+    classes = _CLASSES[np.minimum(raw, _TABLE_SIZE)]
+    letters = classes == LETTER
+    # 句末标点后面是空白或文本结尾时才算片段分隔；文本结尾的 0 也是分隔
+    breaks = (classes == BREAK) | ((classes == SENTENCE_END) & np.append(classes[1:] >= BLANK, True))
+    segment_of = np.cumsum(breaks)
+
+    stream = np.where(letters | (raw == 0), raw, SPACE)
+    keep = np.ones(len(stream), dtype=bool)
+    keep[1:] = (stream[1:] != SPACE) | (stream[:-1] != SPACE)
+    codes, segment_of = stream[keep], segment_of[keep]
+
+    # 第 i 个文本的片段编号在 [第 i-1 个 0 所在片段, 第 i 个 0 所在片段) 之间
+    text_ends = segment_of[codes == 0]
+    letter_counts = np.bincount(segment_of[codes > SPACE], minlength=int(text_ends[-1]))
+    segment_text = np.searchsorted(text_ends, np.arange(len(letter_counts)), side="right")
+    return codes, segment_of, segment_text, letter_counts
+
+
+def _ngram_buckets(codes: np.ndarray, segment_of: np.ndarray):
+    """所有 1~3 字符 n-gram 的桶号，以及首字符所属的片段（n-gram 不跨文本）"""
+    present = codes != 0
+    hashes, valid, owners = [], [], []
+    with np.errstate(over="ignore"):
+        hashed = np.zeros(len(codes), dtype=np.uint32)
+        mask = np.ones(len(codes), dtype=bool)
+        for order in range(min(3, len(codes))):
+            count = len(codes) - order
+            hashed = hashed[:count] + codes[order:] * _MULTIPLIERS[order]
+            mask = mask[:count] & present[order:]
+            hashes.append(hashed ^ _ORDER_SALTS[order])
+            valid.append(mask)
+            owners.append(segment_of[:count])
+        valid = np.concatenate(valid)
+        buckets = (np.concatenate(hashes)[valid] * _MULTIPLIERS[0]) >> np.uint32(32 - BUCKET_BITS)
+    return buckets.astype(np.intp), np.concatenate(owners)[valid]
+
+
+class LanguageIdentifier:
+    """按样本文本构建的 n-gram 语言模型"""
+
+    def __init__(self, corpora: Dict[str, str]):
+        self.languages = tuple(corpora)
+        size = 1 << BUCKET_BITS
+        tables = []
+        for language in self.languages:
+            codes, segment_of, _, _ = _encode([corpora[language]])
+            buckets, _ = _ngram_buckets(codes, segment_of)
+            counts = np.bincount(buckets, minlength=size).astype(np.float64)
+            tables.append(np.log((counts + SMOOTHING) / (counts.sum() + SMOOTHING * size)))
+        # (语言数, 桶数) 的对数概率表
+        self.log_probs = np.array(tables)
+
+    @classmethod
+    def from_profiles(cls, directory: str = None, languages: Iterable[str] = LANGUAGES) -> "LanguageIdentifier":
+        directory = directory or PROFILE_DIR
+        corpora = {}
+        for language in languages:
+            with open(os.path.join(directory, f"{language}.txt"), encoding="utf-8") as f:
+                corpora[language] = f.read()
+        return cls(corpora)
+
+    def proportions_many(self, texts: Iterable[str]) -> np.ndarray:
+        """每个文本中各语言所占比例，返回 (文本数 × 语言数) 的数组；没有字母的文本全为 0"""
+        texts = list(texts)
+        if len(texts) > BATCH_SIZE:
+            # 分批处理，中间数组的内存占用与总文本数无关
+            return np.concatenate([
+                self.proportions_many(texts[start:start + BATCH_SIZE])
+                for start in range(0, len(texts), BATCH_SIZE)
+            ])
+        if not texts:
+            return np.zeros((0, len(self.languages)))
+
+        codes, segment_of, segment_text, letter_counts = _encode(texts)
+        buckets, owners = _ngram_buckets(codes, segment_of)
+        scores = np.stack([
+            np.bincount(owners, weights=np.take(table, buckets), minlength=len(letter_counts))
+            for table in self.log_probs
+        ], axis=1)
+
+        # 片段属于各语言的后验概率（短而含糊的片段接近平分），按字母数加权
+        scores -= scores.max(axis=1, keepdims=True)
+        posterior = np.exp(scores)
+        posterior *= (letter_counts / posterior.sum(axis=1))[:, None]
+        result = np.stack([
+            np.bincount(segment_text, weights=weights, minlength=len(texts)) for weights in posterior.T
+        ], axis=1)
+        totals = result.sum(axis=1, keepdims=True)
+        np.divide(result, totals, out=result, where=totals > 0)
+        return result
+
+    def proportions(self, text: str) -> Dict[str, float]:
+        """单个文本中各语言所占比例"""
+        return dict(zip(self.languages, self.proportions_many([text])[0].tolist()))
+
+    def share_many(self, texts: Iterable[str], language: str = "en") -> np.ndarray:
+        return self.proportions_many(texts)[:, self.languages.index(language)]
+
+    def share(self, text: str, language: str = "en") -> float:
+        return float(self.share_many([text], language)[0])
+
+    def classify(self, text: str) -> str:
+        """占比最高的语言；没有可判断的文本时返回 "unknown\""""
+        proportions = self.proportions_many([text])[0]
+        return self.languages[int(proportions.argmax())] if proportions.any() else "unknown"
+
+
+@lru_cache(maxsize=None)
+def get_identifier() -> LanguageIdentifier:
+    """进程内共享的默认识别器（第一次调用时构建）"""
+    return LanguageIdentifier.from_profiles()
@@ -1,6 +1,7 @@
 import time
 import random
-import re
+from typing import Dict, Iterator
+
 import pandas as pd
 from selenium import webdriver
 from selenium.webdriver.common.by import By
@@ -8,18 +9,40 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.action_chains import ActionChains
-from webdriver_manager.chrome import ChromeDriverManager
-from selenium.webdriver.chrome.service import Service
-from bs4 import BeautifulSoup
+from selenium.common.exceptions import StaleElementReferenceException, TimeoutException
 
 from config import *
+import job_filters
+from job_store import JobStore, normalize_job_id
+from excel_export import append_rows, job_sheets, write_workbook
+import parquet_export
+import job_snapshots
+import driver_setup
+import job_pipeline
+from near_duplicates import DuplicateIndex
+from job_search import SearchIndex
+from card_filter import CARD_SCRIPT, SKIP_REASONS, CardFilter
+from perf import StepTimer, timed, DELAY, WAIT, MISSING
 
 class ConservativeLinkedInScraper:
-    def __init__(self):
+    def __init__(self, db_path=None):
         self.driver = None
-        self.jobs_data = []
+        self.saved_count = 0
+        self.duplicate_count = 0
         self.session_start_time = None
+        # 离线模式爬取本地测试职位板，不需要安全延迟
+        self.offline = OFFLINE_CONFIG["enabled"]
+        self.max_jobs = OFFLINE_CONFIG["max_jobs_per_session"] if self.offline else SAFETY_CONFIG["max_jobs_per_session"]
+        self.store = JobStore(db_path)
+        self.worker = None
+        self.card_filter = CardFilter(self.store) if CARD_FILTER_CONFIG["enabled"] else None
+        self.timer = StepTimer.for_session()
+        self.last_click_time = None
+        # 上一次安全暂停时已处理的职位数（跳过的职位不会增加处理数，不应重复暂停）
+        self.last_break_count = 0
+        self.startup_info = {}
         
+    @timed()
     def setup_driver(self):
         """安全设置浏览器驱动"""
         print("🚀 启动浏览器（安全模式）...")
@@ -32,16 +55,25 @@ class ConservativeLinkedInScraper:
         chrome_options.add_argument("--user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36")
         chrome_options.add_argument("--disable-dev-shm-usage")
         chrome_options.add_argument("--no-sandbox")
+        if BROWSER_CONFIG["headless"] or self.offline:
+            chrome_options.add_argument("--headless=new")
         
-        service = Service(ChromeDriverManager().install())
+        # 使用缓存的驱动路径，Chrome 升级后才重新解析
+        with self.timer.stage("driver_install"):
+            service, self.startup_info = driver_setup.create_service()
+        launch_start = time.perf_counter()
         self.driver = webdriver.Chrome(service=service, options=chrome_options)
+        self.startup_info['launch_seconds'] = time.perf_counter() - launch_start
         self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
         
+        # 可选元素不走隐式等待，必需元素用 wait_for 显式等待
         self.driver.implicitly_wait(BROWSER_CONFIG["implicit_wait"])
         print("✅ 浏览器启动成功 - 安全模式激活")
         
-    def safe_delay(self, min_seconds=None, max_seconds=None):
+    def safe_delay(self, min_seconds=None, max_seconds=None, step="safe_delay"):
         """安全延迟"""
+        if self.offline:
+            return
         if min_seconds is None:
             min_seconds = SAFETY_CONFIG["delay_between_jobs"][0]
         if max_seconds is None:
@@ -49,9 +81,67 @@ class ConservativeLinkedInScraper:
             
         delay = random.uniform(min_seconds, max_seconds)
         time.sleep(delay)
+        self.timer.record(step, delay, DELAY)
+    
+    def politeness_floor(self):
+        """职位点击之间至少间隔 SAFETY_CONFIG 的职位延迟（加载和处理时间计入其中）"""
+        if self.offline:
+            return
+        floor = random.uniform(*SAFETY_CONFIG["delay_between_jobs"])
+        if self.last_click_time is not None:
+            remaining = floor - (time.monotonic() - self.last_click_time)
+            if remaining > 0:
+                time.sleep(remaining)
+                self.timer.record("politeness_floor", remaining, DELAY)
+        self.last_click_time = time.monotonic()
+    
+    def wait_for(self, step, condition, timeout=None):
+        """显式等待条件成立，条件满足立即返回；超时返回 None 并记为浪费的等待"""
+        timeout = timeout or BROWSER_CONFIG["element_timeout"]
+        start = time.perf_counter()
+        try:
+            result = WebDriverWait(
+                self.driver, timeout, ignored_exceptions=[StaleElementReferenceException]
+            ).until(condition)
+            self.timer.record(step, time.perf_counter() - start, WAIT)
+            return result
+        except TimeoutException:
+            self.timer.record(step, time.perf_counter() - start, MISSING)
+            return None
+    
+    def detail_title(self):
+        """详情面板当前的职位标题（不存在时为空，不等待）"""
+        elements = self.driver.find_elements(By.CSS_SELECTOR, JOB_DETAIL_SELECTORS["title"])
+        return elements[0].text.strip() if elements else ""
+    
+    def detail_link(self):
+        """详情面板顶部职位链接（不存在时为空，不等待）"""
+        elements = self.driver.find_elements(By.CSS_SELECTOR, JOB_DETAIL_SELECTORS["job_link"])
+        return (elements[0].get_attribute("href") or "") if elements else ""
+    
+    def wait_for_detail_pane(self, job_id, previous_title):
+        """等待详情面板切换到刚点击的职位
+        
+        地址栏可能先于面板内容更新，因此还要求标题已经变化；
+        连续两个职位标题相同时，以顶部职位链接指向该职位为准。
+        """
+        def pane_ready(driver):
+            if job_id and f"currentJobId={job_id}" not in driver.current_url:
+                return False
+            title = self.detail_title()
+            if not title:
+                return False
+            if title != previous_title:
+                return True
+            return bool(job_id) and normalize_job_id(self.detail_link()) == job_id
         
+        return self.wait_for("detail_pane", pane_ready)
+        
+    @timed()
     def simulate_human_behavior(self):
         """模拟人类行为"""
+        if self.offline:
+            return
         # 随机鼠标移动
         if random.random() > 0.7:
             try:
@@ -71,218 +161,279 @@ class ConservativeLinkedInScraper:
             except:
                 pass
         
-        self.safe_delay(1, 3)
+        self.safe_delay(1, 3, step="human_behavior")
     
     def build_search_url(self):
         """构建搜索URL"""
-        base_url = LINKEDIN_URL
+        base_url = OFFLINE_CONFIG["search_url"] if self.offline else LINKEDIN_URL
         params = []
         
         for key, value in SEARCH_PARAMS.items():
             params.append(f"{key}={value}")
         
         search_url = f"{base_url}?{'&'.join(params)}"
-        print(f"🔍 搜索目标: 德国五大城市 | 现场/混合办公 | 24小时内发布")
+        if self.offline:
+            print(f"🧪 离线模式: {base_url}")
+        else:
+            print(f"🔍 搜索目标: 德国五大城市 | 现场/混合办公 | 24小时内发布")
         return search_url
     
     def detect_english(self, text):
         """检测英文职位描述"""
-        if not text:
-            return 0.0
-            
-        text_lower = text.lower()
-        matches = 0
-        total_keywords = len(ENGLISH_DETECTION["required_keywords"])
-        
-        for keyword in ENGLISH_DETECTION["required_keywords"]:
-            if re.search(r'\b' + re.escape(keyword) + r'\b', text_lower):
-                matches += 1
-        
-        return matches / total_keywords
+        return job_filters.detect_english(text)
     
     def extract_work_arrangement(self, description, location_text):
         """提取工作安排类型"""
-        text = (description + " " + location_text).lower()
-        
-        if "hybrid" in text:
-            return "hybrid"
-        elif "on-site" in text or "on site" in text or "office" in text:
-            return "on-site"
-        elif "remote" in text or "work from home" in text:
-            return "remote"
-        else:
-            return "unknown"
+        return job_filters.extract_work_arrangement(description, location_text)
     
     def check_safety_limits(self, current_count):
         """检查安全限制"""
-        if current_count >= SAFETY_CONFIG["max_jobs_per_session"]:
-            print(f"🛑 达到会话上限: {SAFETY_CONFIG['max_jobs_per_session']} 个职位")
+        if current_count >= self.max_jobs:
+            print(f"🛑 达到会话上限: {self.max_jobs} 个职位")
             return False
         
-        # 每处理10个职位休息一次
-        if current_count > 0 and current_count % SAFETY_CONFIG["session_break_after"] == 0:
+        # 每处理10个职位休息一次（同一处理数只休息一次）
+        if not self.offline and current_count > self.last_break_count \
+                and current_count % SAFETY_CONFIG["session_break_after"] == 0:
+            self.last_break_count = current_count
             break_time = random.randint(SAFETY_CONFIG["break_duration"][0], SAFETY_CONFIG["break_duration"][1])
             print(f"⏸️  安全暂停 {break_time} 秒...")
             time.sleep(break_time)
+            self.timer.record("session_break", break_time, DELAY)
             
         return True
     
     def scrape_jobs(self):
         """安全爬取职位数据"""
         try:
+            self.session_start_time = pd.Timestamp.now().strftime('%Y-%m-%d %H:%M:%S')
+            
             # 访问搜索页面
             search_url = self.build_search_url()
-            self.driver.get(search_url)
+            first_page_start = time.perf_counter()
+            with self.timer.stage("page_load"):
+                with self.timer.measure("page_get", WAIT):
+                    self.driver.get(search_url)
+                
+                # 等待职位列表，出现后立即开始
+                print("⏳ 等待页面加载...")
+                job_list = self.wait_for(
+                    "job_list",
+                    EC.presence_of_element_located((By.CLASS_NAME, "jobs-search-results-list")),
+                    timeout=BROWSER_CONFIG["timeout"]
+                )
+            if job_list is None:
+                raise TimeoutException("职位列表没有加载出来")
             
-            print("⏳ 等待页面加载...")
-            self.safe_delay(5, 8)
+            self.startup_info['first_page_seconds'] = time.perf_counter() - first_page_start
+            driver_setup.print_startup_report(self.startup_info)
+            self.timer.event("startup", **self.startup_info)
             
-            # 等待职位列表
-            WebDriverWait(self.driver, 25).until(
-                EC.presence_of_element_located((By.CLASS_NAME, "jobs-search-results-list"))
-            )
+            # 爬取 → 查重 → 分析 → 入库
+            if PIPELINE_CONFIG["background"]:
+                # 后台线程处理，爬取循环交出职位后立即继续
+                self.worker = job_pipeline.BackgroundWorker(
+                    lambda: JobStore(self.store.db_path), self.pipeline_stages, self.report_job,
+                    PIPELINE_CONFIG["queue_size"]
+                )
+                for job_data in self.iter_jobs():
+                    with self.timer.measure("queue_put", WAIT):
+                        self.worker.submit(job_data)
+                self.finish_pipeline()
+            else:
+                # 每个职位入库后才点击下一个
+                for job_data in job_pipeline.run(self.iter_jobs(), *self.pipeline_stages(self.store)):
+                    self.report_job(job_data)
             
-            job_count = 0
-            processed_count = 0
+            duplicates = f"（其中 {self.duplicate_count} 个近似重复）" if self.duplicate_count else ""
+            print(f"\n🎉 会话完成! 安全处理 {self.saved_count} 个职位{duplicates}")
             
-            while self.check_safety_limits(processed_count):
-                try:
-                    # 获取职位列表
-                    job_elements = self.driver.find_elements(
-                        By.CSS_SELECTOR, "li.jobs-search-results__list-item"
-                    )
-                    
-                    if job_count >= len(job_elements):
-                        print("📭 没有更多职位了")
-                        break
-                    
-                    print(f"\n📋 处理职位 {processed_count + 1}/{SAFETY_CONFIG['max_jobs_per_session']}")
-                    
-                    # 模拟人类行为
-                    self.simulate_human_behavior()
-                    
-                    # 点击职位
-                    job_element = job_elements[job_count]
-                    self.driver.execute_script("arguments[0].click();", job_element)
-                    self.safe_delay(3, 5)
-                    
-                    # 提取职位信息
-                    job_data = self.extract_job_details()
-                    if job_data:
-                        # 分析职位
-                        english_score = self.detect_english(job_data.get('description', ''))
-                        is_english = english_score >= ENGLISH_DETECTION["min_english_score"]
-                        
-                        job_data['english_score'] = round(english_score, 2)
-                        job_data['is_english'] = is_english
-                        job_data['work_arrangement'] = self.extract_work_arrangement(
-                            job_data.get('description', ''),
-                            job_data.get('location', '')
-                        )
-                        
-                        self.jobs_data.append(job_data)
-                        
-                        status = "✅ 英文" if is_english else "❌ 非英文"
-                        work_type = job_data['work_arrangement']
-                        print(f"   {job_data['title']}")
-                        print(f"   {job_data['company']} | {job_data['location']}")
-                        print(f"   📊 英文评分: {english_score:.2f} | 工作类型: {work_type} | {status}")
-                        
-                        processed_count += 1
-                    
+        except Exception as e:
+            print(f"❌ 爬取过程中出错: {e}")
+        finally:
+            # 出错时已交出的职位也要处理完，导出才能包含它们
+            self.finish_pipeline()
+    
+    def pipeline_stages(self, store):
+        """查重 → 分析 → 入库各阶段，使用 store 的连接（后台模式下为工作线程自己的连接）"""
+        stages = [
+            job_pipeline.map_stage("analysis", job_pipeline.enrich, self.timer, profile=True),
+            job_pipeline.map_stage("persist", job_pipeline.persist(store, SearchIndex(store)), self.timer),
+        ]
+        if DUPLICATE_CONFIG["enabled"]:
+            stages.insert(0, job_pipeline.map_stage(
+                "dedup", job_pipeline.mark_duplicates(DuplicateIndex(store)), self.timer))
+        return stages
+    
+    def finish_pipeline(self):
+        """等待后台线程处理完已交出的职位"""
+        if self.worker is not None and not self.worker.closed:
+            with self.timer.measure("pipeline_drain", WAIT):
+                self.worker.close()
+    
+    def iter_jobs(self) -> Iterator[Dict]:
+        """逐个点击职位卡片并提取详情，作为流水线的数据源
+        
+        已在职位库中的职位不点击，中断后重新运行会从第一个未保存的职位继续。
+        """
+        job_count = 0
+        processed_count = 0
+        
+        while self.check_safety_limits(processed_count):
+            try:
+                # 获取职位列表
+                job_elements = self.driver.find_elements(
+                    By.CSS_SELECTOR, "li.jobs-search-results__list-item"
+                )
+                
+                if job_count >= len(job_elements):
+                    print("📭 没有更多职位了")
+                    break
+                
+                # 已保存过的和卡片信息不符合条件的职位不点击，不占用会话职位数
+                job_element = job_elements[job_count]
+                card_job_id = job_element.get_attribute("data-occludable-job-id")
+                reason = self.card_skip_reason(job_element, card_job_id)
+                if reason:
+                    print(f"⏭️  职位 {card_job_id} 跳过: {SKIP_REASONS[reason]}")
                     job_count += 1
-                    
-                    # 滚动到下一个职位
-                    if job_count < len(job_elements):
-                        try:
-                            next_job = job_elements[job_count]
-                            self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", next_job)
-                            self.safe_delay(1, 2)
-                        except:
-                            pass
-                    
-                except Exception as e:
-                    print(f"⚠️ 处理职位时出错: {e}")
+                    continue
+                
+                print(f"\n📋 处理职位 {processed_count + 1}/{self.max_jobs}")
+                
+                # 模拟人类行为
+                self.simulate_human_behavior()
+                
+                # 点击职位（与上一次点击的间隔不少于安全延迟）
+                self.politeness_floor()
+                with self.timer.stage("open_job"):
+                    previous_title = self.detail_title()
+                    # 点击没有生效时再点一次；面板仍未切换就跳过，否则提取到的是上一个职位的详情
+                    for _ in range(2):
+                        self.driver.execute_script("arguments[0].click();", job_element)
+                        pane_ready = self.wait_for_detail_pane(card_job_id, previous_title)
+                        if pane_ready:
+                            break
+                if not pane_ready:
+                    print(f"⚠️ 职位 {card_job_id} 的详情面板没有切换，跳过")
                     job_count += 1
-                    self.safe_delay(5, 8)  # 出错时延长延迟
                     continue
+                
+                # 提取职位信息
+                job_data = self.extract_job_details(card_job_id)
+                
+            except Exception as e:
+                print(f"⚠️ 处理职位时出错: {e}")
+                job_count += 1
+                self.safe_delay(5, 8, step="error_backoff")  # 出错时延长延迟
+                continue
             
-            print(f"\n🎉 会话完成! 安全处理 {len(self.jobs_data)} 个职位")
+            job_count += 1
+            if job_data:
+                job_data['job_id'] = card_job_id or normalize_job_id(job_data['job_url'])
+                # 同步模式下游各阶段处理完（已入库）才会回到这里，后台模式交给队列后立即返回
+                yield job_data
+                processed_count += 1
             
-        except Exception as e:
-            print(f"❌ 爬取过程中出错: {e}")
+            # 滚动到下一个职位
+            if job_count < len(job_elements):
+                try:
+                    next_job = job_elements[job_count]
+                    self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", next_job)
+                    self.safe_delay(1, 2, step="scroll")
+                except:
+                    pass
     
-    def extract_job_details(self):
+    def card_skip_reason(self, job_element, card_job_id):
+        """点击前根据列表卡片判断是否跳过，返回跳过原因"""
+        if self.card_filter is None:
+            return "seen" if self.store.has_job(card_job_id) else None
+        try:
+            card = self.driver.execute_script(CARD_SCRIPT, job_element, JOB_CARD_SELECTORS) or {}
+        except Exception:
+            card = {}
+        return self.card_filter.skip_reason(card_job_id, card)
+    
+    def report_job(self, job_data):
+        """流水线末端：统计并打印已入库的职位"""
+        self.saved_count += 1
+        if self.card_filter is not None:
+            self.card_filter.remember(job_data)
+        if job_data.get('duplicate_of'):
+            self.duplicate_count += 1
+            print(f"   ♻️  {job_data['title']} | {job_data['location']}")
+            print(f"   与职位 {job_data['duplicate_of']} 重复")
+            return
+        
+        status = "✅ 英文" if job_data['is_english'] else "❌ 非英文"
+        work_type = job_data['work_arrangement']
+        print(f"   {job_data['title']}")
+        print(f"   {job_data['company']} | {job_data['location']}")
+        print(f"   📊 英文评分: {job_data['english_score']:.2f} | 工作类型: {work_type} | {status}")
+    
+    @timed()
+    def extract_job_details(self, job_id=None):
         """提取职位详情"""
         try:
-            job_data = {}
+            # 描述是必需内容，显式等待；其余可选元素缺失时立即返回
+            self.wait_for("description", EC.presence_of_element_located(
+                (By.CSS_SELECTOR, JOB_DETAIL_SELECTORS["description"])
+            ))
             
-            # 提取标题
+            # 尝试点击"显示更多"
             try:
-                title_element = self.driver.find_element(
+                show_more_buttons = self.driver.find_elements(
                     By.CSS_SELECTOR, 
-                    ".job-details-jobs-unified-top-card__job-title, h2.job-details-jobs-unified-top-card__job-title"
+                    JOB_DETAIL_SELECTORS["show_more"]
                 )
+                for button in show_more_buttons:
+                    self.driver.execute_script("arguments[0].click();", button)
+                    # 展开后按钮消失即可继续
+                    self.wait_for("show_more", EC.invisibility_of_element(button), timeout=2)
+            except:
+                pass
+            
+            # 快照模式：只取一次页面源码，用 HTML 解析器提取
+            if SNAPSHOT_CONFIG["enabled"]:
+                page_source = self.driver.page_source
+                job_data = job_snapshots.parse_job_html(page_source, self.driver.current_url)
+                job_data['scraped_at'] = pd.Timestamp.now().strftime('%Y-%m-%d %H:%M:%S')
+                job_snapshots.save_snapshot(page_source, job_data, job_id)
+                return job_data
+            
+            job_data = {}
+            
+            # 提取标题
+            try:
+                title_element = self.driver.find_element(By.CSS_SELECTOR, JOB_DETAIL_SELECTORS["title"])
                 job_data['title'] = title_element.text.strip()
             except:
                 job_data['title'] = "Unknown Title"
             
             # 提取公司
             try:
-                company_element = self.driver.find_element(
-                    By.CSS_SELECTOR, 
-                    ".job-details-jobs-unified-top-card__company-name a, .job-details-jobs-unified-top-card__company-name"
-                )
+                company_element = self.driver.find_element(By.CSS_SELECTOR, JOB_DETAIL_SELECTORS["company"])
                 job_data['company'] = company_element.text.strip()
             except:
                 job_data['company'] = "Unknown Company"
             
             # 提取地点
             try:
-                location_element = self.driver.find_element(
-                    By.CSS_SELECTOR, 
-                    ".job-details-jobs-unified-top-card__primary-description-container, .job-details-jobs-unified-top-card__bullet"
-                )
-                location_text = location_element.text
-                if '·' in location_text:
-                    parts = location_text.split('·')
-                    if len(parts) > 1:
-                        job_data['location'] = parts[1].strip()
-                    else:
-                        job_data['location'] = location_text.strip()
-                else:
-                    job_data['location'] = location_text.strip()
+                location_element = self.driver.find_element(By.CSS_SELECTOR, JOB_DETAIL_SELECTORS["location"])
+                job_data['location'] = job_filters.split_location(location_element.text)
             except:
                 job_data['location'] = "Unknown Location"
             
             # 提取职位描述
             try:
-                # 尝试点击"显示更多"
-                try:
-                    show_more_buttons = self.driver.find_elements(
-                        By.CSS_SELECTOR, 
-                        "button[aria-label='Show more']"
-                    )
-                    for button in show_more_buttons:
-                        self.driver.execute_script("arguments[0].click();", button)
-                        self.safe_delay(1, 2)
-                except:
-                    pass
-                
-                description_element = self.driver.find_element(
-                    By.CSS_SELECTOR, 
-                    "#job-details, .jobs-description, .jobs-description-content"
-                )
+                description_element = self.driver.find_element(By.CSS_SELECTOR, JOB_DETAIL_SELECTORS["description"])
                 job_data['description'] = description_element.text.strip()
             except:
                 job_data['description'] = ""
             
             # 提取职位链接
             try:
-                job_link_element = self.driver.find_element(
-                    By.CSS_SELECTOR,
-                    "a.jobs-search__job-details--container-embedded-link"
-                )
+                job_link_element = self.driver.find_element(By.CSS_SELECTOR, JOB_DETAIL_SELECTORS["job_link"])
                 job_data['job_url'] = job_link_element.get_attribute('href')
             except:
                 job_data['job_url'] = self.driver.current_url
@@ -295,46 +446,36 @@ class ConservativeLinkedInScraper:
             print(f"⚠️ 提取职位详情时出错: {e}")
             return None
     
+    @timed()
     def save_to_excel(self):
-        """保存结果到Excel"""
-        if not self.jobs_data:
+        """保存职位到Excel（从职位库查询）"""
+        rolling = EXPORT_CONFIG["mode"] == "rolling"
+        if rolling:
+            # 只追加尚未导出过的职位
+            filename = EXPORT_CONFIG["rolling_workbook"]
+            df, last_rowid = self.store.unexported_jobs(filename)
+        else:
+            timestamp = pd.Timestamp.now().strftime('%Y%m%d_%H%M%S')
+            filename = f"german_jobs_{timestamp}.xlsx"
+            df = self.store.query_jobs(since=self.session_start_time)
+        
+        if df.empty:
             print("❌ 没有数据可保存")
             return
         
-        timestamp = pd.Timestamp.now().strftime('%Y%m%d_%H%M%S')
-        filename = f"german_jobs_{timestamp}.xlsx"
-        
-        df = pd.DataFrame(self.jobs_data)
-        
-        # 重新排列列的顺序
-        column_order = [
-            'title', 'company', 'location', 'work_arrangement', 
-            'is_english', 'english_score', 'job_url', 'scraped_at'
-        ]
-        
-        existing_columns = [col for col in column_order if col in df.columns]
-        other_columns = [col for col in df.columns if col not in column_order]
-        
-        df = df[existing_columns + other_columns]
+        # 所有职位、英文职位、按工作类型分类
+        sheets = job_sheets(df)
+        english_jobs = sheets['English Jobs']
         
-        # 创建Excel文件
-        with pd.ExcelWriter(filename, engine='openpyxl') as writer:
-            # 所有职位
-            df.to_excel(writer, sheet_name='All Jobs', index=False)
-            
-            # 仅英文职位
-            english_jobs = df[df['is_english'] == True]
-            english_jobs.to_excel(writer, sheet_name='English Jobs', index=False)
-            
-            # 按工作类型分类
-            for work_type in ['hybrid', 'on-site']:
-                type_jobs = english_jobs[english_jobs['work_arrangement'] == work_type]
-                if not type_jobs.empty:
-                    type_jobs.to_excel(writer, sheet_name=f'{work_type.title()} Jobs', index=False)
+        if rolling:
+            append_rows(filename, sheets)
+            self.store.mark_exported(filename, last_rowid)
+        else:
+            write_workbook(filename, sheets)
         
         print(f"💾 数据已保存到: {filename}")
         print(f"📊 本次会话统计:")
-        print(f"   总职位数: {len(df)}")
+        print(f"   {'新增' if rolling else '总'}职位数: {len(df)}")
         print(f"   英文职位: {len(english_jobs)}")
         
         if not english_jobs.empty:
@@ -343,11 +484,39 @@ class ConservativeLinkedInScraper:
             for work_type, count in work_stats.items():
                 print(f"     {work_type}: {count}")
     
+    @timed()
+    def save_to_parquet(self):
+        """把尚未导出的职位追加到 Parquet 数据集"""
+        root = PARQUET_CONFIG["root"]
+        target = f"parquet:{root}"
+        df, last_rowid = self.store.unexported_jobs(target)
+        if df.empty:
+            return
+        
+        count = parquet_export.save_to_parquet(df, root)
+        self.store.mark_exported(target, last_rowid)
+        print(f"🗂️  Parquet 已追加 {count} 个职位: {root}")
+    
     def close(self):
         """安全关闭浏览器"""
+        # 爬取中途出错时，已交出的职位同样处理完再关闭
+        self.finish_pipeline()
         if self.driver:
             self.driver.quit()
             print("🔚 浏览器已安全关闭")
+        self.store.close()
+        
+        # 列表预筛选跳过的职位按原因记入会话记录
+        if self.card_filter is not None and self.card_filter.skipped:
+            self.card_filter.print_summary()
+            self.timer.event("card_filter", skipped=self.card_filter.skipped,
+                             reasons=dict(self.card_filter.counts))
+        
+        # 会话耗时汇总（包含保存阶段）
+        self.timer.print_summary()
+        self.timer.close()
+        if self.timer.log_path:
+            print(f"⏱️  会话耗时记录: {self.timer.log_path}")
 
 def main():
     print("=" * 50)
@@ -360,20 +529,23 @@ def main():
         # 设置浏览器
         scraper.setup_driver()
         
-        # 安全提示
-        print("\n🔐 安全提示:")
-        print("   • 请在浏览器中登录LinkedIn账号")
-        print("   • 登录后脚本将自动开始（安全延迟）")
-        print("   • 本次会话最多处理20个职位")
-        print("   • 推荐每天运行2-3次，间隔4小时")
-        input("\n   按回车键继续...")
+        # 安全提示（离线模式不需要登录）
+        if not scraper.offline:
+            print("\n🔐 安全提示:")
+            print("   • 请在浏览器中登录LinkedIn账号")
+            print("   • 登录后脚本将自动开始（安全延迟）")
+            print("   • 本次会话最多处理20个职位")
+            print("   • 推荐每天运行2-3次，间隔4小时")
+            input("\n   按回车键继续...")
         
         # 开始爬取
         scraper.scrape_jobs()
         
-        # 保存结果
-        if scraper.jobs_data:
+        # 保存结果（职位已逐个写入职位库，爬取中途出错时已保存的职位同样导出）
+        if scraper.saved_count:
             scraper.save_to_excel()
+            if PARQUET_CONFIG["enabled"]:
+                scraper.save_to_parquet()
             print(f"\n🎯 会话完成!")
             print("   下次运行建议在4小时之后")
         else:
@@ -0,0 +1,169 @@
+"""近似重复职位检测 - 描述词组 MinHash 签名 + LSH 分段分桶
+
+同一职位重新发布、或在多个城市分别发布时，链接和职位ID不同但描述几乎一样。
+每个描述取连续词组（shingle）计算 MinHash 签名，签名按段（band）哈希进桶，
+只有至少一段落在同一个桶里的职位才比较签名，插入和查询都与已有职位数无关。
+签名和分桶存放在职位库中，跨会话持续有效。
+"""
+import zlib
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from config import DUPLICATE_CONFIG
+from html_text import words
+
+MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+EMPTY_HASH = np.uint64((1 << 61) - 1)
+
+# 词组哈希：相邻词的 crc32 按位置加权相加（溢出取模）
+_POSITION_WEIGHTS = np.array([0x9E3779B97F4A7C15, 0xC2B2AE3D27D4EB4F, 0x165667B19E3779F9,
+                              0x85EBCA77C2B2AE63, 0x27D4EB2F165667C5], dtype=np.uint64)
+_BAND_WEIGHTS_SEED = 20240101
+
+
+def shingle_hashes(text: str, size: int = None) -> np.ndarray:
+    """描述中所有连续 size 个词组成的词组的 32 位哈希（去重）"""
+    size = size or DUPLICATE_CONFIG["shingle_size"]
+    tokens = words(text)
+    if not tokens:
+        return np.zeros(0, dtype=np.uint64)
+
+    hashes = np.fromiter((zlib.crc32(token.encode("utf-8")) for token in tokens),
+                         dtype=np.uint64, count=len(tokens))
+    size = min(size, len(hashes))
+    count = len(hashes) - size + 1
+    combined = np.zeros(count, dtype=np.uint64)
+    with np.errstate(over="ignore"):
+        for offset in range(size):
+            combined += hashes[offset:offset + count] * _POSITION_WEIGHTS[offset]
+    return np.unique((combined ^ (combined >> np.uint64(32))) & np.uint64(0xFFFFFFFF))
+
+
+class MinHasher:
+    """num_perm 个 (a·x + b) mod p 哈希函数；参数由固定种子生成，跨进程/会话一致"""
+
+    def __init__(self, num_perm: int = None, bands: int = None, seed: int = 1):
+        self.num_perm = num_perm or DUPLICATE_CONFIG["num_perm"]
+        self.bands = bands or DUPLICATE_CONFIG["bands"]
+        if self.num_perm % self.bands:
+            raise ValueError("num_perm 必须是 bands 的整数倍")
+        self.rows = self.num_perm // self.bands
+
+        rng = np.random.default_rng(seed)
+        self.a = rng.integers(1, 1 << 32, self.num_perm, dtype=np.uint64)
+        self.b = rng.integers(0, 1 << 32, self.num_perm, dtype=np.uint64)
+        self.band_weights = np.random.default_rng(_BAND_WEIGHTS_SEED).integers(
+            1, 1 << 63, (self.bands, self.rows), dtype=np.uint64)
+
+    def signature(self, shingles: np.ndarray) -> np.ndarray:
+        """MinHash 签名；没有词组时全部为最大值（不会与任何职位相似）"""
+        if len(shingles) == 0:
+            return np.full(self.num_perm, EMPTY_HASH, dtype=np.uint64)
+        # a, x < 2^32，a·x + b 不会超出 64 位
+        values = (self.a[:, None] * shingles[None, :] + self.b[:, None]) % MERSENNE_PRIME
+        return values.min(axis=1)
+
+    def band_keys(self, signature: np.ndarray) -> List[int]:
+        """每段签名哈希成一个桶键（高位是段号，不同段的桶不会混在一起）"""
+        with np.errstate(over="ignore"):
+            folded = (signature.reshape(self.bands, self.rows) * self.band_weights).sum(axis=1)
+        folded = (folded >> np.uint64(8)) | (np.arange(self.bands, dtype=np.uint64) << np.uint64(56))
+        return [int(key) for key in folded]
+
+    def is_empty(self, signature: np.ndarray) -> bool:
+        return bool((signature == EMPTY_HASH).all())
+
+
+def similarity(signature: np.ndarray, other: np.ndarray) -> float:
+    """签名估计的 Jaccard 相似度"""
+    return float((signature == other).mean())
+
+
+class DuplicateIndex:
+    """持久化在职位库中的近似重复索引
+
+    minhash 表保存每个职位的签名和所属的原始职位，lsh_buckets 表保存分段桶键。
+    """
+
+    def __init__(self, store, hasher: MinHasher = None, threshold: float = None):
+        self.conn = store.conn
+        self.hasher = hasher or MinHasher()
+        self.threshold = threshold or DUPLICATE_CONFIG["threshold"]
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS minhash (
+                job_id       TEXT PRIMARY KEY,
+                signature    BLOB NOT NULL,
+                duplicate_of TEXT
+            );
+            CREATE TABLE IF NOT EXISTS lsh_buckets (
+                bucket INTEGER NOT NULL,
+                job_id TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_lsh_buckets_bucket ON lsh_buckets (bucket);
+        """)
+        self.conn.commit()
+
+    def signature(self, description: str) -> np.ndarray:
+        return self.hasher.signature(shingle_hashes(description))
+
+    def find(self, signature: np.ndarray, exclude: str = None) -> Optional[Tuple[str, float]]:
+        """最相似的已索引职位 (原始职位ID, 相似度)，低于阈值时返回 None"""
+        if self.hasher.is_empty(signature):
+            return None
+        keys = self.hasher.band_keys(signature)
+        rows = self.conn.execute(
+            f"SELECT DISTINCT m.job_id, m.signature, m.duplicate_of FROM lsh_buckets b "
+            f"JOIN minhash m ON m.job_id = b.job_id WHERE b.bucket IN ({', '.join('?' for _ in keys)})",
+            keys
+        ).fetchall()
+
+        best = None
+        for job_id, blob, duplicate_of in rows:
+            if job_id == exclude:
+                continue
+            score = similarity(signature, np.frombuffer(blob, dtype=np.uint64))
+            if score >= self.threshold and (best is None or score > best[1]):
+                # 指向簇里最早的职位，避免形成重复链
+                best = (duplicate_of or job_id, score)
+        return best
+
+    def add(self, job_id: str, signature: np.ndarray, duplicate_of: Optional[str] = None,
+            commit: bool = True):
+        """索引一个职位（重复职位也索引，后续转载可以匹配到它）"""
+        self.conn.execute(
+            "INSERT OR REPLACE INTO minhash (job_id, signature, duplicate_of) VALUES (?, ?, ?)",
+            (job_id, signature.tobytes(), duplicate_of)
+        )
+        self.conn.execute("DELETE FROM lsh_buckets WHERE job_id = ?", (job_id,))
+        if not self.hasher.is_empty(signature):
+            self.conn.executemany(
+                "INSERT INTO lsh_buckets (bucket, job_id) VALUES (?, ?)",
+                [(key, job_id) for key in self.hasher.band_keys(signature)]
+            )
+        if commit:
+            self.conn.commit()
+
+    def check(self, job_id: str, description: str, commit: bool = True) -> Optional[str]:
+        """查重并索引，返回重复的原始职位ID（不重复时为 None）"""
+        signature = self.signature(description)
+        match = self.find(signature, exclude=job_id)
+        duplicate_of = match[0] if match else None
+        self.add(job_id, signature, duplicate_of, commit)
+        return duplicate_of
+
+    def index_existing(self, store) -> Dict[str, str]:
+        """为职位库中尚未索引的职位建立索引（按入库顺序），返回新发现的 {职位ID: 原始职位ID}"""
+        job_ids = [row[0] for row in store.conn.execute(
+            "SELECT job_id FROM jobs WHERE job_id NOT IN (SELECT job_id FROM minhash) ORDER BY rowid"
+        )]
+        found = {}
+        for job_id, description in store.iter_descriptions(job_ids):
+            duplicate_of = self.check(job_id, description or "", commit=False)
+            if duplicate_of:
+                found[job_id] = duplicate_of
+        self.conn.commit()
+        if found:
+            store.mark_duplicates(found)
+        return found
+
@@ -0,0 +1,111 @@
+import os
+from typing import Dict, List, Optional
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+
+from config import PARQUET_CONFIG
+from job_filters import city_of
+from job_store import normalize_job_id
+
+PARTITION_COLUMNS = ['scrape_date', 'city']
+
+# 描述单独放在 descriptions 数据集，分析查询只读 jobs 数据集
+JOBS_DIR = "jobs"
+DESCRIPTIONS_DIR = "descriptions"
+
+# 各列固定的类型：某次写入整列为空（如全是重复职位、没有英文判断）时也不写成 null 类型，
+# 各次写入的文件 schema 一致
+COLUMN_TYPES = {
+    'job_id': pa.string(), 'title': pa.string(), 'company': pa.string(), 'location': pa.string(),
+    'work_arrangement': pa.string(), 'is_english': pa.bool_(), 'english_score': pa.float64(),
+    'job_url': pa.string(), 'scraped_at': pa.string(), 'duplicate_of': pa.string(),
+    'description': pa.string(), 'scrape_date': pa.string(), 'city': pa.string(),
+}
+
+
+def _to_table(df: pd.DataFrame) -> pa.Table:
+    """DataFrame -> Arrow 表，已知列转换为 COLUMN_TYPES 中的类型，其他列保持推断的类型"""
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    schema = pa.schema([pa.field(field.name, COLUMN_TYPES.get(field.name, field.type)) for field in table.schema],
+                       metadata=table.schema.metadata)
+    return table.cast(schema)
+
+
+def save_to_parquet(df: pd.DataFrame, root: str = None) -> int:
+    """追加写入 Parquet 数据集，返回写入行数"""
+    if df.empty:
+        return 0
+    root = root or PARQUET_CONFIG["root"]
+
+    df = df.copy()
+    if 'job_id' not in df.columns:
+        df['job_id'] = df['job_url'].map(normalize_job_id)
+    df['scrape_date'] = df['scraped_at'].astype(str).str[:10]
+    df['city'] = df['location'].map(city_of)
+
+    # 每次写入使用唯一文件名，追加而不覆盖已有文件
+    basename = f"part-{pd.Timestamp.now().strftime('%Y%m%d%H%M%S%f')}-{{i}}.parquet"
+    job_columns = [column for column in df.columns if column != 'description']
+
+    ds.write_dataset(
+        _to_table(df[job_columns]),
+        os.path.join(root, JOBS_DIR),
+        format="parquet",
+        partitioning=PARTITION_COLUMNS,
+        partitioning_flavor="hive",
+        basename_template=basename,
+        existing_data_behavior="overwrite_or_ignore",
+    )
+    if 'description' in df.columns:
+        ds.write_dataset(
+            _to_table(df[['job_id', 'scrape_date', 'description']]),
+            os.path.join(root, DESCRIPTIONS_DIR),
+            format="parquet",
+            partitioning=['scrape_date'],
+            partitioning_flavor="hive",
+            basename_template=basename,
+            existing_data_behavior="overwrite_or_ignore",
+        )
+    return len(df)
+
+
+def _filter_expression(filters: Dict):
+    """{"is_english": True, "city": ["Berlin", "Munich"]} -> 数据集过滤表达式"""
+    expression = None
+    for column, value in filters.items():
+        if isinstance(value, (list, tuple, set)):
+            condition = ds.field(column).isin(list(value))
+        else:
+            condition = ds.field(column) == value
+        expression = condition if expression is None else expression & condition
+    return expression
+
+
+def load_jobs(root: str = None, columns: Optional[List[str]] = None, filters: Optional[Dict] = None,
+              with_description: bool = False) -> pd.DataFrame:
+    """按需读取列，过滤条件下推到分区目录和行组统计信息
+
+    例: load_jobs(columns=['title', 'company'], filters={'is_english': True, 'work_arrangement': 'hybrid'})
+    """
+    root = root or PARQUET_CONFIG["root"]
+    jobs = ds.dataset(os.path.join(root, JOBS_DIR), format="parquet", partitioning="hive")
+
+    read_columns = columns
+    if columns is not None and with_description and 'job_id' not in columns:
+        read_columns = columns + ['job_id']
+    table = jobs.to_table(columns=read_columns, filter=_filter_expression(filters or {}))
+
+    if with_description:
+        descriptions = ds.dataset(os.path.join(root, DESCRIPTIONS_DIR), format="parquet", partitioning="hive")
+        description_table = descriptions.to_table(
+            columns=['job_id', 'description'],
+            filter=pc.field('job_id').isin(table.column('job_id'))
+        )
+        table = table.join(description_table, 'job_id', join_type="left outer")
+        if columns is not None and 'job_id' not in columns:
+            table = table.drop(['job_id'])
+
+    return table.to_pandas()
@@ -0,0 +1,249 @@
+"""会话性能记录 - 按阶段统计耗时，区分主动延迟、页面等待和实际处理
+
+每个会话的记录以 JSON lines 写入 PERF_CONFIG["log_dir"]，汇总历史会话:
+    python perf.py perf_logs/*.jsonl
+"""
+import functools
+import math
+import glob
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Tuple
+
+from config import PERF_CONFIG
+
+# 耗时类型
+DELAY = "delay"        # 主动的安全延迟（礼貌间隔、模拟人类、休息）
+WAIT = "wait"          # 等待页面条件成立（真实的加载时间）
+MISSING = "missing"    # 等到超时也没有出现的元素（浪费的等待）
+WORK = "work"          # 实际处理（提取、分析、保存）
+
+KINDS = (DELAY, WAIT, MISSING)
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    """最近秩百分位数"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, math.ceil(fraction * len(ordered)) - 1))
+    return ordered[index]
+
+
+class StepTimer:
+    """按步骤和阶段记录耗时
+
+    record/measure 记录单个等待或延迟步骤；stage 记录一个阶段，
+    阶段内发生的延迟和等待会计入该阶段，剩下的时间算作实际处理。
+    可以在多个线程中同时使用：每个线程的阶段只计入本线程的延迟和等待。
+    """
+
+    def __init__(self, log_path: Optional[str] = None):
+        self.records: List[Tuple[str, str, float]] = []
+        self.stages: List[Dict] = []
+        self.log_path = log_path
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._log_file = None
+        self._profiler = None
+
+    @classmethod
+    def for_session(cls) -> "StepTimer":
+        """每个会话一个日志文件"""
+        os.makedirs(PERF_CONFIG["log_dir"], exist_ok=True)
+        name = time.strftime("session_%Y%m%d_%H%M%S.jsonl")
+        return cls(os.path.join(PERF_CONFIG["log_dir"], name))
+
+    @property
+    def _open_stages(self) -> List[Dict]:
+        """当前线程中尚未结束的阶段"""
+        if not hasattr(self._local, 'stages'):
+            self._local.stages = []
+        return self._local.stages
+
+    def _write(self, event: Dict):
+        if not self.log_path:
+            return
+        event['ts'] = round(time.time(), 3)
+        line = json.dumps(event, ensure_ascii=False) + "\n"
+        with self._lock:
+            if self._log_file is None:
+                self._log_file = open(self.log_path, "a", encoding="utf-8")
+            self._log_file.write(line)
+            self._log_file.flush()
+
+    def record(self, step: str, seconds: float, kind: str = WORK):
+        self.records.append((step, kind, seconds))
+        for stage in self._open_stages:
+            if kind in stage:
+                stage[kind] += seconds
+        self._write({'type': "step", 'name': step, 'kind': kind, 'seconds': round(seconds, 4)})
+
+    def event(self, name: str, **fields):
+        """记录一次性事件（如启动报告）"""
+        self._write(dict({'type': "event", 'name': name}, **fields))
+
+    @contextmanager
+    def measure(self, step: str, kind: str = WORK):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(step, time.perf_counter() - start, kind)
+
+    @contextmanager
+    def stage(self, name: str, profile: bool = False):
+        """记录一个阶段；profile=True 且配置了分析器时同时做性能剖析"""
+        stage = {'type': "stage", 'name': name, DELAY: 0.0, WAIT: 0.0, MISSING: 0.0}
+        self._open_stages.append(stage)
+        profiler = self._start_profiler() if profile else None
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - start
+            if profiler is not None:
+                self._stop_profiler(profiler)
+            self._open_stages.remove(stage)
+            stage['seconds'] = seconds
+            stage[WORK] = max(0.0, seconds - sum(stage[kind] for kind in KINDS))
+            self.stages.append(stage)
+            self._write({key: round(value, 4) if isinstance(value, float) else value
+                         for key, value in stage.items()})
+
+    def _start_profiler(self):
+        """按 PERF_CONFIG["profile_analysis"] 启用 cProfile 或 pyinstrument"""
+        backend = PERF_CONFIG.get("profile_analysis")
+        if not backend:
+            return None
+        if self._profiler is None:
+            if backend == "pyinstrument":
+                from pyinstrument import Profiler
+                self._profiler = Profiler()
+            else:
+                import cProfile
+                self._profiler = cProfile.Profile()
+        if backend == "pyinstrument":
+            self._profiler.start()
+        else:
+            self._profiler.enable()
+        return self._profiler
+
+    def _stop_profiler(self, profiler):
+        if PERF_CONFIG.get("profile_analysis") == "pyinstrument":
+            profiler.stop()
+        else:
+            profiler.disable()
+
+    def save_profile(self):
+        """保存剖析结果到日志目录（.prof 可用 snakeviz / pstats 查看）"""
+        if self._profiler is None:
+            return None
+        base = os.path.splitext(self.log_path or "analysis")[0]
+        if PERF_CONFIG.get("profile_analysis") == "pyinstrument":
+            path = base + "_analysis.html"
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(self._profiler.output_html())
+        else:
+            path = base + "_analysis.prof"
+            self._profiler.dump_stats(path)
+        print(f"🔬 分析阶段剖析结果: {path}")
+        return path
+
+    def close(self):
+        self.save_profile()
+        if self._log_file is not None:
+            self._log_file.close()
+            self._log_file = None
+
+    def totals_by_kind(self) -> Dict[str, float]:
+        totals: Dict[str, float] = {}
+        for _, kind, seconds in self.records:
+            totals[kind] = totals.get(kind, 0.0) + seconds
+        return totals
+
+    def print_summary(self):
+        """打印阶段汇总表和步骤耗时"""
+        print_stage_table(self.stages)
+
+        steps: Dict[Tuple[str, str], List[float]] = {}
+        for step, kind, seconds in self.records:
+            steps.setdefault((step, kind), []).append(seconds)
+        if steps:
+            print("⏱️  等待/延迟步骤:")
+            for (step, kind), durations in sorted(steps.items(), key=lambda item: -sum(item[1])):
+                print(f"   {step:<20} {kind:<8} {len(durations):>4} 次  共 {sum(durations):7.1f}s")
+
+
+def print_stage_table(stages: List[Dict]):
+    """每个阶段的次数、p50/p95 以及延迟/等待/处理的拆分"""
+    by_name: Dict[str, List[Dict]] = {}
+    for stage in stages:
+        by_name.setdefault(stage['name'], []).append(stage)
+    if not by_name:
+        return
+
+    print("⏱️  阶段耗时:")
+    print(f"   {'阶段':<22}{'次数':>6}{'p50':>9}{'p95':>9}{'总计':>10}{'延迟':>9}{'等待':>9}{'浪费':>9}{'处理':>9}")
+    for name, items in sorted(by_name.items(), key=lambda item: -sum(s['seconds'] for s in item[1])):
+        durations = [s['seconds'] for s in items]
+        print(f"   {name:<22}{len(items):>6}{percentile(durations, 0.5):>9.2f}{percentile(durations, 0.95):>9.2f}"
+              f"{sum(durations):>10.1f}{sum(s[DELAY] for s in items):>9.1f}{sum(s[WAIT] for s in items):>9.1f}"
+              f"{sum(s[MISSING] for s in items):>9.1f}{sum(s[WORK] for s in items):>9.1f}")
+
+
+def timed(stage: str = None, profile: bool = False):
+    """方法装饰器：把方法调用记录为一个阶段（实例需要有 self.timer）"""
+    def decorator(func):
+        name = stage or func.__name__
+
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            with self.timer.stage(name, profile=profile):
+                return func(self, *args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def load_events(paths: List[str], kind: str, name: str = None) -> List[Dict]:
+    """读取会话日志中某类记录（stage/step/event），name 不为空时只取该名称"""
+    events = []
+    for path in paths:
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                event = json.loads(line)
+                if event.get('type') == kind and (name is None or event.get('name') == name):
+                    events.append(event)
+    return events
+
+
+def load_stages(paths: List[str]) -> List[Dict]:
+    """读取会话日志中的阶段记录"""
+    return load_events(paths, "stage")
+
+
+def main():
+    paths = sys.argv[1:] or sorted(glob.glob(os.path.join(PERF_CONFIG["log_dir"], "*.jsonl")))
+    if not paths:
+        print("❌ 没有找到会话日志")
+        return
+    print(f"📂 {len(paths)} 个会话日志")
+    print_stage_table(load_stages(paths))
+
+    # 列表预筛选跳过的职位（按原因累计）
+    skips: Dict[str, int] = {}
+    for event in load_events(paths, "event", "card_filter"):
+        for reason, count in event.get('reasons', {}).items():
+            skips[reason] = skips.get(reason, 0) + count
+    if skips:
+        print(f"⏭️  列表预筛选跳过 {sum(skips.values())} 个职位:")
+        for reason, count in sorted(skips.items(), key=lambda item: -item[1]):
+            print(f"   {reason:<16} {count:>6}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""离线重新分析 - 读取已保存的职位数据重新评分，不启动浏览器
+
+用法:
+    python reanalyze.py                       # 分析当前目录下所有 german_jobs_*.xlsx
+    python reanalyze.py jobs.db               # 从本地职位库读取
+    python reanalyze.py a.xlsx b.csv -o out.xlsx
+    python reanalyze.py jobs.csv -o out.csv   # 大批量时输出 csv 更快
+"""
+import argparse
+import glob
+import time
+from typing import Dict, List
+
+import pandas as pd
+
+from analysis_cache import AnalysisCache
+from config import ANALYSIS_CACHE_CONFIG, ANALYSIS_CRITERIA
+from job_analyzer import JobAnalyzer
+from job_store import JobStore
+import job_filters
+
+DEFAULT_PATTERN = "german_jobs_*.xlsx"
+
+
+def load_saved_jobs(paths: List[str]) -> pd.DataFrame:
+    """读取职位库或导出的 xlsx/csv 文件，按 job_url 去重"""
+    frames = []
+    for path in paths:
+        if path.endswith(".db"):
+            store = JobStore(path)
+            frames.append(store.query_jobs())
+            store.close()
+        elif path.endswith(".csv"):
+            frames.append(pd.read_csv(path))
+        else:
+            sheets = pd.read_excel(path, sheet_name=None)
+            frames.append(sheets.get('All Jobs', next(iter(sheets.values()))))
+
+    if not frames:
+        return pd.DataFrame()
+
+    df = pd.concat(frames, ignore_index=True)
+    if 'job_url' in df.columns:
+        df = df.drop_duplicates(subset='job_url', keep='last')
+    for column in ('description', 'location'):
+        if column not in df.columns:
+            df[column] = ""
+    df[['description', 'location']] = df[['description', 'location']].fillna("").astype(str)
+    return df.reset_index(drop=True)
+
+
+def merge_analysis(job: Dict, analysis: Dict) -> Dict:
+    """把 JobAnalyzer 的分析结果合并进职位记录"""
+    if "reason" in analysis:
+        analysis["rejection_reason"] = analysis.pop("reason")
+    for key, value in analysis.items():
+        # 英文判断以 ENGLISH_DETECTION 的结果为准
+        if key == "is_english":
+            continue
+        job[key] = ", ".join(value) if isinstance(value, list) else value
+    return job
+
+
+def run(args: argparse.Namespace):
+    """按命令行参数重新分析（也供 cli.py analyze 调用）"""
+    paths = args.inputs or sorted(glob.glob(DEFAULT_PATTERN))
+    if not paths:
+        print("❌ 没有找到已保存的职位文件")
+        return
+
+    start = time.perf_counter()
+    df = load_saved_jobs(paths)
+    print(f"📂 读取 {len(paths)} 个文件, 共 {len(df)} 个职位 ({time.perf_counter() - start:.1f}s)")
+
+    start = time.perf_counter()
+    cache = AnalysisCache() if ANALYSIS_CACHE_CONFIG["enabled"] and not args.no_cache else None
+    analyzer = JobAnalyzer(ANALYSIS_CRITERIA, cache=cache)
+    jobs = job_filters.enrich_frame(df).to_dict('records')
+    analyses = analyzer.analyze_many((job['description'] for job in jobs), workers=args.workers)
+    jobs = [merge_analysis(job, analysis) for job, analysis in zip(jobs, analyses)]
+    print(f"🔬 重新分析完成 ({time.perf_counter() - start:.1f}s)")
+    if cache is not None:
+        hits, misses = cache.session_counts.get('analysis', (0, 0))
+        print(f"   分析缓存: 命中 {hits} | 未命中 {misses}")
+        cache.close()
+
+    output = args.output or f"reanalyzed_jobs_{pd.Timestamp.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
+    if output.endswith(".csv"):
+        pd.DataFrame(jobs).to_csv(output, index=False)
+        print(f"💾 数据已保存到 {output}")
+    else:
+        analyzer.save_to_excel(jobs, output)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="离线重新分析已保存的职位（不启动浏览器）")
+    parser.add_argument("inputs", nargs="*", help=f"职位库(.db)或 xlsx/csv 文件，默认 {DEFAULT_PATTERN}")
+    parser.add_argument("-o", "--output", help="输出文件，默认 reanalyzed_jobs_<时间>.xlsx")
+    parser.add_argument("-w", "--workers", type=int, help="分析进程数，默认CPU核数")
+    parser.add_argument("--no-cache", action="store_true", help="不读写分析结果缓存")
+    run(parser.parse_args())
+
+
+if __name__ == "__main__":
+    main()
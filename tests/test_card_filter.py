@@ -0,0 +1,49 @@
+"""点击前的卡片预筛选"""
+import pytest
+
+from card_filter import CardFilter
+from config import CARD_FILTER_CONFIG
+
+
+class FakeStore:
+    def __init__(self, jobs=()):
+        self.jobs = list(jobs)
+
+    def job_ids(self):
+        return {job['job_id'] for job in self.jobs}
+
+    def listings(self):
+        return [(job['title'], job['company'], job['location']) for job in self.jobs]
+
+
+def card(title="Data Engineer", company="Acme", location="Berlin, Germany (Hybrid)"):
+    return {'title': title, 'company': company, 'location': location}
+
+
+@pytest.mark.parametrize("location", [
+    "München, Bayern, Deutschland (Hybrid)",
+    "Muenchen, Germany",
+    "Munich, Bavaria, Germany (On-site)",
+    "Dusseldorf, North Rhine-Westphalia",
+    "Düsseldorf, Nordrhein-Westfalen, Deutschland",
+    "Duesseldorf, Germany",
+])
+def test_german_and_english_city_names_are_not_skipped(location):
+    assert CardFilter(FakeStore()).skip_reason("1", card(location=location)) is None
+
+
+def test_other_city_is_skipped():
+    assert CardFilter(FakeStore()).skip_reason("1", card(location="Hamburg, Germany")) == "city"
+
+
+def test_same_title_company_and_city_is_clicked_by_default():
+    store = FakeStore([{'job_id': "1", 'title': "Software Engineer", 'company': "Acme", 'location': "Berlin, Germany"}])
+    cards = CardFilter(store)
+    assert cards.skip_reason("2", card(title="Software Engineer")) is None
+    assert cards.skip_reason("1", card(title="Software Engineer")) == "seen"
+
+
+def test_seen_listings_skipped_when_enabled(monkeypatch):
+    monkeypatch.setitem(CARD_FILTER_CONFIG, "skip_seen_listings", True)
+    store = FakeStore([{'job_id': "1", 'title': "Software Engineer", 'company': "Acme", 'location': "Berlin, Germany"}])
+    assert CardFilter(store).skip_reason("2", card(title="Software Engineer")) == "seen_listing"
@@ -0,0 +1,106 @@
+"""iter_jobs 在大部分卡片被预筛选跳过时的行为（不启动浏览器）"""
+import pytest
+
+pytest.importorskip("selenium")
+
+import main
+from card_filter import CARD_SCRIPT
+
+
+class FakeCard:
+    def __init__(self, job_id, title, company, location):
+        self.job_id = job_id
+        self.fields = {'title': title, 'company': company, 'location': location}
+
+    def get_attribute(self, name):
+        return self.job_id if name == "data-occludable-job-id" else None
+
+
+class FakeDriver:
+    def __init__(self, cards):
+        self.cards = cards
+        self.clicked = []
+
+    def find_elements(self, by, selector):
+        return self.cards
+
+    def execute_script(self, script, *args):
+        if script == CARD_SCRIPT:
+            return dict(args[0].fields)
+        if "click()" in script:
+            self.clicked.append(args[0].job_id)
+        return None
+
+
+def make_cards(new_before, skipped, new_after):
+    cards = [FakeCard(str(i), "Backend Engineer", f"Company {i}", "Berlin, Germany (Hybrid)")
+             for i in range(new_before)]
+    cards += [FakeCard(str(1000 + i), "Backend Engineer", "Elsewhere GmbH", "Hamburg, Germany")
+              for i in range(skipped)]
+    cards += [FakeCard(str(2000 + i), "Kotlin Developer", f"Company {2000 + i}", "Munich, Germany (On-site)")
+              for i in range(new_after)]
+    return cards
+
+
+@pytest.fixture
+def scraper(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setitem(main.OFFLINE_CONFIG, "enabled", False)
+    sleeps = []
+    monkeypatch.setattr(main.time, "sleep", sleeps.append)
+
+    scraper = main.ConservativeLinkedInScraper(str(tmp_path / "jobs.db"))
+    scraper.sleeps = sleeps
+    for name in ("simulate_human_behavior", "politeness_floor"):
+        monkeypatch.setattr(scraper, name, lambda: None)
+    monkeypatch.setattr(scraper, "safe_delay", lambda *args, **kwargs: None)
+    monkeypatch.setattr(scraper, "detail_title", lambda: "")
+    monkeypatch.setattr(scraper, "wait_for_detail_pane", lambda job_id, previous_title: True)
+    monkeypatch.setattr(scraper, "extract_job_details", lambda job_id: {
+        'title': "Backend Engineer", 'company': f"Company {job_id}", 'location': "Berlin, Germany",
+        'description': "", 'job_url': f"https://www.linkedin.com/jobs/view/{job_id}/",
+    })
+    yield scraper
+    scraper.store.close()
+    scraper.timer.close()
+
+
+def breaks(scraper):
+    return [seconds for step, kind, seconds in scraper.timer.records if step == "session_break"]
+
+
+def test_skipped_cards_do_not_repeat_session_break(scraper):
+    break_after = main.SAFETY_CONFIG["session_break_after"]
+    scraper.driver = FakeDriver(make_cards(break_after, 30, 1))
+
+    jobs = list(scraper.iter_jobs())
+
+    assert len(jobs) == break_after + 1
+    assert scraper.card_filter.counts["city"] == 30
+    assert len(breaks(scraper)) == 1
+    assert len(scraper.sleeps) == 1
+
+
+def test_seen_cards_skipped_without_break_on_resume(scraper):
+    """已保存的职位全部跳过，不点击也不暂停"""
+    cards = make_cards(2 * main.SAFETY_CONFIG["session_break_after"], 0, 0)
+    for card in cards:
+        scraper.card_filter.seen_ids.add(card.job_id)
+    scraper.driver = FakeDriver(cards)
+
+    assert list(scraper.iter_jobs()) == []
+    assert scraper.driver.clicked == []
+    assert breaks(scraper) == []
+
+
+def test_card_skipped_when_detail_pane_does_not_switch(scraper, monkeypatch):
+    """面板一直停在上一个职位时不提取，不把旧详情保存到新职位ID下"""
+    scraper.driver = FakeDriver(make_cards(3, 0, 0))
+    stale = scraper.driver.cards[1].job_id
+    monkeypatch.setattr(scraper, "wait_for_detail_pane",
+                        lambda job_id, previous_title: None if job_id == stale else True)
+
+    jobs = list(scraper.iter_jobs())
+
+    assert [job['job_id'] for job in jobs] == [card.job_id for card in scraper.driver.cards if card.job_id != stale]
+    assert scraper.driver.clicked.count(stale) == 2
@@ -0,0 +1,77 @@
+"""签证担保和薪资识别的固定预期（不随 --update 重新生成）"""
+import pytest
+
+from job_analyzer import JobAnalyzer
+
+
+@pytest.fixture(scope="module")
+def analyzer():
+    return JobAnalyzer({"english_only": False, "required_skills": ["Python"]})
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("We offer visa sponsorship and relocation support.", True),
+    ("We will sponsor your visa if needed.", True),
+    ("Wir unterstützen dich beim Visum und der Blauen Karte.", True),
+    ("Unfortunately we cannot offer visa sponsorship.", False),
+    ("Visa sponsorship is not available for this role.", False),
+    ("Sponsorship: not possible.", False),
+    ("Visum-Sponsoring ist leider nicht möglich.", False),
+    ("Leider können wir kein Visum-Sponsoring anbieten.", False),
+    ("Sponsored by the EU social fund.", False),
+    ("Our sponsors include several large banks.", False),
+    ("Candidates must already hold a valid visa.", False),
+    ("You need an existing visa to apply.", False),
+    ("Applicants must have a residence visa.", False),
+    ("Build payment flows for Visa and Mastercard.", False),
+    ("Relocation is not possible for this role.", False),
+    ("Du brauchst ein gültiges Visum.", False),
+    ("EU citizens do not need a visa; for everyone else we offer visa sponsorship.", True),
+    ("We provide a relocation package and help with your work permit.", True),
+])
+def test_sponsorship(analyzer, text, expected):
+    assert analyzer.analyze_job_description(text)["sponsorship_mentioned"] is expected
+
+
+@pytest.mark.parametrize("text", [
+    "Visa sponsorship is not available for this role.",
+    "Sponsorship: not possible.",
+    "Relocation is not possible for this role.",
+    "Candidates must already hold a valid visa.",
+])
+def test_sponsorship_denied_after_keyword(text):
+    analyzer = JobAnalyzer({"english_only": False, "required_skills": ["Python"], "require_sponsorship": True})
+    assert analyzer.analyze_job_description(text)["rejection_reason"].endswith("Visa sponsorship not offered")
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("Salary range: 60.000 - 80.000 EUR.", True),
+    ("We pay 60k - 80k depending on experience.", True),
+    ("75k + bonus for the right candidate.", True),
+    ("EUR 70k", True),
+    ("70k EUR", True),
+    ("Gehalt: ab 60k €.", True),
+    ("You will work on 4k screens.", False),
+    ("Our app has 10k users.", False),
+])
+def test_salary(analyzer, text, expected):
+    assert analyzer.analyze_job_description(text)["salary_mentioned"] is expected
+
+
+def test_identical_descriptions_analyzed_once(tmp_path, monkeypatch):
+    from analysis_cache import AnalysisCache
+
+    cache = AnalysisCache(str(tmp_path / "cache.db"))
+    analyzer = JobAnalyzer({"english_only": False, "required_skills": ["Python"]}, cache=cache)
+    batches = []
+    compute = analyzer._analyze_uncached
+    monkeypatch.setattr(analyzer, "_analyze_uncached",
+                        lambda texts, english: batches.append(texts) or compute(texts, english))
+
+    texts = ["Python developer, visa sponsorship offered.", "Java developer.",
+             "Python developer, visa sponsorship offered."]
+    results = analyzer.analyze_batch(texts)
+    cache.close()
+    assert batches == [texts[:2]]
+    assert results[0] == results[2] and results[0] is not results[2]
+    assert results[0]["sponsorship_mentioned"] and not results[1]["sponsorship_mentioned"]
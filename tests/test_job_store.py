@@ -0,0 +1,41 @@
+"""职位库入库时的压缩字典训练"""
+import pytest
+
+pytest.importorskip("zstandard")
+
+import description_codec
+from config import COMPRESSION_CONFIG
+from job_store import JobStore
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    monkeypatch.setitem(COMPRESSION_CONFIG, "min_samples", 5)
+    store = JobStore(str(tmp_path / "jobs.db"))
+    yield store
+    store.close()
+
+
+def add_jobs(store, count, description=""):
+    for i in range(count):
+        assert store.add_job({'job_url': f"https://www.linkedin.com/jobs/view/{i}/",
+                              'title': "Data Engineer", 'description': description})
+
+
+def test_too_few_samples_does_not_retrain_on_every_insert(store, monkeypatch):
+    calls = []
+    train = store.codec.train
+    monkeypatch.setattr(store.codec, "train", lambda *args: calls.append(args) or train(*args))
+    add_jobs(store, 12)
+    # 描述都为空，第 5、10 个职位各尝试一次，而不是第 5 个之后每次入库都训练
+    assert len(calls) == 2
+    assert store.codec.current_dict_id == description_codec.NO_DICT
+
+
+def test_training_error_does_not_abort_insert(store, monkeypatch):
+    def fail(*args):
+        raise description_codec.zstandard.ZstdError("cannot train dict")
+    monkeypatch.setattr(description_codec.zstandard, "train_dictionary", fail)
+    add_jobs(store, 7, "Python developer in Berlin")
+    assert len(store.job_ids()) == 7
+    assert store.codec.trained_rowid == 5
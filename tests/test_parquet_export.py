@@ -0,0 +1,43 @@
+"""Parquet 导出在整列为空时保持固定的列类型"""
+import glob
+import os
+
+import pytest
+
+pytest.importorskip("pyarrow")
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+import parquet_export
+
+
+def frame(job_id, **values):
+    row = {
+        'title': "Data Engineer", 'company': "Acme", 'location': "Berlin, Germany",
+        'work_arrangement': "hybrid", 'is_english': True, 'english_score': 0.9,
+        'job_url': f"https://www.linkedin.com/jobs/view/{job_id}/",
+        'scraped_at': "2024-05-01 10:00:00", 'duplicate_of': None, 'description': "Python",
+    }
+    row.update(values)
+    return pd.DataFrame([row])
+
+
+def test_all_null_columns_keep_their_types(tmp_path):
+    root = str(tmp_path)
+    parquet_export.save_to_parquet(frame("1"), root)
+    parquet_export.save_to_parquet(
+        frame("2", work_arrangement=None, is_english=None, english_score=None, duplicate_of=None), root)
+
+    files = glob.glob(os.path.join(root, parquet_export.JOBS_DIR, "**", "*.parquet"), recursive=True)
+    assert len(files) == 2
+    for path in files:
+        schema = pq.read_schema(path)
+        assert schema.field('work_arrangement').type == pa.string()
+        assert schema.field('is_english').type == pa.bool_()
+        assert schema.field('english_score').type == pa.float64()
+        assert schema.field('duplicate_of').type == pa.string()
+
+    jobs = parquet_export.load_jobs(root, columns=['job_id', 'is_english'], with_description=True)
+    assert sorted(jobs['job_id']) == ["1", "2"]
@@ -0,0 +1,11 @@
+"""最近秩百分位数"""
+from perf import percentile
+
+
+def test_percentile_nearest_rank():
+    values = list(range(1, 11))
+    assert percentile(values, 0.5) == 5
+    assert percentile(values, 0.95) == 10
+    assert percentile(values, 0.1) == 1
+    assert percentile([3.0], 0.5) == 3.0
+    assert percentile([], 0.5) == 0.0